@@ -1,4 +1,5 @@
 from pyTigerGraph.pyTigerGraph import TigerGraphConnection
+from pyTigerGraph.pyTigerGraphAsync import AsyncTigerGraphConnection
 
 __version__ = "1.1"
 
@@ -294,9 +294,9 @@ class Featurizer:
         for t in target:
             attributes = []
             if v_type:
-                meta_data =  self.conn.getVertexType(t, force=True)
+                meta_data =  self.conn.getVertexType(t)
             else:
-                meta_data = self.conn.getEdgeType(t, force=True)
+                meta_data = self.conn.getEdgeType(t)
             for i in range(len(meta_data['Attributes'])):
                 attributes.append(meta_data['Attributes'][i]['AttributeName'])
             # If attribute is not in list of vertex attributes, do the schema change to add it
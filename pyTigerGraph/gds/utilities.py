@@ -96,6 +96,9 @@ def is_query_installed(
     # If the query already installed return true
     target = "GET /query/{}/{}".format(conn.graphname, query_name)
     queries = conn.getInstalledQueries()
+    if target not in queries and conn.metadataCache:
+        # The cached list may be outdated
+        queries = conn.getInstalledQueries(force=True)
     is_installed = target in queries
     if return_status:
         if is_installed:
@@ -162,4 +165,6 @@ def install_query_file(
         raise ConnectionError(status)
     else:
         print(status)
+    if conn.metadataCache:
+        conn._updateMetadataCache("queries", None)
     return query_name
@@ -26,14 +26,20 @@ class TigerGraphConnection(pyTigerGraphVertex, pyTigerGraphEdge, pyTigerGraphUDT
     pyTigerGraphLoading, pyTigerGraphPath, object):
     """Python wrapper for TigerGraph's REST++ and GSQL APIs"""
 
-    def __init__(self, host: str = "http://127.0.0.1", graphname: str = "MyGraph",
+    def __init__(self, host: Union[str, list] = "http://127.0.0.1", graphname: str = "MyGraph",
             gsqlSecret: str = "", username: str = "tigergraph", password: str = "tigergraph",
             tgCloud: bool = False, restppPort: Union[int, str] = "9000",
             gsPort: Union[int, str] = "14240", gsqlVersion: str = "", version: str = "",
             apiToken: str = "", useCert: bool = None, certPath: str = None, debug: bool = False,
-            sslPort: Union[int, str] = "443", gcp: bool = False):
+            sslPort: Union[int, str] = "443", gcp: bool = False, poolSize: int = 10,
+            maxConnectionsPerHost: int = 10, idleTimeout: float = 0, gzipThreshold: int = 0,
+            metadataCache: str = None, metadataCacheTTL: float = 60,
+            hostPolicy: str = "least_outstanding", healthCheckInterval: float = 10,
+            ejectTime: float = 30):
         super().__init__(host, graphname, gsqlSecret, username, password, tgCloud, restppPort,
-            gsPort, gsqlVersion, version, apiToken, useCert, certPath, debug, sslPort, gcp)
+            gsPort, gsqlVersion, version, apiToken, useCert, certPath, debug, sslPort, gcp,
+            poolSize, maxConnectionsPerHost, idleTimeout, gzipThreshold, metadataCache,
+            metadataCacheTTL, hostPolicy, healthCheckInterval, ejectTime)
 
         self.gds = None
 
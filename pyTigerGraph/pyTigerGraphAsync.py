@@ -0,0 +1,335 @@
+"""Asynchronous Connection
+
+An `AsyncTigerGraphConnection` object offers awaitable versions of the most frequently used
+REST++ functions, so that they can be called from asyncio applications without blocking the event
+loop. The awaitable functions have the name of the blocking function they correspond to with the
+`Async` suffix (e.g. `runInstalledQueryAsync()`); all functions of `TigerGraphConnection` keep
+working as usual.
+
+The requests are built and their results are processed by the same code that is used by the
+link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection`]
+functions; only the HTTP communication differs.
+
+Requires the `aiohttp` package (`pip install 'pyTigerGraph[async]'`).
+"""
+import asyncio
+from typing import TYPE_CHECKING, Awaitable, Union
+
+if TYPE_CHECKING:
+    import aiohttp
+    import pandas as pd
+
+from pyTigerGraph.pyTigerGraph import TigerGraphConnection
+from pyTigerGraph.pyTigerGraphJSON import loads
+
+
+class AsyncTigerGraphConnection(TigerGraphConnection):
+    """Asyncio variant of `TigerGraphConnection`.
+
+    The following functions are coroutines and must be awaited: `runInstalledQueryAsync()`,
+    `getVerticesAsync()`, `getVerticesByIdAsync()`, `upsertVerticesAsync()`,
+    `upsertEdgesAsync()`, `upsertDataAsync()`, `getEdgesAsync()`, `shortestPathAsync()` and
+    `aclose()`.
+
+    All other functions, including the blocking counterparts of the above, are inherited from
+    `TigerGraphConnection` unchanged. They block the event loop when called from a coroutine, so
+    call them through `loop.run_in_executor()` there.
+
+    Example:
+        [source.wrap,python]
+        ----
+        async with AsyncTigerGraphConnection(host="http://localhost", graphname="social") as conn:
+            results = await asyncio.gather(
+                *[conn.runInstalledQueryAsync("getFriends", {"p": p}) for p in people])
+        ----
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initiate a connection object.
+
+        Accepts the same arguments as `TigerGraphConnection`. `poolSize` and
+        `maxConnectionsPerHost` limit the number of requests in flight: at most
+        `maxConnectionsPerHost` concurrent requests are sent to a host and at most
+        `poolSize * maxConnectionsPerHost` in total; further requests wait for a free connection.
+        """
+        super().__init__(*args, **kwargs)
+        self._asyncSession = None
+        self._asyncSessionLoop = None
+
+    def _getAsyncSession(self) -> "aiohttp.ClientSession":
+        """Returns the pooled `aiohttp` session of the running event loop.
+
+        Returns:
+            The session the requests should be sent through.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("aiohttp is required to use this function. "
+                "Download aiohttp using 'pip install aiohttp'.")
+        loop = asyncio.get_running_loop()
+        if self._asyncSession is None or self._asyncSession.closed or \
+                self._asyncSessionLoop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.poolSize * self.maxConnectionsPerHost,
+                limit_per_host=self.maxConnectionsPerHost,
+                keepalive_timeout=self.idleTimeout or 15)
+            self._asyncSession = aiohttp.ClientSession(connector=connector)
+            self._asyncSessionLoop = loop
+        return self._asyncSession
+
+    def close(self):
+        """Closes the pooled HTTP sessions (both the blocking and the asynchronous ones).
+
+        Use `aclose()` in coroutines. If the event loop of the asynchronous session is running in
+        the current thread, the session is closed by a task scheduled on the loop; if it is not
+        running, the loop is run until the session is closed. A session whose loop is closed
+        already cannot be closed anymore, so call `aclose()` before the loop ends (e.g. by using
+        the connection as an asynchronous context manager).
+        """
+        super().close()
+        session, loop = self._detachAsyncSession()
+        if session is None or loop.is_closed():
+            return
+        if loop.is_running():
+            loop.create_task(session.close())
+        else:
+            loop.run_until_complete(session.close())
+
+    async def aclose(self):
+        """Closes the pooled HTTP sessions (both the blocking and the asynchronous ones)."""
+        super().close()
+        session, _ = self._detachAsyncSession()
+        if session is not None:
+            await session.close()
+
+    def _detachAsyncSession(self) -> tuple:
+        """Returns the open asynchronous session and its event loop, if any, and forgets them.
+
+        Returns:
+            A tuple of `(<session>, <loop>)`, or `(None, None)`.
+        """
+        session, loop = self._asyncSession, self._asyncSessionLoop
+        self._asyncSession = None
+        self._asyncSessionLoop = None
+        if session is None or session.closed:
+            return None, None
+        return session, loop
+
+    async def __aenter__(self) -> "AsyncTigerGraphConnection":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _reqAsync(self, method: str, url: str, authMode: str = "token",
+            headers: dict = None, data: Union[dict, list, str] = None, resKey: str = "results",
+            skipCheck: bool = False, params: Union[dict, list, str] = None,
+            raw: bool = False) -> Union[dict, list, bytes]:
+        """Generic asynchronous REST++ API request.
+
+        See `_req()` for the description of the arguments.
+
+        Returns:
+            The (relevant part of the) response from the request (as a dictionary).
+        """
+        _headers, _data, verify = self._prepReq(method, authMode, headers, data)
+        if isinstance(params, dict):
+            # aiohttp only accepts str, int and float parameter values
+            params = {k: (v if isinstance(v, (str, int)) and not isinstance(v, bool) else str(v))
+                for k, v in params.items()}
+
+        kwargs = {} if verify else {"ssl": False}
+        url, node = self._routeReq(url, params)
+
+        ok = False
+        res = None
+        try:
+            async with self._getAsyncSession().request(method, url, headers=dict(_headers),
+                    data=_data, params=params, **kwargs) as r:
+                ok = r.status < 500
+                if r.status != 200:
+                    r.raise_for_status()
+                body = await r.read()
+            if raw:
+                return self._checkRawRes(body, skipCheck)
+            res = loads(body)
+        except asyncio.CancelledError:
+            # Not a failure of the host
+            ok = True
+            raise
+        finally:
+            self._releaseReq(node, ok, res)
+        return self._parseRes(res, resKey, skipCheck)
+
+    async def _getAsync(self, url: str, authMode: str = "token", headers: dict = None,
+            resKey: str = "results", skipCheck: bool = False,
+            params: Union[dict, list, str] = None, raw: bool = False) -> Union[dict, list, bytes]:
+        """Generic asynchronous GET method.
+
+        See `_get()` for the description of the arguments.
+        """
+        return await self._reqAsync("GET", url, authMode, headers, None, resKey, skipCheck, params,
+            raw)
+
+    async def _postAsync(self, url: str, authMode: str = "token", headers: dict = None,
+            data: Union[dict, list, str, bytes] = None, resKey: str = "results",
+            skipCheck: bool = False, params: Union[dict, list, str] = None,
+            raw: bool = False) -> Union[dict, list, bytes]:
+        """Generic asynchronous POST method.
+
+        See `_post()` for the description of the arguments.
+        """
+        return await self._reqAsync("POST", url, authMode, headers, data, resKey, skipCheck,
+            params, raw)
+
+    async def _deleteAsync(self, url: str, authMode: str = "token") -> Union[dict, list]:
+        """Generic asynchronous DELETE method.
+
+        See `_delete()` for the description of the arguments.
+        """
+        return await self._reqAsync("DELETE", url, authMode)
+
+    async def runInstalledQueryAsync(self, queryName: str, params: Union[str, dict] = None,
+            timeout: int = None, sizeLimit: int = None, usePost: bool = False,
+            fmt: str = "py") -> Union[list, bytes]:
+        """Runs an installed query.
+
+        See `TigerGraphConnection.runInstalledQuery()`.
+        """
+        url, params, headers = self._prepRunInstalledQuery(queryName, params, timeout, sizeLimit)
+
+        if usePost:
+            return await self._postAsync(url, data=params, headers=headers, raw=fmt == "raw")
+        else:
+            return await self._getAsync(url, params=params, headers=headers, raw=fmt == "raw")
+
+    async def getVerticesAsync(self, vertexType: str, select: str = "", where: str = "",
+            limit: Union[int, str] = None, sort: str = "", fmt: str = "py", withId: bool = True,
+            withType: bool = False, timeout: int = 0) -> Union[dict, str, 'pd.DataFrame']:
+        """Retrieves vertices of the given vertex type.
+
+        See `TigerGraphConnection.getVertices()`.
+        """
+        url = self._prepGetVertices(vertexType, select, where, limit, sort, timeout)
+        if fmt == "raw":
+            return await self._getAsync(url, raw=True)
+        ret = await self._getAsync(url)
+
+        return self._formatVertexSet(ret, fmt, withId, withType)
+
+    async def getVerticesByIdAsync(self, vertexType: str, vertexIds: Union[int, str, list],
+            select: str = "", fmt: str = "py", withId: bool = True, withType: bool = False,
+            timeout: int = 0, batchSize: int = 0,
+            concurrency: int = 0) -> Union[list, str, 'pd.DataFrame']:
+        """Retrieves vertices of the given vertex type, identified by their ID.
+
+        The requests (one per vertex or one per batch of vertices) are sent concurrently, at most
+        `concurrency` at a time if it is positive. With `batchSize`, the helper query is installed
+        (on first use, from a worker thread, not blocking the event loop) by a GSQL request.
+        See `TigerGraphConnection.getVerticesById()`.
+        """
+        semaphore = asyncio.Semaphore(concurrency) if concurrency > 0 else None
+
+        async def limited(coro: Awaitable) -> object:
+            if semaphore is None:
+                return await coro
+            async with semaphore:
+                return await coro
+
+        if batchSize > 0:
+            vids = self._prepVertexIds(vertexIds)
+            if vids is None:
+                return None
+            queryName = await asyncio.get_running_loop().run_in_executor(None,
+                self._installHelperQuery, *self._prepGetVerticesByIdQuery(vertexType, select))
+            res = await asyncio.gather(*[
+                limited(self.runInstalledQueryAsync(queryName, params,
+                    timeout=timeout * 1000, usePost=True))
+                for _, params in self._prepVertexIdBatches(vertexType, vids, batchSize,
+                    bool(select))])
+            ret = self._orderVertexSet(vids, [r[0]["result"] for r in res])
+        else:
+            urls = self._prepGetVerticesById(vertexType, vertexIds)
+            if urls is None:
+                return None
+
+            ret = []
+            for res in await asyncio.gather(*[limited(self._getAsync(url)) for url in urls]):
+                ret += res
+
+        return self._formatVertexSet(ret, fmt, withId, withType)
+
+    async def upsertVerticesAsync(self, vertexType: str, vertices: list, atomic: bool = False,
+            ackAll: bool = False) -> int:
+        """Upserts multiple vertices (of the same type).
+
+        See `TigerGraphConnection.upsertVertices()`. Only lists are accepted and batching is not
+        supported; split the input and gather the calls instead.
+
+        Raises:
+            `TypeError` if `vertices` is not a list.
+        """
+        if not isinstance(vertices, list):
+            raise TypeError("vertices must be a list, not {}.".format(type(vertices).__name__))
+        data = self._prepUpsertVertices(vertexType, vertices)
+        data, headers, params = self._prepUpsertData(data, atomic, ackAll)
+        return (await self._postAsync(self.restppUrl + "/graph/" + self.graphname,
+            headers=headers, data=data, params=params))[0]["accepted_vertices"]
+
+    async def upsertEdgesAsync(self, sourceVertexType: str, edgeType: str,
+            targetVertexType: str, edges: list, atomic: bool = False, ackAll: bool = False) -> int:
+        """Upserts multiple edges (of the same type).
+
+        See `TigerGraphConnection.upsertEdges()`. Only lists are accepted and batching is not
+        supported; split the input and gather the calls instead.
+
+        Raises:
+            `TypeError` if `edges` is not a list.
+        """
+        if not isinstance(edges, list):
+            raise TypeError("edges must be a list, not {}.".format(type(edges).__name__))
+        data = self._prepUpsertEdges(sourceVertexType, edgeType, targetVertexType, edges)
+        data, headers, params = self._prepUpsertData(data, atomic, ackAll)
+        return (await self._postAsync(self.restppUrl + "/graph/" + self.graphname,
+            headers=headers, data=data, params=params))[0]["accepted_edges"]
+
+    async def upsertDataAsync(self, data: Union[str, object], atomic: bool = False,
+            ackAll: bool = False, newVertexOnly: bool = False, vertexMustExist: bool = False,
+            updateVertexOnly: bool = False) -> dict:
+        """Upserts data (vertices and edges) from a JSON document or equivalent object structure.
+
+        See `TigerGraphConnection.upsertData()`.
+        """
+        data, headers, params = self._prepUpsertData(data, atomic, ackAll, newVertexOnly,
+            vertexMustExist, updateVertexOnly)
+        return (await self._postAsync(self.restppUrl + "/graph/" + self.graphname,
+            headers=headers, data=data, params=params))[0]
+
+    async def getEdgesAsync(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
+            targetVertexType: str = "", targetVertexId: str = "", select: str = "", where: str = "",
+            limit: Union[int, str] = None, sort: str = "", fmt: str = "py", withId: bool = True,
+            withType: bool = False, timeout: int = 0) -> Union[dict, str, 'pd.DataFrame']:
+        """Retrieves edges of the given edge type originating from a specific source vertex.
+
+        See `TigerGraphConnection.getEdges()`.
+        """
+        url = self._prepGetEdges(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
+            targetVertexId, select, where, limit, sort, timeout)
+        if fmt == "raw":
+            return await self._getAsync(url, raw=True)
+        ret = await self._getAsync(url)
+
+        return self._formatEdgeSet(ret, fmt, withId, withType)
+
+    async def shortestPathAsync(self, sourceVertices: Union[dict, tuple, list],
+            targetVertices: Union[dict, tuple, list], maxLength: int = None,
+            vertexFilters: Union[list, dict] = None, edgeFilters: Union[list, dict] = None,
+            allShortestPaths: bool = False) -> dict:
+        """Finds the shortest path (or all shortest paths) between the source and target vertex sets.
+
+        See `TigerGraphConnection.shortestPath()`.
+        """
+        data = self._preparePathParams(sourceVertices, targetVertices, maxLength, vertexFilters,
+            edgeFilters, allShortestPaths)
+        return await self._postAsync(self.restppUrl + "/shortestpath/" + self.graphname,
+            data=data)
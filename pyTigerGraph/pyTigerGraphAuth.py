@@ -3,17 +3,17 @@
 The functions on this page authenticate connections and manage TigerGraph credentials.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object]. 
 """
-import json
 import time
 from datetime import datetime
 
-import requests
 from typing import TYPE_CHECKING, Union
 
 from typing import Union
 
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from pyTigerGraph.pyTigerGraphGSQL import pyTigerGraphGSQL
+from pyTigerGraph.pyTigerGraphJSON import dumpb, loads
+from pyTigerGraph.pyTigerGraphToken import TokenManager, _getTokenManager
 
 
 class pyTigerGraphAuth(pyTigerGraphGSQL):
@@ -167,21 +167,31 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
             - `POST /requesttoken`
                 See https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints#_request_a_token
         """
+        token = self._requestToken(secret, lifetime)
+        self._setToken(token[0] if setToken else None)
+        return token
+
+    def _requestToken(self, secret: str, lifetime: int = None) -> tuple:
+        """Requests an authorization token without setting it on the connection.
+
+        See `getToken()` for the description of the arguments and of the return value.
+        """
         s, m, i = (0, 0, 0)
         res = {}
+        session = self._getSession(self.restppUrl)
         if self.version:
             s, m, i = self.version.split(".")
         success = False
         if int(s) < 3 or (int(s) == 3 and int(m) < 5):
             try:
                 if self.useCert and self.certPath:
-                    res = json.loads(requests.request("GET", self.restppUrl +
+                    res = loads(session.request("GET", self.restppUrl +
                         "/requesttoken?secret=" + secret +
-                        ("&lifetime=" + str(lifetime) if lifetime else "")).text)
+                        ("&lifetime=" + str(lifetime) if lifetime else "")).content)
                 else:
-                    res = json.loads(requests.request("GET", self.restppUrl +
+                    res = loads(session.request("GET", self.restppUrl +
                         "/requesttoken?secret=" + secret +
-                        ("&lifetime=" + str(lifetime) if lifetime else ""), verify=False).text)
+                        ("&lifetime=" + str(lifetime) if lifetime else ""), verify=False).content)
                 if not res["error"]:
                     success = True
             except:
@@ -193,21 +203,14 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
                 if lifetime:
                     data["lifetime"] = str(lifetime)
                 if self.useCert is True and self.certPath is not None:
-                    res = json.loads(requests.post(self.restppUrl + "/requesttoken",
-                        data=json.dumps(data)).text)
+                    res = loads(session.post(self.restppUrl + "/requesttoken",
+                        data=dumpb(data)).content)
                 else:
-                    res = json.loads(requests.post(self.restppUrl + "/requesttoken",
-                        data=json.dumps(data), verify=False).text)
+                    res = loads(session.post(self.restppUrl + "/requesttoken",
+                        data=dumpb(data), verify=False).content)
             except:
                 success = False
         if not res["error"]:
-            if setToken:
-                self.apiToken = res["token"]
-                self.authHeader = {'Authorization': "Bearer " + self.apiToken}
-            else:
-                self.apiToken = None
-                self.authHeader = {'Authorization': 'Basic {0}'.format(self.base64_credential)}
-
             return res["token"], res["expiration"], \
                 datetime.utcfromtimestamp(float(res["expiration"])).strftime('%Y-%m-%d %H:%M:%S')
         if "Endpoint is not found from url = /requesttoken" in res["message"]:
@@ -256,6 +259,7 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
         """
         s, m, i = (0, 0, 0)
         res = {}
+        session = self._getSession(self.restppUrl)
         if self.version:
             s, m, i = self.version.split(".")
         success = False
@@ -265,13 +269,13 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
 
         if int(s) < 3 or (int(s) == 3 and int(m) < 5):
             if self.useCert and self.certPath:
-                res = json.loads(requests.request("PUT", self.restppUrl + "/requesttoken?secret=" +
+                res = loads(session.request("PUT", self.restppUrl + "/requesttoken?secret=" +
                     secret + "&token=" + token + ("&lifetime=" + str(lifetime) if lifetime else ""),
-                    verify=False).text)
+                    verify=False).content)
             else:
-                res = json.loads(requests.request("PUT", self.restppUrl + "/requesttoken?secret=" +
+                res = loads(session.request("PUT", self.restppUrl + "/requesttoken?secret=" +
                     secret + "&token=" + token + ("&lifetime=" + str(lifetime) if lifetime else "")
-                    ).text)
+                    ).content)
             if not res["error"]:
                 success = True
             if "Endpoint is not found from url = /requesttoken" in res["message"]:
@@ -283,11 +287,11 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
             if lifetime:
                 data["lifetime"] = str(lifetime)
             if self.useCert is True and self.certPath is not None:
-                res = json.loads(requests.post(self.restppUrl + "/requesttoken",
-                    data=json.dumps(data)).text)
+                res = loads(session.post(self.restppUrl + "/requesttoken",
+                    data=dumpb(data)).content)
             else:
-                res = json.loads(requests.post(self.restppUrl + "/requesttoken",
-                    data=json.dumps(data), verify=False).text)
+                res = loads(session.post(self.restppUrl + "/requesttoken",
+                    data=dumpb(data), verify=False).content)
             if not res["error"]:
                 success = True
             if "Endpoint is not found from url = /requesttoken" in res["message"]:
@@ -332,6 +336,7 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
         """
         s, m, i = (0, 0, 0)
         res = {}
+        session = self._getSession(self.restppUrl)
         if self.version:
             s, m, i = self.version.split(".")
         success = False
@@ -341,25 +346,26 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
 
         if int(s) < 3 or (int(s) == 3 and int(m) < 5):
             if self.useCert is True and self.certPath is not None:
-                res = json.loads(
-                    requests.request("DELETE",
+                res = loads(
+                    session.request("DELETE",
                         self.restppUrl + "/requesttoken?secret=" + secret + "&token=" + token,
-                        verify=False).text)
+                        verify=False).content)
             else:
-                res = json.loads(
-                    requests.request("DELETE",
-                        self.restppUrl + "/requesttoken?secret=" + secret + "&token=" + token).text)
+                res = loads(
+                    session.request("DELETE",
+                        self.restppUrl + "/requesttoken?secret=" + secret + "&token=" + token
+                    ).content)
             if not res["error"]:
                 success = True
                 
         if not success:
             data = {"secret": secret, "token": token}
             if self.useCert is True and self.certPath is not None:
-                res = json.loads(requests.delete(self.restppUrl + "/requesttoken",
-                    data=json.dumps(data)).text)
+                res = loads(session.delete(self.restppUrl + "/requesttoken",
+                    data=dumpb(data)).content)
             else:
-                res = json.loads(requests.delete(self.restppUrl + "/requesttoken",
-                    data=json.dumps(data), verify=False).text)
+                res = loads(session.delete(self.restppUrl + "/requesttoken",
+                    data=dumpb(data), verify=False).content)
 
         
         if "Endpoint is not found from url = /requesttoken" in res["message"]:
@@ -370,4 +376,41 @@ class pyTigerGraphAuth(pyTigerGraphGSQL):
         if res["code"] == "REST-3300" and skipNA:
             return True
 
-        raise TigerGraphException(res["message"], (res["code"] if "code" in res else None))
\ No newline at end of file
+        raise TigerGraphException(res["message"], (res["code"] if "code" in res else None))
+
+    def autoRefreshToken(self, secret: str, lifetime: int = None, refreshBefore: float = None,
+            tokenCache: str = None) -> TokenManager:
+        """Requests an authorization token and keeps it valid by requesting a new one, in the
+            background, before it expires.
+
+        Connections of the process to the same graph that use the same secret share the token
+        (and the first call's `lifetime`, `refreshBefore` and `tokenCache` settings), so the token
+        is requested once, not by each connection.
+
+        Args:
+            secret:
+                The secret (string) generated in GSQL using `CREATE SECRET`.
+                See https://docs.tigergraph.com/tigergraph-server/current/user-access/managing-credentials#_create_a_secret
+            lifetime:
+                Duration of token validity (in seconds, default 30 days = 2,592,000 seconds).
+            refreshBefore:
+                The number of seconds before the expiration of the token a new token is requested.
+                Defaults to 10% of the lifetime of the token. A token is used for at least half of
+                its lifetime (and at least 10 seconds) before it is refreshed.
+            tokenCache:
+                The directory where the token is stored to share it with other processes (e.g. the
+                workers of a pool). The file is readable by the current user only. If `None`, the
+                token is shared within the process only.
+
+        Returns:
+            The `TokenManager` object refreshing the token.
+
+        Raises:
+            `TigerGraphException` if REST++ authentication is not enabled or if an authentication
+            error occurred.
+
+        Endpoint:
+            - `POST /requesttoken`
+                See https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints#_request_a_token
+        """
+        return _getTokenManager(self, secret, lifetime, refreshBefore, tokenCache)
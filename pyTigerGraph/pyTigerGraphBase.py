@@ -2,18 +2,41 @@
 
 A TigerGraphConnection object provides the HTTP(S) communication used by all other modules.
 
-
+A connection can be shared by multiple threads. Each request builds its own headers and payload;
+the authentication header is replaced (never modified) when the token changes, so requests read
+it without locking and a request in flight is not affected by a concurrent token change. The
+HTTP sessions are pooled per endpoint family (see `poolSize` and `maxConnectionsPerHost`), so
+concurrent requests are not serialized. Changing the settings of a connection (e.g. `graphname`)
+while other threads use it is not supported; create a connection per setting instead.
 """
 import base64
-import json
+import gzip
+import re
 import sys
+import threading
+import time
 import warnings
-from typing import Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Union
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraph.pyTigerGraphHostPool import HostPool
+from pyTigerGraph.pyTigerGraphJSON import loads
+
+GZIP_LEVEL = 1
+"""The gzip compression level of request payloads (favouring speed over ratio)."""
+RAW_ERROR_PATTERN = re.compile(rb'"error"\s*:\s*(true|"true")')
+"""Finds the error flag set in an undecoded response."""
+RAW_ERROR_SCAN_LENGTH = 4096
+"""The number of bytes scanned for the error flag at the beginning of an undecoded response."""
+STICKY_ENDPOINTS = ("/query_status", "/query_result", "/abortquery")
+"""The REST++ endpoints referring to an asynchronous query, sent to the node running the query."""
+REQUEST_ID_PATTERN = re.compile(r"[?&]requestid=([^&]+)")
+"""Finds the asynchronous query ID in the parameters of a URL."""
 
 
 def excepthook(type, value, traceback):
@@ -26,12 +49,16 @@ def excepthook(type, value, traceback):
 
 
 class pyTigerGraphBase(object):
-    def __init__(self, host: str = "http://127.0.0.1", graphname: str = "MyGraph",
+    def __init__(self, host: Union[str, list] = "http://127.0.0.1", graphname: str = "MyGraph",
             gsqlSecret: str = "", username: str = "tigergraph", password: str = "tigergraph",
             tgCloud: bool = False, restppPort: Union[int, str] = "9000",
             gsPort: Union[int, str] = "14240", gsqlVersion: str = "", version: str = "",
             apiToken: str = "", useCert: bool = None, certPath: str = None, debug: bool = False,
-            sslPort: Union[int, str] = "443", gcp: bool = False):
+            sslPort: Union[int, str] = "443", gcp: bool = False, poolSize: int = 10,
+            maxConnectionsPerHost: int = 10, idleTimeout: float = 0, gzipThreshold: int = 0,
+            metadataCache: str = None, metadataCacheTTL: float = 60,
+            hostPolicy: str = "least_outstanding", healthCheckInterval: float = 10,
+            ejectTime: float = 30):
         """Initiate a connection object.
 
         Args:
@@ -39,6 +66,9 @@ class pyTigerGraphBase(object):
                 The host name or IP address of the TigerGraph server. Make sure to include the
                 protocol (http:// or https://). If `certPath` is `None` and the protocol is https,
                 a self-signed certificate will be used.
+                For a cluster, a list of the nodes (using the same protocol) can be specified; the
+                REST++ requests are spread across the nodes (see `hostPolicy`), all other requests
+                are sent to the first node.
             graphname:
                 The default graph for running queries.
             gsqlSecret:
@@ -73,17 +103,61 @@ class pyTigerGraphBase(object):
                 Port for fetching SSL certificate in case of firewall.
             gcp:
                 DEPRECATED: Is firewall used?
+            poolSize:
+                The number of per-host connection pools kept by each of the HTTP sessions used for
+                REST++ and GSQL server requests.
+            maxConnectionsPerHost:
+                The maximum number of keep-alive connections kept open to a single host.
+            idleTimeout:
+                Number of seconds after which an unused HTTP session (and its pooled connections)
+                is discarded and recreated on next use. `0` (default) keeps sessions open until the
+                connection object is closed.
+            gzipThreshold:
+                If greater than `0`, the payloads of upsert requests and loading jobs larger than
+                this many bytes are sent gzip-compressed (`Content-Encoding: gzip`). `0` (default)
+                disables compression. (Compressed responses are always accepted and decompressed
+                transparently.)
+            metadataCache:
+                The path of a directory where the schema and the list of installed queries of the
+                graph are cached between processes. When set, a new connection validates the
+                cached metadata with a single request (checking the component versions of the
+                server) instead of retrieving it again. `None` (default) disables the cache.
+            metadataCacheTTL:
+                The number of seconds after which the cached metadata is retrieved again. Schema
+                changes and newly installed queries cannot be detected without retrieving the
+                metadata, so the cached copy can be stale for up to this long; call `getSchema()`
+                or `getInstalledQueries()` with `force=True` after changing the schema or the
+                queries. Default is `60`.
+            hostPolicy:
+                How the node of a REST++ request is selected if multiple hosts are specified:
+                `"least_outstanding"` (default; the node with the fewest requests in progress) or
+                `"round_robin"`. Nodes failing repeatedly are skipped for `ejectTime` seconds; the
+                requests referring to an asynchronous query (e.g. `/query_status`) are sent to the
+                node that runs the query.
+            healthCheckInterval:
+                The number of seconds between the health checks (`GET /echo`) of the nodes, if
+                multiple hosts are specified. Nodes not answering in time are skipped for
+                `ejectTime` seconds. `0` disables the health checks.
+            ejectTime:
+                The number of seconds a failing node is skipped for.
 
         Raises:
             TigerGraphException: In case on invalid URL scheme.
 
         """
-        inputHost = urlparse(host)
-        if inputHost.scheme not in ["http", "https"]:
-            raise TigerGraphException("Invalid URL scheme. Supported schemes are http and https.",
-                "E-0003")
+        inputHosts = [urlparse(h) for h in ([host] if isinstance(host, str) else host)]
+        if not inputHosts:
+            raise TigerGraphException("No host specified.", None)
+        for inputHost in inputHosts:
+            if inputHost.scheme not in ["http", "https"]:
+                raise TigerGraphException(
+                    "Invalid URL scheme. Supported schemes are http and https.", "E-0003")
+            if inputHost.scheme != inputHosts[0].scheme:
+                raise TigerGraphException("All hosts must use the same URL scheme.", "E-0003")
+        inputHost = inputHosts[0]
         self.netloc = inputHost.netloc
         self.host = "{0}://{1}".format(inputHost.scheme, self.netloc)
+        self.hosts = ["{0}://{1}".format(h.scheme, h.netloc) for h in inputHosts]
         if gsqlSecret != "":
             self.username = "__GSQL__secret"
             self.password = gsqlSecret
@@ -97,7 +171,6 @@ class pyTigerGraphBase(object):
             warnings.warn(
                 "The `apiToken` parameter is deprecated; use `getToken()` function instead.",
                 DeprecationWarning)
-        self.apiToken = apiToken
 
         # TODO Eliminate version and use gsqlVersion only, meaning TigerGraph server version
         if gsqlVersion:
@@ -111,16 +184,15 @@ class pyTigerGraphBase(object):
             self.version = ""
         self.base64_credential = base64.b64encode(
             "{0}:{1}".format(self.username, self.password).encode("utf-8")).decode("utf-8")
-        if self.apiToken:
-            self.authHeader = {"Authorization": "Bearer " + self.apiToken}
-        else:
-            self.authHeader = {"Authorization": "Basic {0}".format(self.base64_credential)}
+        self._setToken(apiToken)
 
         self.debug = debug
         if not self.debug:
             sys.excepthook = excepthook
             sys.tracebacklimit = None
         self.schema = None
+        self._schemaIndex = None
+        self._helperQueries = set()
 
         # TODO Remove useCert parameter
         if useCert is not None:
@@ -141,6 +213,20 @@ class pyTigerGraphBase(object):
 
         self.Client = None
 
+        self.poolSize = poolSize
+        self.maxConnectionsPerHost = maxConnectionsPerHost
+        self.idleTimeout = idleTimeout
+        self.gzipThreshold = gzipThreshold
+        self.metadataCache = metadataCache
+        self.metadataCacheTTL = metadataCacheTTL
+        self._metadataCacheEntry = None
+        self._sessions = {}
+        self._sessionsLastUsed = {}
+        self._sessionsLock = threading.Lock()
+        self._hostPool = None
+        self.restppUrl = ""
+        self.gsUrl = ""
+
         # TODO Remove gcp parameter
         if gcp:
             warnings.warn("The `gcp` parameter is deprecated.", DeprecationWarning)
@@ -173,6 +259,229 @@ class pyTigerGraphBase(object):
             self.gsUrl = self.host + ":" + self.gsPort
         self.url = ""
 
+        if len(self.hosts) > 1:
+            # The REST++ URL of each node only differs in the host
+            self._hostPool = HostPool(self,
+                [h + self.restppUrl[len(self.host):] for h in self.hosts], hostPolicy,
+                healthCheckInterval, ejectTime)
+        else:
+            self._hostPool = None
+
+    def _setToken(self, token: Union[str, tuple, None]):
+        """Sets the token used to authenticate REST++ requests.
+
+        The token and the authentication header are replaced (not modified), so requests running
+        concurrently in other threads use either the previous or the new token, consistently.
+
+        Args:
+            token:
+                The token (or the tuple returned by `getToken()`). If empty, requests are
+                authenticated with the username and password.
+        """
+        if isinstance(token, tuple):
+            token = token[0]
+        if token:
+            self.authHeader = {"Authorization": "Bearer " + token}
+        else:
+            self.authHeader = {"Authorization": "Basic {0}".format(self.base64_credential)}
+        self._apiToken = token
+
+    @property
+    def apiToken(self) -> Union[str, None]:
+        """The token used to authenticate REST++ requests."""
+        return self._apiToken
+
+    @apiToken.setter
+    def apiToken(self, token: Union[str, tuple, None]):
+        self._setToken(token)
+
+    def _getSession(self, url: str) -> requests.Session:
+        """Returns the pooled HTTP session serving the endpoint family of the URL.
+
+        REST++ and GSQL server requests go through separate sessions, each keeping its own pool of
+        keep-alive connections, so the TCP (and TLS) handshake is paid once per connection instead
+        of once per request.
+
+        Args:
+            url:
+                Complete URL of the request.
+
+        Returns:
+            The session the request should be sent through.
+        """
+        if self.restppUrl and url.startswith(self.restppUrl):
+            family = "restpp"
+        else:
+            family = "gs"
+        with self._sessionsLock:
+            now = time.monotonic()
+            session = self._sessions.get(family)
+            if session is not None and self.idleTimeout and \
+                    now - self._sessionsLastUsed[family] > self.idleTimeout:
+                # The server has most likely closed the idle keep-alive connections already
+                session.close()
+                session = None
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.poolSize,
+                    pool_maxsize=self.maxConnectionsPerHost)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[family] = session
+            self._sessionsLastUsed[family] = now
+        return session
+
+    def close(self):
+        """Closes the pooled HTTP sessions and all their keep-alive connections.
+
+        The connection object remains usable; new sessions are opened on the next request.
+        The health checks of the hosts (if multiple hosts are specified) are stopped, too, and
+        restarted by the next request.
+        """
+        with self._sessionsLock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+            self._sessionsLastUsed = {}
+        if self._hostPool is not None:
+            self._hostPool.close()
+
+    def getHostStats(self) -> list:
+        """Returns the status of the hosts the REST++ requests are spread across.
+
+        Returns:
+            A list of dictionaries, one per host, with the following keys:
+            - `url`: The REST++ base URL of the host.
+            - `outstanding`: The number of requests in progress.
+            - `requests`: The number of requests sent to the host.
+            - `ejected`: `True` if the host is currently skipped because it failed.
+            The list is empty if a single host is specified.
+        """
+        if self._hostPool is None:
+            return []
+        return self._hostPool.getStats()
+
+    def _routeReq(self, url: str, params: Union[dict, list, str] = None) -> tuple:
+        """Selects the host a REST++ request is sent to, if multiple hosts are specified.
+
+        Args:
+            url:
+                Complete REST++ API URL including path and parameters.
+            params:
+                Request URL parameters.
+
+        Returns:
+            A tuple of `(<url>, <node>)`: the URL of the request on the selected host and the
+            node to be passed to `_releaseReq()`, or the original URL and `None` if the request
+            is not routed.
+        """
+        if self._hostPool is None or not url.startswith(self.restppUrl):
+            return url, None
+        path = url[len(self.restppUrl):]
+        requestId = None
+        if path.startswith(STICKY_ENDPOINTS):
+            if isinstance(params, (dict, list)):
+                requestId = dict(params).get("requestid")
+            else:
+                m = REQUEST_ID_PATTERN.search(path) or \
+                    (params and REQUEST_ID_PATTERN.search("?" + params))
+                requestId = m.group(1) if m else None
+        node = self._hostPool.acquire(requestId)
+        return node["url"] + path, node
+
+    def _releaseReq(self, node: Union[dict, None], ok: bool = True, res: object = None):
+        """Counts a request routed by `_routeReq()` as completed.
+
+        Args:
+            node:
+                The node returned by `_routeReq()`.
+            ok:
+                `False` if the request failed because of the host (connection or server error).
+            res:
+                The decoded response; if it starts an asynchronous query, the requests referring
+                to the query are sent to the same host.
+        """
+        if node is not None:
+            self._hostPool.release(node, ok,
+                res.get("request_id") if isinstance(res, dict) else None)
+
+    def _checkHost(self, url: str, timeout: float) -> bool:
+        """Checks whether a host answers REST++ requests (used by the health checks).
+
+        Args:
+            url:
+                The REST++ base URL of the host.
+            timeout:
+                The number of seconds to wait for the answer.
+
+        Returns:
+            `True` if the host answered in time.
+        """
+        headers, _, verify = self._prepReq("GET")
+        try:
+            res = self._getSession(self.restppUrl).request("GET", url + "/echo",
+                headers=headers, verify=verify, timeout=timeout)
+            return res.status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+
+    def _mapConcurrently(self, func: Callable, items: Iterable, concurrency: int = 1) -> list:
+        """Calls a function for each item, running up to `concurrency` calls at the same time.
+
+        Args:
+            func:
+                The function to be called with each item.
+            items:
+                The items to be processed.
+            concurrency:
+                The maximum number of calls in progress at the same time. Values above
+                `maxConnectionsPerHost` open connections that are not kept in the pool.
+
+        Returns:
+            The return values of the calls, in the order of `items`.
+        """
+        items = list(items)
+        if concurrency <= 1 or len(items) <= 1:
+            return [func(i) for i in items]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _imapConcurrently(self, func: Callable, items: Iterable,
+            concurrency: int = 1) -> Iterator:
+        """Calls a function for each item, consuming the items lazily.
+
+        Unlike `_mapConcurrently()`, the next item is only taken from `items` when one of the
+        calls in progress completes, so at most `concurrency` items are held in memory at any
+        time (which makes it suitable for generators of arbitrary length).
+
+        Args:
+            func:
+                The function to be called with each item.
+            items:
+                The items to be processed.
+            concurrency:
+                The maximum number of calls in progress at the same time.
+
+        Returns:
+            An iterator of the return values of the calls, in the order of their completion.
+        """
+        if concurrency <= 1:
+            for i in items:
+                yield func(i)
+            return
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = set()
+            for i in items:
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        yield f.result()
+                pending.add(executor.submit(func, i))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    yield f.result()
+
     def _errorCheck(self, res: dict):
         """Checks if the JSON document returned by an endpoint has contains `error: true`. If so,
             it raises an exception.
@@ -190,7 +499,7 @@ class pyTigerGraphBase(object):
 
     def _req(self, method: str, url: str, authMode: str = "token", headers: dict = None,
             data: Union[dict, list, str] = None, resKey: str = "results", skipCheck: bool = False,
-            params: Union[dict, list, str] = None) -> Union[dict, list]:
+            params: Union[dict, list, str] = None, raw: bool = False) -> Union[dict, list, bytes]:
         """Generic REST++ API request.
 
         Args:
@@ -211,24 +520,160 @@ class pyTigerGraphBase(object):
                 action is not applicable. This argument skips error checking.
             params:
                 Request URL parameters.
+            raw:
+                If `True`, the response is not decoded; the body is returned as received.
 
         Returns:
-            The (relevant part of the) response from the request (as a dictionary).
+            The (relevant part of the) response from the request (as a dictionary), or the
+            complete response body (as bytes) if `raw` is `True`.
         """
-        if authMode == "token" and str(self.apiToken) != "":
-            if isinstance(self.apiToken, tuple):
-                self.apiToken = self.apiToken[0]
-            self.authHeader = {'Authorization': "Bearer " + self.apiToken}
-            _headers = self.authHeader
-        else:
-            self.authHeader = {'Authorization': 'Basic {0}'.format(self.base64_credential)}
-            _headers = self.authHeader
-            authMode = 'pwd'
+        _headers, _data, verify = self._prepReq(method, authMode, headers, data)
+        session = self._getSession(url)
+        url, node = self._routeReq(url, params)
+
+        ok = False
+        body = None
+        try:
+            res = session.request(method, url, headers=_headers, data=_data, params=params,
+                verify=verify)
+            ok = res.status_code < 500
+            if res.status_code != 200:
+                res.raise_for_status()
+            if raw:
+                return self._checkRawRes(res.content, skipCheck)
+            body = loads(res.content)
+        finally:
+            self._releaseReq(node, ok, body)
+        return self._parseRes(body, resKey, skipCheck)
+
+    def _reqStream(self, method: str, url: str, prefix: str = "results.item",
+            authMode: str = "token", headers: dict = None, data: Union[dict, list, str] = None,
+            skipCheck: bool = False, params: Union[dict, list, str] = None) -> Iterator:
+        """Generic REST++ API request parsing the response incrementally.
+
+        The request is sent immediately, but the response is read and decoded only as the
+        returned iterator is consumed, so the memory used does not depend on the size of the
+        response. Requires the `ijson` package.
+
+        Args:
+            method:
+                HTTP method, currently one of `GET`, `POST` or `DELETE`.
+            url:
+                Complete REST++ API URL including path and parameters.
+            prefix:
+                The path of the elements to be returned, in `ijson` prefix notation (the keys of
+                the enclosing objects separated by dots, `item` standing for the elements of an
+                array). E.g. `"results.item"` for the elements of the `results` array.
+            authMode:
+                Authentication mode, either `"token"` (default) or `"pwd"`.
+            headers:
+                Standard HTTP request headers.
+            data:
+                Request payload, typically a JSON document.
+            skipCheck:
+                Some endpoints return an error to indicate that the requested
+                action is not applicable. This argument skips error checking.
+            params:
+                Request URL parameters.
+
+        Returns:
+            An iterator of the elements found at `prefix`.
+
+        Raises:
+            TigerGraphException: if request returned with error, indicated in the returned JSON.
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError("ijson is required to use this function. "
+                "Download ijson using 'pip install ijson'.")
+        _headers, _data, verify = self._prepReq(method, authMode, headers, data)
+        session = self._getSession(url)
+        url, node = self._routeReq(url, params)
+
+        # The request counts as completed once the response headers arrived
+        try:
+            res = session.request(method, url, headers=_headers, data=_data, params=params,
+                verify=verify, stream=True)
+        except requests.exceptions.RequestException:
+            self._releaseReq(node, False)
+            raise
+        self._releaseReq(node, res.status_code < 500)
+
+        if res.status_code != 200:
+            res.close()
+            res.raise_for_status()
+        res.raw.decode_content = True
+
+        def checkedEvents(events: Iterator) -> Iterator:
+            # The top level error flag, message and code precede the results in the document
+            status = {}
+            checked = skipCheck
+            for event in events:
+                if not checked:
+                    if event[0] in ("error", "message", "code"):
+                        status[event[0]] = event[2]
+                    elif event[0] == "results":
+                        self._errorCheck(status)
+                        checked = True
+                yield event
+            if not checked:
+                self._errorCheck(status)
+
+        def items() -> Iterator:
+            with res:
+                yield from ijson.items(checkedEvents(ijson.parse(res.raw, use_float=True)),
+                    prefix)
+
+        return items()
+
+    def _compressPayload(self, data: Union[str, bytes], headers: dict = None) -> tuple:
+        """Compresses a request payload with gzip if it exceeds `gzipThreshold`.
+
+        Args:
+            data:
+                The request payload.
+            headers:
+                The headers of the request.
+
+        Returns:
+            A tuple of `(<payload>, <headers>)`; the headers include `Content-Encoding` if the
+            payload was compressed.
+        """
+        if self.gzipThreshold <= 0 or not isinstance(data, (str, bytes)) or \
+                len(data) <= self.gzipThreshold:
+            return data, headers
+        if isinstance(data, str):
+            data = data.encode()
+        headers = dict(headers or {})
+        headers["Content-Encoding"] = "gzip"
+        return gzip.compress(data, compresslevel=GZIP_LEVEL), headers
+
+    def _prepReq(self, method: str, authMode: str = "token", headers: dict = None,
+            data: Union[dict, list, str] = None) -> tuple:
+        """Builds the headers and payload of a request.
+
+        Shared by the synchronous and asynchronous request implementations. The headers are
+        built for each request; neither the connection nor the `headers` argument is modified.
+
+        Args:
+            method:
+                HTTP method, currently one of `GET`, `POST`, `PUT` or `DELETE`.
+            authMode:
+                Authentication mode, either `"token"` (default) or `"pwd"`.
+            headers:
+                Standard HTTP request headers.
+            data:
+                Request payload, typically a JSON document.
 
-        if authMode == "pwd":
-            _auth = (self.username, self.password)
+        Returns:
+            A tuple of `(<headers>, <payload>, <verify_certificate>)`.
+        """
+        if authMode == "token":
+            _headers = dict(self.authHeader)
         else:
-            _auth = None
+            _headers = {"Authorization": "Basic {0}".format(self.base64_credential)}
+
         if headers:
             _headers.update(headers)
         if method == "POST" or method == "PUT":
@@ -236,15 +681,53 @@ class pyTigerGraphBase(object):
         else:
             _data = None
 
-        if self.useCert is True or self.certPath is not None:
-            res = requests.request(method, url, headers=_headers, data=_data, params=params,
-                verify=False)
-        else:
-            res = requests.request(method, url, headers=_headers, data=_data, params=params)
+        verify = not (self.useCert is True or self.certPath is not None)
+        return _headers, _data, verify
 
-        if res.status_code != 200:
-            res.raise_for_status()
-        res = json.loads(res.text)
+    def _checkRawRes(self, res: bytes, skipCheck: bool = False) -> bytes:
+        """Checks the undecoded JSON response of a request for errors.
+
+        Only the beginning of the document (where the top level `error` flag of REST++ responses
+        is) is scanned; the document is decoded only if it seems to report an error. Used for the
+        responses of requests with `raw=True`, which are returned to the caller as received.
+
+        Args:
+            res:
+                The response body.
+            skipCheck:
+                Skip error checking.
+
+        Returns:
+            The response body.
+
+        Raises:
+            TigerGraphException: if request returned with error, indicated in the returned JSON.
+        """
+        if not skipCheck and RAW_ERROR_PATTERN.search(res, 0, RAW_ERROR_SCAN_LENGTH):
+            parsed = loads(res)
+            if isinstance(parsed, dict):
+                self._errorCheck(parsed)
+        return res
+
+    def _parseRes(self, res: Union[dict, list], resKey: str = "results",
+            skipCheck: bool = False) -> Union[dict, list]:
+        """Checks the decoded JSON response of a request and extracts the relevant part of it.
+
+        The error check is done on the complete document; the part under `resKey` is returned
+        (the complete document if `resKey` is empty).
+
+        Args:
+            res:
+                The decoded JSON response.
+            resKey:
+                The JSON subdocument to be returned, default is `"result"`.
+            skipCheck:
+                Some endpoints return an error to indicate that the requested
+                action is not applicable. This argument skips error checking.
+
+        Returns:
+            The (relevant part of the) response from the request (as a dictionary).
+        """
         if not skipCheck:
             self._errorCheck(res)
         if not resKey:
@@ -258,7 +741,8 @@ class pyTigerGraphBase(object):
         return res[resKey]
 
     def _get(self, url: str, authMode: str = "token", headers: dict = None, resKey: str = "results",
-            skipCheck: bool = False, params: Union[dict, list, str] = None) -> Union[dict, list]:
+            skipCheck: bool = False, params: Union[dict, list, str] = None,
+            raw: bool = False) -> Union[dict, list, bytes]:
         """Generic GET method.
 
         Args:
@@ -275,16 +759,18 @@ class pyTigerGraphBase(object):
                 action is not applicable. This argument skips error checking.
             params:
                 Request URL parameters.
+            raw:
+                If `True`, the response body is returned undecoded.
 
         Returns:
             The (relevant part of the) response from the request (as a dictionary).
        """
-        res = self._req("GET", url, authMode, headers, None, resKey, skipCheck, params)
+        res = self._req("GET", url, authMode, headers, None, resKey, skipCheck, params, raw)
         return res
 
     def _post(self, url: str, authMode: str = "token", headers: dict = None,
             data: Union[dict, list, str, bytes] = None, resKey: str = "results", skipCheck: bool = False,
-            params: Union[dict, list, str] = None) -> Union[dict, list]:
+            params: Union[dict, list, str] = None, raw: bool = False) -> Union[dict, list, bytes]:
         """Generic POST method.
 
         Args:
@@ -303,11 +789,13 @@ class pyTigerGraphBase(object):
                 action is not applicable. This argument skips error checking.
             params:
                 Request URL parameters.
+            raw:
+                If `True`, the response body is returned undecoded.
 
         Returns:
             The (relevant part of the) response from the request (as a dictionary).
         """
-        return self._req("POST", url, authMode, headers, data, resKey, skipCheck, params)
+        return self._req("POST", url, authMode, headers, data, resKey, skipCheck, params, raw)
 
     def _delete(self, url: str, authMode: str = "token") -> Union[dict, list]:
         """Generic DELETE method.
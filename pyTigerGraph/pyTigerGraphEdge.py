@@ -3,17 +3,42 @@
 Functions to upsert, retrieve and delete edges.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object].
 """
-import json
+import math
 import warnings
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraph.pyTigerGraphJSON import dumpb, dumps
 from pyTigerGraph.pyTigerGraphQuery import pyTigerGraphQuery
-
+from pyTigerGraph.pyTigerGraphSchema import MAX_ITER_PARTITIONS, STREAM_BATCH_SIZE
+
+ITER_EDGES_QUERY = "pyTG_iterEdgesByType"
+# An undirected edge is traversed from both of its endpoints; if both can be source vertices, it
+# is only returned from the one with the lower internal ID (so from one partition only)
+EDGES_BY_TYPE_QUERY_BODY = """
+    SetAccum<EDGE> @@edges;
+    start = {ANY};
+    res = SELECT s
+          FROM   start:s-(edgeType:e)->ANY:t
+          WHERE  s.type IN sourceVertexTypes
+             AND getvid(s) % partitions == partition
+             AND (e.isDirected() OR NOT t.type IN sourceVertexTypes
+                  OR getvid(s) <= getvid(t))
+          ACCUM  @@edges += e;
+    PRINT @@edges AS edges;
+}"""
+ITER_EDGES_QUERY_TEXT = """
+CREATE QUERY pyTG_iterEdgesByType(SET<STRING> sourceVertexTypes, STRING edgeType,
+        INT partitions, INT partition) FOR GRAPH $graphname {""" + EDGES_BY_TYPE_QUERY_BODY
+# The same query, interpreted (with a single partition) when the edges are not paged
+GET_EDGES_BY_TYPE_QUERY_TEXT = """
+INTERPRET QUERY (SET<STRING> sourceVertexTypes, STRING edgeType,
+        INT partitions, INT partition) FOR GRAPH $graphname {""" + EDGES_BY_TYPE_QUERY_BODY
 
 class pyTigerGraphEdge(pyTigerGraphQuery):
     def getEdgeTypes(self, force: bool = False) -> list:
@@ -27,10 +52,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         Returns:
             The list of edge types defined in the current graph.
         """
-        ret = []
-        for et in self.getSchema(force=force)["EdgeTypes"]:
-            ret.append(et["Name"])
-        return ret
+        return list(self._getSchemaIndex(force)["EdgeTypes"])
 
     def getEdgeType(self, edgeType: str, force: bool = False) -> dict:
         """Returns the details of the edge type.
@@ -45,10 +67,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         Returns:
             The metadata of the edge type.
         """
-        for et in self.getSchema(force=force)["EdgeTypes"]:
-            if et["Name"] == edgeType:
-                return et
-        return {}
+        return self._getSchemaIndex(force)["EdgeTypes"].get(edgeType, {})
 
     def getEdgeSourceVertexType(self, edgeType: str) -> Union[str, set]:
         """Returns the type(s) of the edge type's source vertex.
@@ -73,22 +92,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 at the individual source/target pairs to find out which combinations are
                 valid/defined.
         """
-        edgeTypeDetails = self.getEdgeType(edgeType)
-
-        # Edge type with a single source vertex type
-        if edgeTypeDetails["FromVertexTypeName"] != "*":
-            return edgeTypeDetails["FromVertexTypeName"]
-
-        # Edge type with multiple source vertex types
-        if "EdgePairs" in edgeTypeDetails:
-            # v3.0 and later notation
-            vts = set()
-            for ep in edgeTypeDetails["EdgePairs"]:
-                vts.add(ep["From"])
-            return vts
-        else:
-            # 2.6.1 and earlier notation
-            return "*"
+        ret = self._getSchemaIndex()["SourceVertexTypes"][edgeType]
+        return set(ret) if isinstance(ret, set) else ret
 
     def getEdgeTargetVertexType(self, edgeType: str) -> Union[str, set]:
         """Returns the type(s) of the edge type's target vertex.
@@ -112,22 +117,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 edge is defined between all source and all target vertex types. You need to look at
                 the individual source/target pairs to find out which combinations are valid/defined.
         """
-        edgeTypeDetails = self.getEdgeType(edgeType)
-
-        # Edge type with a single target vertex type
-        if edgeTypeDetails["ToVertexTypeName"] != "*":
-            return edgeTypeDetails["ToVertexTypeName"]
-
-        # Edge type with multiple target vertex types
-        if "EdgePairs" in edgeTypeDetails:
-            # v3.0 and later notation
-            vts = set()
-            for ep in edgeTypeDetails["EdgePairs"]:
-                vts.add(ep["To"])
-            return vts
-        else:
-            # 2.6.1 and earlier notation
-            return "*"
+        ret = self._getSchemaIndex()["TargetVertexTypes"][edgeType]
+        return set(ret) if isinstance(ret, set) else ret
 
     def isDirected(self, edgeType: str) -> bool:
         """Is the specified edge type directed?
@@ -139,7 +130,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         Returns:
             `True`, if the edge is directed.
         """
-        return self.getEdgeType(edgeType)["IsDirected"]
+        return self._getSchemaIndex()["EdgeTypes"][edgeType]["IsDirected"]
 
     def getReverseEdge(self, edgeType: str) -> str:
         """Returns the name of the reverse edge of the specified edge type, if applicable.
@@ -151,14 +142,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         Returns:
             The name of the reverse edge, if it was defined.
         """
-        if not self.isDirected(edgeType):
-            return ""
-            # TODO Should return some other value or raise exception?
-        config = self.getEdgeType(edgeType)["Config"]
-        if "REVERSE_EDGE" in config:
-            return config["REVERSE_EDGE"]
-        return ""
-        # TODO Should return some other value or raise exception?
+        return self._getSchemaIndex()["ReverseEdges"].get(edgeType, "")
+        # TODO Should return some other value or raise exception if there is no reverse edge?
 
     def getEdgeCountFrom(self, sourceVertexType: str = "", sourceVertexId: Union[str, int] = None,
             edgeType: str = "", targetVertexType: str = "", targetVertexId: Union[str, int] = None,
@@ -310,14 +295,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             return None
             # TODO Should return 0 or raise an exception instead?
         vals = self._upsertAttrs(attributes)
-        data = json.dumps(
+        data = dumpb(
             {"edges": {sourceVertexType: {
                 sourceVertexId: {edgeType: {targetVertexType: {targetVertexId: vals}}}}}})
         return self._post(self.restppUrl + "/graph/" + self.graphname, data=data)[0][
             "accepted_edges"]
 
     def upsertEdges(self, sourceVertexType: str, edgeType: str, targetVertexType: str,
-            edges: list) -> int:
+            edges: list, atomic: bool = False, ackAll: bool = False, batchSize: int = 0,
+            batchBytes: int = 0, concurrency: int = 1) -> int:
         """Upserts multiple edges (of the same type).
 
         Args:
@@ -328,7 +314,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             targetVertexType:
                 The name of the target vertex type.
             edges:
-                A list in of tuples in this format:
+                A list (or any other iterable, e.g. a generator) of tuples in this format:
                 ```
                 [
                     (<source_vertex_id>, <target_vertex_id>, {<attribute_name>: <attribute_value>, …}),
@@ -345,19 +331,113 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 ```
                 For valid values of `<operator>` see https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#operation-codes .
 
+                An iterable other than a list is consumed lazily and is always upserted in batches
+                (of `STREAM_BATCH_SIZE` edges, unless `batchSize` or `batchBytes` is specified),
+                so the memory used does not depend on the number of edges.
+            atomic:
+                If `True`, the request (or each batch) is an all-or-nothing transaction.
+            ackAll:
+                If `True`, the request will return after all GPE instances have acknowledged the
+                POST.
+            batchSize:
+                If greater than `0`, the edges are upserted in batches of (at most) this many edges.
+            batchBytes:
+                If greater than `0`, the edges are upserted in batches whose JSON document is
+                (approximately) at most this many bytes long.
+            concurrency:
+                The maximum number of batches upserted at the same time.
+
         Returns:
-            A single number of accepted (successfully upserted) edges (0 or positive integer).
+            The number of accepted (successfully upserted) edges (0 or positive integer), whether
+            or not the edges are upserted in batches.
+
+        Raises:
+            `TigerGraphException` if any batch failed (the other batches are upserted). Use
+            `upsertEdgesInBatches()` to get the failed batches, e.g. to retry them.
 
         Endpoint:
             - `POST /graph/{graph_name}`
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#upsert-data-to-graph
 
-        TODO Add ack, new_vertex_only, vertex_must_exist, update_vertex_only and atomic_level
-            parameters and functionality.
+        TODO Add new_vertex_only, vertex_must_exist and update_vertex_only parameters and
+            functionality.
         """
-        if not isinstance(edges, list):
+        if isinstance(edges, (str, bytes, dict)) or not isinstance(edges, Iterable):
             return None
             # TODO Should return 0 or raise an exception instead?
+        if not isinstance(edges, list) or batchSize > 0 or batchBytes > 0:
+            return self._checkBatchReport(self.upsertEdgesInBatches(sourceVertexType, edgeType,
+                targetVertexType, edges, batchSize, batchBytes, concurrency, atomic, ackAll),
+                "accepted_edges", "upsertEdgesInBatches")
+
+        data = self._prepUpsertEdges(sourceVertexType, edgeType, targetVertexType, edges)
+        data, headers, params = self._prepUpsertData(data, atomic, ackAll)
+        return self._post(self.restppUrl + "/graph/" + self.graphname, headers=headers, data=data,
+            params=params)[0]["accepted_edges"]
+
+    def upsertEdgesInBatches(self, sourceVertexType: str, edgeType: str, targetVertexType: str,
+            edges: Iterable, batchSize: int = 0, batchBytes: int = 0, concurrency: int = 1,
+            atomic: bool = False, ackAll: bool = False) -> dict:
+        """Upserts multiple edges (of the same type) in batches, reporting the failed batches.
+
+        A failing batch does not stop the upsert of the other batches.
+
+        Args:
+            sourceVertexType:
+                The name of the source vertex type.
+            edgeType:
+                The name of the edge type.
+            targetVertexType:
+                The name of the target vertex type.
+            edges:
+                A list or any other iterable of edges; see `upsertEdges()`. Consumed lazily.
+            batchSize:
+                The maximum number of edges in a batch. If neither `batchSize` nor `batchBytes` is
+                specified, `STREAM_BATCH_SIZE` is used.
+            batchBytes:
+                If greater than `0`, the edges are upserted in batches whose JSON document is
+                (approximately) at most this many bytes long.
+            concurrency:
+                The maximum number of batches upserted at the same time.
+            atomic:
+                If `True`, each batch is an all-or-nothing transaction.
+            ackAll:
+                If `True`, each request will return after all GPE instances have acknowledged the
+                POST.
+
+        Returns:
+            A dictionary with the number of accepted edges under the `"accepted_edges"` key and
+            the list of failed batches under the `"failed_batches"` key (see `upsertData()`).
+
+        Endpoint:
+            - `POST /graph/{graph_name}`
+                See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#upsert-data-to-graph
+        """
+        if batchSize <= 0 and batchBytes <= 0:
+            batchSize = STREAM_BATCH_SIZE
+        records = ((("edges", sourceVertexType, e[0], edgeType, targetVertexType, e[1]),
+            self._upsertAttrs(e[2]) if len(e) > 2 else {}) for e in edges)
+        return self._upsertDataInBatches(records, batchSize, batchBytes, concurrency, atomic,
+            ackAll)
+
+    def _prepUpsertEdges(self, sourceVertexType: str, edgeType: str, targetVertexType: str,
+            edges: list) -> str:
+        """Builds the JSON payload of `upsertEdges()`.
+
+        Args:
+            sourceVertexType:
+                The name of the source vertex type.
+            edgeType:
+                The name of the edge type.
+            targetVertexType:
+                The name of the target vertex type.
+            edges:
+                A list of `(<source_vertex_id>, <target_vertex_id>, {<attribute_name>: <attribute_value>, …})`
+                tuples.
+
+        Returns:
+            The JSON document to be posted.
+        """
         data = {sourceVertexType: {}}
         l1 = data[sourceVertexType]
         for e in edges:
@@ -379,13 +459,11 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             l4 = l3[targetVertexType]
             # targetVertexId
             l4[e[1]] = vals
-        data = json.dumps({"edges": data})
-        return self._post(self.restppUrl + "/graph/" + self.graphname, data=data)[0][
-            "accepted_edges"]
+        return dumpb({"edges": data})
 
     def upsertEdgeDataFrame(self, df: 'pd.DataFrame', sourceVertexType: str, edgeType: str,
             targetVertexType: str, from_id: str = "", to_id: str = "",
-            attributes: dict = None) -> int:
+            attributes: dict = None, ops: dict = None, skipNA: bool = False) -> int:
         """Upserts edges from a Pandas DataFrame.
 
         Args:
@@ -408,28 +486,29 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 the dataframe and target is the attribute name in the graph vertex. When omitted,
                 all columns would be upserted with their current names. In this case column names
                 must match the vertex's attribute names.
+            ops:
+                A dictionary in the form of `{target: operator}`, the operator used to update the
+                attribute, e.g. `{"visits": "+"}`.
+                For valid values of `<operator>` see https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#operation-codes .
+            skipNA:
+                If `True`, missing values are left out of the upsert (the attribute keeps its
+                current value); otherwise they are upserted as `null`.
 
         Returns:
             The number of edges upserted.
         """
-
-        json_up = []
-
-        for index in df.index:
-            json_up.append(json.loads(df.loc[index].to_json()))
-            json_up[-1] = (
-                index if from_id is None else json_up[-1][from_id],
-                index if to_id is None else json_up[-1][to_id],
-                json_up[-1] if attributes is None
-                else {target: json_up[-1][source] for target, source in attributes.items()}
-            )
-
-        return self.upsertEdges(
-            sourceVertexType=sourceVertexType,
-            edgeType=edgeType,
-            targetVertexType=targetVertexType,
-            edges=json_up
-        )
+        sources = (df.index if not from_id else df[from_id]).tolist()
+        targets = (df.index if not to_id else df[to_id]).tolist()
+        attrs = self._upsertAttrsFromDataFrame(df, attributes, ops, skipNA)
+
+        data = {}
+        for src, trg, vals in zip(sources, targets, attrs):
+            if src not in data:
+                data[src] = {edgeType: {targetVertexType: {}}}
+            data[src][edgeType][targetVertexType][trg] = vals
+        data, headers, _ = self._prepUpsertData({"edges": {sourceVertexType: data}})
+        return self._post(self.restppUrl + "/graph/" + self.graphname, headers=headers,
+            data=data)[0]["accepted_edges"]
 
     def getEdges(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
             targetVertexType: str = "", targetVertexId: str = "", select: str = "", where: str = "",
@@ -466,6 +545,9 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 - "py":   Python objects
                 - "json": JSON document
                 - "df":   pandas DataFrame
+                - "numpy": A dictionary of numpy arrays, one per column of the "df" format
+                - "arrow": `pyarrow.Table` with the columns of the "df" format
+                - "raw":  The complete, undecoded response of the endpoint (bytes)
             withId:
                 (When the output format is "df") Should the source and target vertex types and IDs
                 be included in the dataframe?
@@ -484,6 +566,27 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         """
         # TODO Change sourceVertexId to sourceVertexIds and allow passing both str and list<str> as
         #   parameter
+        url = self._prepGetEdges(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
+            targetVertexId, select, where, limit, sort, timeout)
+        if fmt == "raw":
+            return self._get(url, raw=True)
+        ret = self._get(url)
+
+        return self._formatEdgeSet(ret, fmt, withId, withType)
+
+    def _prepGetEdges(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
+            targetVertexType: str = "", targetVertexId: str = "", select: str = "", where: str = "",
+            limit: Union[int, str] = None, sort: str = "", timeout: int = 0) -> str:
+        """Builds the URL of `getEdges()`.
+
+        See `getEdges()` for the description of the arguments.
+
+        Returns:
+            The complete REST++ URL including the query string.
+
+        Raises:
+            `TigerGraphException` if the source vertex type or ID is missing.
+        """
         if not sourceVertexType or not sourceVertexId:
             raise TigerGraphException(
                 "Both source vertex type and source vertex ID must be provided.", None)
@@ -510,13 +613,35 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             isFirst = False
         if timeout and timeout > 0:
             url += ("?" if isFirst else "&") + "timeout=" + str(timeout)
-        ret = self._get(url)
+        return url
 
+    def _formatEdgeSet(self, edgeSet: list, fmt: str = "py", withId: bool = True,
+            withType: bool = False) -> Union[list, str, 'pd.DataFrame']:
+        """Converts an edge set returned by an endpoint or query to the requested output format.
+
+        Args:
+            edgeSet:
+                The edge set as returned by the endpoint or query.
+            fmt:
+                Format of the results: `"py"`, `"json"`, `"df"`, `"numpy"` or `"arrow"`.
+            withId:
+                (When the output format is "df") Should the source and target vertex types and IDs
+                be included in the dataframe?
+            withType:
+                (When the output format is "df") Should the edge type be included in the dataframe?
+
+        Returns:
+            The edge set as Python objects, JSON, pandas DataFrame, numpy arrays or Arrow table.
+        """
         if fmt == "json":
-            return json.dumps(ret)
+            return dumps(edgeSet)
         if fmt == "df":
-            return self.edgeSetToDataFrame(ret, withId, withType)
-        return ret
+            return self.edgeSetToDataFrame(edgeSet, withId, withType)
+        if fmt == "numpy":
+            return self.edgeSetToNumpy(edgeSet, withId, withType)
+        if fmt == "arrow":
+            return self.edgeSetToArrow(edgeSet, withId, withType)
+        return edgeSet
 
     def getEdgesDataFrame(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
             targetVertexType: str = "", targetVertexId: str = "", select: str = "", where: str = "",
@@ -572,9 +697,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             targetVertexId, select, where, limit, sort, timeout)
 
     def getEdgesByType(self, edgeType: str, fmt: str = "py", withId: bool = True,
-            withType: bool = False) -> Union[dict, str, 'pd.DataFrame']:
+            withType: bool = False, chunkSize: int = 0,
+            concurrency: int = 1) -> Union[dict, str, 'pd.DataFrame']:
         """Retrieves edges of the given edge type regardless the source vertex.
 
+        By default, the edges are retrieved by a single interpreted query. If `chunkSize` is
+        specified, they are retrieved in partitions by `iterEdgesByType()` instead, which needs
+        the privilege to install a helper query (the installation can take a minute); see there
+        for details.
+
         Args:
             edgeType:
                 The name of the edge type.
@@ -583,54 +714,132 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 - "py":   Python objects
                 - "json": JSON document
                 - "df":   pandas DataFrame
+                - "numpy": A dictionary of numpy arrays, one per column of the "df" format
+                - "arrow": `pyarrow.Table` with the columns of the "df" format
             withId:
                 (When the output format is "df") Should the source and target vertex types and IDs
                 be included in the dataframe?
             withType:
                 (When the output format is "df") should the edge type be included in the dataframe?
+            chunkSize:
+                If greater than `0`, the approximate number of edges retrieved in one request.
+            concurrency:
+                The number of requests running at the same time (if `chunkSize` is specified).
 
         Returns:
-            The details of the edge instances of the given edge type as dictionary, JSON or pandas
-            DataFrame.
+            The details of the edge instances of the given edge type as dictionary, JSON, pandas
+            DataFrame, numpy arrays or Arrow table.
 
         TODO Add limit parameter
         """
         if not edgeType:
             return []
 
-        sourceVertexType = self.getEdgeSourceVertexType(edgeType)
-        # TODO Support edges with multiple source vertex types
-        if isinstance(sourceVertexType, set) or sourceVertexType == "*":
-            raise TigerGraphException(
-                "Edges with multiple source vertex types are not currently supported.", None)
-
-        queryText = \
-            'INTERPRET QUERY () FOR GRAPH $graph { \
-            SetAccum<EDGE> @@edges; \
-            start = {ANY}; \
-            res = \
-                SELECT s \
-                FROM   start:s-(:e)->ANY:t \
-                WHERE  e.type == "$edgeType" \
-                   AND s.type == "$sourceEdgeType" \
-                ACCUM  @@edges += e; \
-            PRINT @@edges AS edges; \
-        }'
-
-        queryText = queryText.replace("$graph", self.graphname) \
-            .replace('$sourceEdgeType', sourceVertexType) \
-            .replace('$edgeType', edgeType)
-        ret = self.runInterpretedQuery(queryText)
-
-        ret = ret[0]["edges"]
+        if chunkSize > 0:
+            ret = []
+            for chunk in self.iterEdgesByType(edgeType, chunkSize=chunkSize,
+                    concurrency=concurrency):
+                ret += chunk
+        else:
+            ret = self.runInterpretedQuery(GET_EDGES_BY_TYPE_QUERY_TEXT, {
+                "sourceVertexTypes": self._getEdgeSourceVertexTypeList(edgeType),
+                "edgeType": edgeType,
+                "partitions": 1,
+                "partition": 0
+            })[0]["edges"]
+
+        return self._formatEdgeSet(ret, fmt, withId, withType)
+
+    def iterEdgesByType(self, edgeType: str, chunkSize: int = 10000, fmt: str = "py",
+            withId: bool = True, withType: bool = False, concurrency: int = 1,
+            cursor: dict = None, timeout: int = 0,
+            maxPartitions: int = MAX_ITER_PARTITIONS) -> Iterator:
+        """Retrieves all edges of the given edge type, in chunks.
+
+        The edges are divided into partitions by the internal ID of their source vertex, and the
+        partitions are retrieved one by one (or a few at a time) by a helper query, so that
+        neither the client nor the database holds more than a few chunks at any time. The helper
+        query is installed the first time this function is called for the graph (this can take a
+        minute); it is shared by all edge types. The query traverses the edges of all source
+        vertices for each partition (and keeps those of the partition), so the total work on the
+        server grows with the number of partitions, which is limited by `maxPartitions`.
 
-        if fmt == "json":
-            return json.dumps(ret)
-        if fmt == "df":
-            return self.edgeSetToDataFrame(ret, withId, withType)
-        return ret
+        Args:
+            edgeType:
+                The name of the edge type.
+            chunkSize:
+                The approximate number of edges in a chunk. Chunks are larger if the edge type has
+                more than `chunkSize * maxPartitions` edges.
+            fmt:
+                Format of the chunks:
+                - "py":   Python objects
+                - "df":   pandas DataFrame
+                - "numpy": A dictionary of numpy arrays, one per column of the "df" format
+                - "arrow": `pyarrow.Table` with the columns of the "df" format
+            withId:
+                (When the output format is "df") Should the source and target vertex types and IDs
+                be included in the dataframe?
+            withType:
+                (When the output format is "df") should the edge type be included in the dataframe?
+            concurrency:
+                The number of partitions retrieved at the same time. If greater than 1, the
+                chunks are returned in the order they arrive.
+            cursor:
+                A dictionary recording the progress of the export; see `iterVertices()`.
+            timeout:
+                Time allowed for retrieving a chunk (in seconds; 0 = no limit, default).
+            maxPartitions:
+                The maximum number of partitions (and chunks). If `0`, the number of partitions is
+                not limited. Ignored when an export is resumed.
+
+        Returns:
+            An iterator of the chunks of edges.
 
-    # TODO getEdgesDataFrameByType
+        Raises:
+            `TigerGraphException` if the cursor belongs to an export of a different edge type.
+        """
+        if cursor is None:
+            cursor = {}
+        if "partitions" in cursor:
+            if cursor["edgeType"] != edgeType:
+                raise TigerGraphException("The cursor belongs to a different scan.", None)
+        else:
+            cursor["edgeType"] = edgeType
+            partitions = max(1, math.ceil(self.getEdgeCount(edgeType) / chunkSize))
+            if maxPartitions > 0:
+                partitions = min(partitions, maxPartitions)
+            cursor["partitions"] = partitions
+            cursor["done"] = []
+
+        sourceVertexTypes = self._getEdgeSourceVertexTypeList(edgeType)
+        self._installHelperQuery(ITER_EDGES_QUERY, ITER_EDGES_QUERY_TEXT)
+        partitions = cursor["partitions"]
+        done = set(cursor["done"])
+
+        def getPartition(partition: int) -> tuple:
+            res = self.runInstalledQuery(ITER_EDGES_QUERY, {
+                "sourceVertexTypes": sourceVertexTypes,
+                "edgeType": edgeType,
+                "partitions": partitions,
+                "partition": partition
+            }, timeout=timeout * 1000)
+            return partition, res[0]["edges"]
+
+        for partition, res in self._imapConcurrently(getPartition,
+                (p for p in range(partitions) if p not in done), concurrency):
+            cursor["done"].append(partition)
+            yield self._formatEdgeSet(res, fmt, withId, withType)
+
+    def _getEdgeSourceVertexTypeList(self, edgeType: str) -> list:
+        """Returns the list of the source vertex types of an edge type (all vertex types if any
+            vertex type can be a source).
+        """
+        sourceVertexTypes = self.getEdgeSourceVertexType(edgeType)
+        if sourceVertexTypes == "*":
+            return list(self._getSchemaIndex()["VertexTypes"])
+        if isinstance(sourceVertexTypes, str):
+            return [sourceVertexTypes]
+        return sorted(sourceVertexTypes)
 
     def getEdgeStats(self, edgeTypes: Union[str, list], skipNA: bool = False) -> dict:
         """Returns edge attribute statistics.
@@ -742,7 +951,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         return ret
 
     def edgeSetToDataFrame(self, edgeSet: list, withId: bool = True,
-            withType: bool = False) -> 'pd.DataFrame':
+            withType: bool = False, types: dict = None) -> 'pd.DataFrame':
         """Converts an edge set to Pandas DataFrame
 
         Edge sets contain instances of the same edge type. Edge sets are not generated "naturally"
@@ -800,23 +1009,75 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 Whether to include the type and primary ID of source and target vertices as a column. Default is `True`.
             withType:
                 Whether to include edge type info as a column. Default is `False`.
+            types:
+                A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+                `"DATETIME"`) for attributes whose type is not (or not yet) known from the
+                schema.
 
         Returns:
             A pandas DataFrame containing the edge attributes and optionally the type and primary
-            ID or source and target vertices, and the edge type.
+            ID or source and target vertices, and the edge type. The columns of attributes are
+            typed according to the schema of the edge type; the type columns are categorical.
+
+        """
+        return self._elementSetToDataFrame(edgeSet, "EdgeTypes",
+            self._edgeSetColumns(withId, withType), "e_type", types)
+
+    def edgeSetToNumpy(self, edgeSet: list, withId: bool = True,
+            withType: bool = False, types: dict = None) -> dict:
+        """Converts an edge set to numpy arrays.
+
+        The columns are the same as those of `edgeSetToDataFrame()`. Attribute columns are typed
+        according to the schema of the edge type: numeric and boolean attributes as arrays of
+        the corresponding numpy data type (masked arrays if values are missing), `DATETIME`
+        attributes as `datetime64[s]`, other attributes as objects.
+        The schema is not fetched by this function: if it has not been fetched yet (e.g. by
+        `getSchema()`) and `types` is not specified, the data types are inferred from the values.
+
+        Args:
+            edgeSet:
+                A JSON array containing an edge set in the format returned by queries.
+            withId:
+                Whether to include the type and primary ID of source and target vertices.
+            withType:
+                Whether to include the edge type.
+            types:
+                A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+                `"DATETIME"`) for attributes whose type is not (or not yet) known from the
+                schema.
+
+        Returns:
+            A dictionary of `<column_name>: <numpy_array>` pairs.
+        """
+        return self._elementSetToNumpy(edgeSet, "EdgeTypes",
+            self._edgeSetColumns(withId, withType), "e_type", types)
+
+    def edgeSetToArrow(self, edgeSet: list, withId: bool = True,
+            withType: bool = False, types: dict = None) -> 'pa.Table':
+        """Converts an edge set to Arrow table.
+
+        The columns are the same as those of `edgeSetToDataFrame()`, typed like in
+        `edgeSetToNumpy()`; the type columns are dictionary encoded.
 
+        Args:
+            edgeSet:
+                A JSON array containing an edge set in the format returned by queries.
+            withId:
+                Whether to include the type and primary ID of source and target vertices.
+            withType:
+                Whether to include the edge type.
+            types:
+                A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+                `"DATETIME"`) for attributes whose type is not (or not yet) known from the
+                schema.
+
+        Returns:
+            A `pyarrow.Table`.
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError("Pandas is required to use this function. "
-                              "Download pandas using 'pip install pandas'.")
-
-        df = pd.DataFrame(edgeSet)
-        cols = []
-        if withId:
-            cols.extend([df["from_type"], df["from_id"], df["to_type"], df["to_id"]])
-        if withType:
-            cols.append(df["e_type"])
-        cols.append(pd.DataFrame(df["attributes"].tolist()))
-        return pd.concat(cols, axis=1)
+        return self._elementSetToArrow(edgeSet, "EdgeTypes",
+            self._edgeSetColumns(withId, withType), "e_type", types)
+
+    def _edgeSetColumns(self, withId: bool = True, withType: bool = False) -> list:
+        """Returns the non-attribute columns of the tabular formats of edge sets."""
+        return (["from_type", "from_id", "to_type", "to_id"] if withId else []) + \
+            (["e_type"] if withType else [])
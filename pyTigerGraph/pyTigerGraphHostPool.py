@@ -0,0 +1,194 @@
+"""Host Pool
+
+A `HostPool` spreads the REST++ requests of a connection across the nodes of a cluster (each of
+which serves REST++), choosing for each request the node with the fewest requests in progress or
+the next node in turn.
+
+Nodes that fail (connection errors, server errors or unanswered health checks) are ejected from
+the pool for a while; the status of the nodes is checked periodically from a background thread
+with `GET /echo`. Requests that refer to an earlier asynchronous query (e.g. `/query_status`) are
+sent to the node that runs the query.
+
+Pools are created by `TigerGraphConnection` when its `host` argument is a list of hosts.
+"""
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyTigerGraph.pyTigerGraph import TigerGraphConnection
+
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+
+POLICIES = ("least_outstanding", "round_robin")
+"""The supported host selection policies."""
+FAILURES_TO_EJECT = 3
+"""The number of consecutive failed requests after which a node is ejected."""
+HEALTH_CHECK_TIMEOUT = 2
+"""The number of seconds a node has to answer a health check; slower nodes are ejected."""
+MAX_STICKY_REQUESTS = 10000
+"""The number of asynchronous queries whose node is remembered for sticky routing."""
+
+
+class HostPool:
+    """Selects the node of the cluster each REST++ request is sent to."""
+
+    def __init__(self, conn: 'TigerGraphConnection', urls: list,
+            policy: str = "least_outstanding", healthCheckInterval: float = 10,
+            ejectTime: float = 30):
+        """Initiates a host pool.
+
+        Args:
+            conn:
+                The connection the health checks are sent through.
+            urls:
+                The REST++ base URLs of the nodes.
+            policy, healthCheckInterval, ejectTime:
+                See the `hostPolicy`, `healthCheckInterval` and `ejectTime` arguments of
+                `TigerGraphConnection`.
+        """
+        if policy not in POLICIES:
+            raise TigerGraphException("Unsupported host policy: {}. Supported policies are: {}."
+                .format(policy, ", ".join(POLICIES)), None)
+        self.policy = policy
+        self.healthCheckInterval = healthCheckInterval
+        self.ejectTime = ejectTime
+
+        self._conn = weakref.ref(conn)
+        self._nodes = [{
+            "url": url,
+            "outstanding": 0,
+            "requests": 0,
+            "failures": 0,
+            "ejectedUntil": 0
+        } for url in urls]
+        self._next = 0
+        self._sticky = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = None
+        self._thread = None
+
+    def acquire(self, requestId: str = None) -> dict:
+        """Selects the node of a request and counts the request as in progress.
+
+        Args:
+            requestId:
+                The ID of the asynchronous query the request refers to, if any.
+
+        Returns:
+            The node, to be passed to `release()` when the request completes.
+        """
+        if self.healthCheckInterval > 0 and self._thread is None:
+            self._startHealthCheck()
+        with self._lock:
+            node = self._sticky.get(requestId) if requestId is not None else None
+            if node is None:
+                now = time.monotonic()
+                nodes = [n for n in self._nodes if n["ejectedUntil"] <= now] or self._nodes
+                start = self._next % len(nodes)
+                self._next += 1
+                if self.policy == "round_robin":
+                    node = nodes[start]
+                else:
+                    # Starting at a different node each time spreads the requests among the nodes
+                    # with the same number of requests in progress
+                    node = min(nodes[start:] + nodes[:start], key=lambda n: n["outstanding"])
+            node["outstanding"] += 1
+            node["requests"] += 1
+        return node
+
+    def release(self, node: dict, ok: bool = True, requestId: str = None):
+        """Counts a request as completed.
+
+        Args:
+            node:
+                The node returned by `acquire()`.
+            ok:
+                `False` if the request failed because of the node (connection error or server
+                error).
+            requestId:
+                The ID of the asynchronous query started by the request, if any; the requests
+                referring to it are sent to the same node.
+        """
+        with self._lock:
+            node["outstanding"] -= 1
+            if ok:
+                node["failures"] = 0
+            else:
+                node["failures"] += 1
+                if node["failures"] >= FAILURES_TO_EJECT:
+                    self._eject(node)
+            if requestId is not None:
+                self._sticky[requestId] = node
+                if len(self._sticky) > MAX_STICKY_REQUESTS:
+                    self._sticky.popitem(last=False)
+
+    def _eject(self, node: dict):
+        """Excludes a node from the selection for `ejectTime` seconds; `_lock` is held."""
+        node["ejectedUntil"] = time.monotonic() + self.ejectTime
+        node["failures"] = 0
+
+    def _startHealthCheck(self):
+        """Starts the background thread of the health checks unless it is running."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            # Each thread has its own stop signal, so a thread started while an earlier one is
+            # stopping does not revoke it
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop,),
+                name="pyTigerGraph-HostPool", daemon=True)
+            self._thread.start()
+
+    def _run(self, stop: threading.Event):
+        """The loop of the background thread, checking the health of the nodes periodically.
+
+        Args:
+            stop:
+                The event signalling the thread to stop.
+        """
+        while not stop.wait(self.healthCheckInterval):
+            conn = self._conn()
+            if conn is None:
+                return
+            for node in self._nodes:
+                ok = conn._checkHost(node["url"], HEALTH_CHECK_TIMEOUT)
+                with self._lock:
+                    if not ok:
+                        self._eject(node)
+                    elif node["ejectedUntil"] > time.monotonic():
+                        # Recovered before the end of the ejection period
+                        node["ejectedUntil"] = 0
+            # Not to keep the connection alive while waiting
+            conn = None
+
+    def close(self):
+        """Stops the health checks; they are restarted by the next request."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            if self._stop is not None:
+                self._stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def getStats(self) -> list:
+        """Returns the status of the nodes.
+
+        Returns:
+            A list of dictionaries, one per node, with the following keys:
+            - `url`: The REST++ base URL of the node.
+            - `outstanding`: The number of requests in progress.
+            - `requests`: The number of requests sent to the node.
+            - `ejected`: `True` if the node is currently excluded from the selection.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [{
+                "url": n["url"],
+                "outstanding": n["outstanding"],
+                "requests": n["requests"],
+                "ejected": n["ejectedUntil"] > now
+            } for n in self._nodes]
@@ -0,0 +1,122 @@
+"""JSON Codec
+
+The functions the package serializes request payloads and parses responses with.
+
+By default, the fastest available JSON library is used: `orjson` if it is installed, otherwise
+`ujson`, otherwise the `json` module of the standard library. A specific library can be selected
+with `setCodec()`:
+
+[source.wrap,python]
+----
+from pyTigerGraph.pyTigerGraphJSON import setCodec
+setCodec("json")
+----
+
+The choice is process-wide.
+"""
+import json
+from typing import Union
+
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+
+_codec = None
+_dumpb = None
+_loads = None
+
+
+def _jsonDumpb(obj: object) -> bytes:
+    return json.dumps(obj).encode()
+
+
+def _orjsonCodec() -> tuple:
+    import orjson
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumpb(obj: object) -> bytes:
+        return orjson.dumps(obj, option=options)
+
+    return dumpb, orjson.loads
+
+
+def _ujsonCodec() -> tuple:
+    import ujson
+
+    def dumpb(obj: object) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+    return dumpb, ujson.loads
+
+
+_CODECS = {
+    "orjson": _orjsonCodec,
+    "ujson": _ujsonCodec,
+    "json": lambda: (_jsonDumpb, json.loads)
+}
+
+
+def setCodec(codec: Union[str, tuple] = None):
+    """Selects the JSON library used by the package.
+
+    Args:
+        codec:
+            `"orjson"`, `"ujson"` or `"json"` (the standard library); or a
+            `(<dumps_to_bytes_function>, <loads_function>)` tuple of custom functions. If omitted,
+            the fastest installed library is selected.
+
+    Raises:
+        `ImportError` if the selected library is not installed.
+        `TigerGraphException` if the library is not supported.
+    """
+    global _codec, _dumpb, _loads
+    if isinstance(codec, tuple):
+        _codec = "custom"
+        _dumpb, _loads = codec
+        return
+    if codec is None:
+        for c in _CODECS:
+            try:
+                setCodec(c)
+                return
+            except ImportError:
+                pass
+    if codec not in _CODECS:
+        raise TigerGraphException("Unsupported JSON codec: {}.".format(codec), None)
+    try:
+        _dumpb, _loads = _CODECS[codec]()
+    except ImportError:
+        raise ImportError("{0} is required to use this codec. "
+            "Download {0} using 'pip install {0}'.".format(codec))
+    _codec = codec
+
+
+def getCodec() -> str:
+    """Returns the name of the JSON library used by the package."""
+    return _codec
+
+
+def dumpb(obj: object) -> bytes:
+    """Serializes an object to a (UTF-8 encoded) JSON document.
+
+    Dictionary keys that are not strings (e.g. numeric vertex IDs) are converted to strings.
+    """
+    return _dumpb(obj)
+
+
+def dumps(obj: object) -> str:
+    """Serializes an object to a JSON formatted string."""
+    return _dumpb(obj).decode()
+
+
+def loads(s: Union[bytes, str]) -> object:
+    """Parses a JSON document (`bytes` or `str`).
+
+    Documents not accepted by the selected library (e.g. containing `NaN`) are parsed with the
+    standard library, so the result does not depend on the library selected.
+    """
+    try:
+        return _loads(s)
+    except ValueError:
+        return json.loads(s)
+
+
+setCodec()
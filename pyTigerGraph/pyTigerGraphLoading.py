@@ -3,20 +3,37 @@
 The functions on this page run loading jobs on the TigerGraph server.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object].
 """
-from typing import Union
+import csv
+import glob
+import io
+import math
+import os
+import time
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 from pyTigerGraph.pyTigerGraphBase import pyTigerGraphBase
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
 
 
 class pyTigerGraphLoading(pyTigerGraphBase):
     def runLoadingJobWithFile(self, filePath: str, fileTag: str, jobName: str, sep: str = None,
-            eol: str = None, timeout: int = 16000, sizeLimit: int = 128000000) -> Union[dict, None]:
+            eol: str = None, timeout: int = 16000, sizeLimit: int = 128000000, chunkSize: int = 0,
+            concurrency: int = 1, retries: int = 0, quote: str = None,
+            header: bool = False) -> Union[list, dict, None]:
         """Execute a loading job with the referenced file.
 
         The file will first be uploaded to the TigerGraph server and the value of the appropriate
         FILENAME definition will be updated to point to the freshly uploaded file.
 
         NOTE: The argument `USING HEADER="true"` in the GSQL loading job may not be enough to
-        load the file correctly. Remove the header from the data file before using this function.
+        load the file correctly. Remove the header from the data file before using this function,
+        or specify `header=True` if the file is uploaded in chunks.
 
         Args:
             filePath:
@@ -35,11 +52,51 @@ class pyTigerGraphLoading(pyTigerGraphBase):
                 Timeout in seconds. If set to `0`, use the system-wide endpoint timeout setting.
             sizeLimit:
                 Maximum size for input file in bytes.
+            chunkSize:
+                If greater than `0`, the file is read and uploaded in chunks of approximately this
+                many bytes, split at line boundaries, instead of being read into memory as a whole.
+                Each chunk is loaded by a separate request. Quoted values containing line breaks
+                are only kept in one piece if `quote` is specified.
+            concurrency:
+                The maximum number of chunks uploaded at the same time.
+            retries:
+                The number of times the upload of a chunk is retried if the connection to the
+                server could not be established. Other failures (e.g. a connection lost while the
+                chunk was being loaded, or an error returned by the server) are not retried, as
+                the chunk may have been loaded, at least partially, and loading it again could
+                duplicate data.
+            quote:
+                The quote character of the data (`'"'` for `QUOTE="double"` in the loading job,
+                `"'"` for `QUOTE="single"`). If specified, chunks are not split at line breaks
+                inside quoted values.
+            header:
+                Whether the first line of the file is a header (`HEADER="true"` in the loading
+                job). If `True` and the file is uploaded in chunks, the header line is sent at the
+                beginning of every chunk, so that the first data line of the chunks is not
+                dropped by the server.
+
+        Returns:
+            The loading statistics; or, if `chunkSize` is specified, a dictionary with the loading
+            statistics of the chunks merged (under the `"results"` key) and the list of chunks
+            failed even after the retries (under the `"failed_chunks"` key). Each failed chunk
+            is described by its position in the file (`"offset"` and `"size"`, in bytes) and the
+            exception raised (`"error"`).
 
         Endpoint:
             - `POST /ddl/{graph_name}`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_a_loading_job[Run a loading job]
         """
+        if chunkSize > 0:
+            try:
+                f = open(filePath, "rb")
+            except OSError:
+                return None
+            with f:
+                return self._runLoadingJobWithChunks(
+                    self._readFileChunks(f, chunkSize, eol, quote, header), fileTag, jobName,
+                    sep, eol,
+                    timeout, sizeLimit, concurrency, retries)
+
         try:
             data = open(filePath, 'rb').read()
             params = {
@@ -52,8 +109,411 @@ class pyTigerGraphLoading(pyTigerGraphBase):
                 params["eol"] = eol
         except:
             return None
+        data, headers = self._compressPayload(data,
+            {"RESPONSE-LIMIT": str(sizeLimit), "GSQL-TIMEOUT": str(timeout)})
         return self._post(self.restppUrl + "/ddl/" + self.graphname, params=params, data=data,
-            headers={"RESPONSE-LIMIT": str(sizeLimit), "GSQL-TIMEOUT": str(timeout)})
+            headers=headers)
+
+    def _readFileChunks(self, f, chunkSize: int, eol: str = None, quote: str = None,
+            header: bool = False) -> Iterator[tuple]:
+        """Reads a file in chunks ending at line boundaries.
+
+        Args:
+            f:
+                The file object (opened in binary mode).
+            chunkSize:
+                The approximate size of the chunks in bytes. A chunk is extended to the end of its
+                last line, so it may be longer.
+            eol:
+                End-of-line character(s). The default is `\\n`.
+            quote:
+                The quote character. If specified, line breaks preceded by an odd number of quote
+                characters in the chunk (i.e. inside a quoted value) do not end a chunk. (Escaped
+                quotes are doubled in CSV, so they do not change the parity.)
+            header:
+                If `True`, the first line of the file is a header, which is prepended to every
+                chunk.
+
+        Returns:
+            An iterator of `({"offset": <offset>, "size": <size>}, <data>)` tuples. The offset
+            and size refer to the part of the file in the chunk (without the repeated header).
+        """
+        # The last character is enough to find line endings (also for "\r\n")
+        sep = (eol or "\n").encode()[-1:]
+        quote = quote.encode() if quote else None
+        offset = 0
+        buf = b""
+        head = b""
+        if header:
+            while sep not in buf:
+                data = f.read(chunkSize)
+                if not data:
+                    break
+                buf += data
+            end = buf.find(sep)
+            if end >= 0:
+                head, buf = buf[:end + 1], buf[end + 1:]
+                offset = len(head)
+            else:
+                head, buf = buf, b""  # A file with a header line only
+        while True:
+            data = f.read(chunkSize)
+            if not data:
+                break
+            buf += data
+            end = buf.rfind(sep)
+            if quote is not None:
+                # Chunks start outside quotes, so the line breaks outside quotes are preceded by
+                # an even number of quotes
+                quotes = buf.count(quote, 0, end)
+                while end >= 0 and quotes % 2:
+                    prev = buf.rfind(sep, 0, end)
+                    quotes -= buf.count(quote, prev + 1, end)
+                    end = prev
+            if end < 0:
+                continue  # No complete line yet
+            chunk, buf = buf[:end + 1], buf[end + 1:]
+            yield {"offset": offset, "size": len(chunk)}, head + chunk
+            offset += len(chunk)
+        if buf:
+            yield {"offset": offset, "size": len(buf)}, head + buf
+
+    def _runLoadingJobWithChunks(self, chunks: Iterable, fileTag: str, jobName: str,
+            sep: str = None, eol: str = None, timeout: int = 16000, sizeLimit: int = 128000000,
+            concurrency: int = 1, retries: int = 0) -> dict:
+        """Runs a loading job with each chunk of data, uploading up to `concurrency` chunks at
+            the same time.
+
+        Args:
+            chunks:
+                An iterable of `(<description>, <data>)` tuples, where description is a dictionary
+                identifying the chunk in the failure report. Consumed lazily.
+
+        See `runLoadingJobWithFile()` for the description of the other arguments.
+
+        Returns:
+            The merged loading statistics and the list of failed chunks.
+        """
+        url = self.restppUrl + "/ddl/" + self.graphname
+        params = {
+            "tag": jobName,
+            "filename": fileTag,
+        }
+        if sep is not None:
+            params["sep"] = sep
+        if eol is not None:
+            params["eol"] = eol
+        headers = {"RESPONSE-LIMIT": str(sizeLimit), "GSQL-TIMEOUT": str(timeout)}
+
+        def loadChunk(chunk: tuple) -> dict:
+            data, _headers = self._compressPayload(chunk[1], headers)
+            for attempt in range(retries + 1):
+                try:
+                    return {"results": self._post(url, params=params, data=data,
+                        headers=_headers)}
+                except Exception as e:
+                    if attempt == retries or not self._isConnectError(e):
+                        return dict(chunk[0], error=e)
+                    time.sleep(attempt + 1)
+
+        ret = {"results": [], "failed_chunks": []}
+        for res in self._imapConcurrently(loadChunk, chunks, concurrency):
+            if "error" in res:
+                ret["failed_chunks"].append(res)
+            else:
+                ret["results"] = self._mergeLoadingStats(ret["results"], res["results"])
+        return ret
+
+    def _isConnectError(self, e: Exception) -> bool:
+        """Returns whether a request failed because the connection to the server could not be
+            established (i.e. the request was not sent, so it can be retried safely).
+        """
+        if isinstance(e, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(e, requests.exceptions.ConnectionError) and e.args:
+            # Failed connection attempts are wrapped in urllib3's MaxRetryError
+            return isinstance(getattr(e.args[0], "reason", e.args[0]), ConnectTimeoutError)
+        return False
+
+    def _mergeLoadingStats(self, stats1: list, stats2: list) -> list:
+        """Merges the loading statistics of two loading job runs.
+
+        Numbers are summed up; per-type statistics (lists of dictionaries identified by
+        `typeName`) and per-file statistics (identified by `sourceFileName`) are merged by name.
+
+        Args:
+            stats1:
+                The statistics of the first run (or an empty list).
+            stats2:
+                The statistics of the second run.
+
+        Returns:
+            The merged statistics.
+        """
+
+        def merge(a, b):
+            if isinstance(a, bool) or isinstance(b, bool):
+                return b
+            if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+                return a + b
+            if isinstance(a, dict) and isinstance(b, dict):
+                ret = dict(a)
+                for k, v in b.items():
+                    ret[k] = merge(a[k], v) if k in a else v
+                return ret
+            if isinstance(a, list) and isinstance(b, list):
+                return mergeList(a, b)
+            return a
+
+        def key(item):
+            if isinstance(item, dict):
+                return item.get("typeName", item.get("sourceFileName"))
+            return None
+
+        def mergeList(a, b):
+            ret = list(a)
+            index = {key(item): i for i, item in enumerate(ret) if key(item) is not None}
+            for item in b:
+                k = key(item)
+                if k is not None and k in index:
+                    ret[index[k]] = merge(ret[index[k]], item)
+                else:
+                    if k is not None:
+                        index[k] = len(ret)
+                    ret.append(item)
+            return ret
+
+        return mergeList(stats1, stats2)
+
+    def runLoadingJobWithDataFrame(self, data: Union['pd.DataFrame', object, Iterable],
+            fileTag: str, jobName: str, sep: str = None, eol: str = None, timeout: int = 16000,
+            sizeLimit: int = 128000000, columns: list = None, batchSize: int = 10000,
+            concurrency: int = 1, retries: int = 0) -> dict:
+        """Execute a loading job with data from memory.
+
+        The data is converted to CSV in batches of rows, and each batch is uploaded to the
+        TigerGraph server as the content of the file referenced by `fileTag`, without writing it
+        to disk. No header row is sent, so the loading job should refer to the columns by their
+        position (`$0`, `$1`, …). Missing values (`None`, `NaN`) are sent as empty values.
+
+        Args:
+            data:
+                A Pandas DataFrame, a PyArrow Table or an iterable of rows (sequences of values,
+                e.g. tuples returned by a database cursor). An iterable is consumed lazily.
+            fileTag:
+                The name of file variable in the loading job (DEFINE FILENAME <fileTag>).
+            jobName:
+                The name of the loading job.
+            sep:
+                Data value separator. The default separator is a comma `,`.
+            eol:
+                End-of-line character. The default value is `\\n`.
+            timeout:
+                Timeout in seconds. If set to `0`, use the system-wide endpoint timeout setting.
+            sizeLimit:
+                Maximum size for input file in bytes.
+            columns:
+                The columns of the DataFrame or Table to be sent, in this order. By default, all
+                columns are sent.
+            batchSize:
+                The number of rows uploaded in one request.
+            concurrency:
+                The maximum number of batches uploaded at the same time.
+            retries:
+                The number of times the upload of a batch is retried if the connection to the
+                server could not be established; see `runLoadingJobWithFile()`.
+
+        Returns:
+            A dictionary with the loading statistics of the batches merged (under the `"results"`
+            key) and the list of batches failed even after the retries (under the
+            `"failed_chunks"` key). Each failed batch is described by its position in the data
+            (`"offset"` and `"rows"`, in rows) and the exception raised (`"error"`).
+
+        Endpoint:
+            - `POST /ddl/{graph_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_a_loading_job[Run a loading job]
+        """
+        return self._runLoadingJobWithChunks(
+            self._csvChunks(data, columns, sep or ",", eol or "\n", batchSize), fileTag, jobName,
+            sep, eol, timeout, sizeLimit, concurrency, retries)
+
+    def _csvChunks(self, data: Union['pd.DataFrame', object, Iterable], columns: list,
+            sep: str, eol: str, batchSize: int) -> Iterator[tuple]:
+        """Converts data to CSV in batches of rows.
+
+        See `runLoadingJobWithDataFrame()` for the description of the arguments.
+
+        Returns:
+            An iterator of `({"offset": <first_row>, "rows": <rows>}, <data>)` tuples.
+        """
+        if hasattr(data, "to_pandas") and hasattr(data, "slice"):  # PyArrow Table
+            if columns is not None:
+                data = data.select(columns)
+            for i in range(0, data.num_rows, batchSize):
+                df = data.slice(i, batchSize).to_pandas()
+                yield {"offset": i, "rows": len(df)}, self._dataFrameToCsv(df, sep, eol)
+        elif hasattr(data, "to_csv") and hasattr(data, "iloc"):  # Pandas DataFrame
+            for i in range(0, len(data), batchSize):
+                df = data.iloc[i:i + batchSize]
+                if columns is not None:
+                    df = df[columns]
+                yield {"offset": i, "rows": len(df)}, self._dataFrameToCsv(df, sep, eol)
+        else:
+            offset = 0
+            buf = io.StringIO()
+            writer = csv.writer(buf, delimiter=sep, lineterminator=eol)
+            rows = 0
+            for row in data:
+                # Missing values are written as empty values, as by `DataFrame.to_csv()`
+                writer.writerow(["" if isinstance(v, float) and math.isnan(v) else v
+                    for v in row])
+                rows += 1
+                if rows == batchSize:
+                    yield {"offset": offset, "rows": rows}, buf.getvalue().encode()
+                    offset += rows
+                    rows = 0
+                    buf.seek(0)
+                    buf.truncate()
+            if rows:
+                yield {"offset": offset, "rows": rows}, buf.getvalue().encode()
+
+    def _dataFrameToCsv(self, df: 'pd.DataFrame', sep: str, eol: str) -> bytes:
+        """Converts a DataFrame to CSV (without header and index).
+
+        Args:
+            df:
+                The DataFrame to convert.
+            sep:
+                Data value separator.
+            eol:
+                End-of-line character.
+
+        Returns:
+            The CSV document.
+        """
+        try:
+            ret = df.to_csv(sep=sep, lineterminator=eol, header=False, index=False)
+        except TypeError:
+            # pandas < 1.5
+            ret = df.to_csv(sep=sep, line_terminator=eol, header=False, index=False)
+        return ret.encode()
+
+    def runLoadingJobWithFiles(self, files: Union[dict, list, str], jobName: str,
+            fileTag: str = None, sep: str = None, eol: str = None, timeout: int = 16000,
+            sizeLimit: int = 128000000, concurrency: int = 4, chunkSize: int = 0,
+            retries: int = 0, quote: str = None, header: bool = False) -> dict:
+        """Execute a loading job with multiple files, loading several files at the same time.
+
+        Args:
+            files:
+                The files to load; either a dictionary in the form of `{<file_path>: <file_tag>}`,
+                or a list of `(<file_path>, <file_tag>)` tuples, or a list of file paths, or a
+                single file path (when `fileTag` is specified). File paths may contain wildcards
+                (see `glob.glob()`).
+            jobName:
+                The name of the loading job.
+            fileTag:
+                The name of file variable in the loading job used for files without a tag.
+            sep:
+                Data value separator. If your data is JSON, you do not need to specify this
+                parameter. The default separator is a comma `,`.
+            eol:
+                End-of-line character. Only one or two characters are allowed, except for the
+                special case `\\r\\n`. The default value is `\\n`
+            timeout:
+                Timeout in seconds. If set to `0`, use the system-wide endpoint timeout setting.
+            sizeLimit:
+                Maximum size for input file in bytes.
+            concurrency:
+                The maximum number of files loaded at the same time.
+            chunkSize:
+                If greater than `0`, the files are uploaded in chunks; see `runLoadingJobWithFile()`.
+            retries:
+                The number of times the upload of a chunk is retried if the connection to the
+                server could not be established (if `chunkSize` is specified); see
+                `runLoadingJobWithFile()`.
+            quote:
+                The quote character of the data; see `runLoadingJobWithFile()`.
+            header:
+                Whether the first line of the files is a header; see `runLoadingJobWithFile()`.
+
+        Returns:
+            A dictionary with the following keys:
+            - `files`: The list of per-file reports, each with the `file` path, the `fileTag`,
+              the loading statistics (`results`), the number of `bytes` and `rows` (valid lines)
+              loaded, the duration in `seconds`, `rows_per_sec` and `bytes_per_sec`, and the
+              failed chunks (`failed_chunks`) or the exception raised (`error`), if any.
+            - `results`: The loading statistics of all files, one entry per file. The server
+              reports every uploaded file as `Online_POST`, so `sourceFileName` is replaced by
+              the path of the file (in the per-file reports, too).
+            - `bytes`, `rows`, `seconds`, `rows_per_sec`, `bytes_per_sec`: The totals, measured
+              over the whole run.
+            - `failed_files`: The list of the reports of files that could not be (completely)
+              loaded.
+
+        Endpoint:
+            - `POST /ddl/{graph_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_a_loading_job[Run a loading job]
+        """
+        if isinstance(files, str):
+            files = [files]
+        if isinstance(files, dict):
+            files = list(files.items())
+        jobs = []
+        for f in files:
+            path, tag = f if isinstance(f, tuple) else (f, fileTag)
+            if tag is None:
+                raise TigerGraphException("No file tag was specified for {}.".format(path), None)
+            paths = sorted(glob.glob(path)) if glob.has_magic(path) else [path]
+            jobs += [(p, tag) for p in paths]
+
+        def loadFile(job: tuple) -> dict:
+            path, tag = job
+            report = {"file": path, "fileTag": tag, "results": [], "bytes": 0, "rows": 0}
+            start = time.monotonic()
+            try:
+                res = self.runLoadingJobWithFile(path, tag, jobName, sep, eol, timeout,
+                    sizeLimit, chunkSize, 1, retries, quote, header)
+                if res is None:
+                    raise TigerGraphException("File {} could not be read.".format(path), None)
+                if chunkSize > 0:
+                    report["results"] = res["results"]
+                    if res["failed_chunks"]:
+                        report["failed_chunks"] = res["failed_chunks"]
+                else:
+                    report["results"] = res
+                report["results"] = [dict(r, sourceFileName=path)
+                    if isinstance(r, dict) and "sourceFileName" in r else r
+                    for r in report["results"]]
+                report["bytes"] = os.path.getsize(path)
+                report["rows"] = sum(r.get("statistics", {}).get("validLine", 0)
+                    for r in report["results"] if isinstance(r, dict))
+            except Exception as e:
+                report["error"] = e
+            report["seconds"] = time.monotonic() - start
+            report["rows_per_sec"] = self._rate(report["rows"], report["seconds"])
+            report["bytes_per_sec"] = self._rate(report["bytes"], report["seconds"])
+            return report
+
+        start = time.monotonic()
+        reports = self._mapConcurrently(loadFile, jobs, concurrency)
+        seconds = time.monotonic() - start
+
+        ret = {"files": reports, "results": [], "bytes": 0, "rows": 0, "seconds": seconds,
+            "failed_files": []}
+        for r in reports:
+            ret["results"] = self._mergeLoadingStats(ret["results"], r["results"])
+            ret["bytes"] += r["bytes"]
+            ret["rows"] += r["rows"]
+            if "error" in r or "failed_chunks" in r:
+                ret["failed_files"].append(r)
+        ret["rows_per_sec"] = self._rate(ret["rows"], seconds)
+        ret["bytes_per_sec"] = self._rate(ret["bytes"], seconds)
+        return ret
+
+    def _rate(self, amount: int, seconds: float) -> float:
+        """Returns the throughput (amount per second), or `0` if no time was measured."""
+        return amount / seconds if seconds > 0 else 0.0
 
     def uploadFile(self, filePath, fileTag, jobName="", sep=None, eol=None, timeout=16000,
             sizeLimit=128000000) -> dict:
@@ -4,10 +4,10 @@ The functions on this page find paths between vertices within the graph.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object]. 
 """
 
-import json
 from typing import Union
 
 from pyTigerGraph.pyTigerGraphBase import pyTigerGraphBase
+from pyTigerGraph.pyTigerGraphJSON import dumps
 
 
 class pyTigerGraphPath(pyTigerGraphBase):
@@ -112,7 +112,7 @@ class pyTigerGraphPath(pyTigerGraphBase):
         if allShortestPaths:
             data["allShortestPaths"] = True
 
-        return json.dumps(data)
+        return dumps(data)
 
     def shortestPath(self, sourceVertices: Union[dict, tuple, list],
             targetVertices: Union[dict, tuple, list], maxLength: int = None,
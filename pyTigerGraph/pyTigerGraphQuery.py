@@ -3,22 +3,28 @@
 The functions on this page run installed or interpret queries in TigerGraph.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object]. 
 """
-import json
+import operator
+import re
 from datetime import datetime
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Callable, Iterator, Union
 
 if TYPE_CHECKING:
     import pandas as pd
 
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraph.pyTigerGraphGSQL import pyTigerGraphGSQL
+from pyTigerGraph.pyTigerGraphJSON import dumps
 from pyTigerGraph.pyTigerGraphSchema import pyTigerGraphSchema
 from pyTigerGraph.pyTigerGraphUtils import pyTigerGraphUtils
 
+# The names of the queries installed by pyTigerGraph start with this prefix
+HELPER_QUERY_PREFIX = "pyTG_"
 
-class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
+class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL):
     # TODO getQueries()  # List _all_ query names
-    def getInstalledQueries(self, fmt: str = "py") -> Union[dict, str, 'pd.DataFrame']:
+    def getInstalledQueries(self, fmt: str = "py",
+            force: bool = False) -> Union[dict, str, 'pd.DataFrame']:
         """Returns a list of installed queries.
 
         Args:
@@ -27,6 +33,10 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
                 - "py":   Python objects (default)
                 - "json": JSON document
                 - "df":   pandas DataFrame
+            force:
+                If `True`, retrieves the list again even if it is in the metadata cache (see the
+                `metadataCache` argument of the constructor). Queries installed by other clients
+                since the list was cached are only returned this way.
 
         Returns:
             The names of the installed queries.
@@ -35,9 +45,15 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
              Modify to return only installed ones
         TODO Return with query name as key rather than REST endpoint as key?
         """
-        ret = self.getEndpoints(dynamic=True)
+        ret = None
+        if self.metadataCache and not force:
+            ret = self._getMetadataCache().get("queries")
+        if ret is None:
+            ret = self.getEndpoints(dynamic=True)
+            if self.metadataCache:
+                self._updateMetadataCache("queries", ret)
         if fmt == "json":
-            return json.dumps(ret)
+            return dumps(ret)
         if fmt == "df":
             try:
                 import pandas as pd
@@ -47,6 +63,110 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
             return pd.DataFrame(ret).T
         return ret
 
+    def _installHelperQuery(self, queryName: str, queryText: str) -> str:
+        """Creates and installs a query used internally by pyTigerGraph, unless it is already
+            installed.
+
+        Args:
+            queryName:
+                The name of the query.
+            queryText:
+                The `CREATE QUERY` statement of the query. `$graphname` is replaced by the name of
+                the graph.
+
+        Returns:
+            The name of the query.
+
+        Raises:
+            `TigerGraphException` if the query could not be installed.
+        """
+        if queryName in self._helperQueries:
+            return queryName
+        endpoint = "GET /query/" + self.graphname + "/" + queryName
+        installed = self.getInstalledQueries()
+        if endpoint not in installed and self.metadataCache:
+            installed = self.getInstalledQueries(force=True)  # The cached list may be outdated
+        if endpoint not in installed:
+            res = self.gsql("USE GRAPH {}\n{}\nINSTALL QUERY {}".format(self.graphname,
+                queryText.replace("$graphname", self.graphname), queryName))
+            # The output of GSQL differs between versions, so the result is checked in the list
+            # of installed queries (which also updates the metadata cache)
+            if endpoint not in self.getInstalledQueries(force=True):
+                raise TigerGraphException(
+                    "Helper query {} could not be installed: {}".format(queryName, res), None)
+        self._helperQueries.add(queryName)
+        return queryName
+
+    def dropHelperQueries(self) -> list:
+        """Drops the queries installed by pyTigerGraph (e.g. by `iterVertices()` and
+            `getVerticesById()`) in the graph.
+
+        The queries are installed again when needed. Their names start with `pyTG_`.
+
+        Returns:
+            The names of the dropped queries.
+
+        Raises:
+            `TigerGraphException` if a query could not be dropped.
+        """
+        prefix = "GET /query/" + self.graphname + "/"
+        names = [e[len(prefix):] for e in self.getInstalledQueries(force=True)
+            if e.startswith(prefix + HELPER_QUERY_PREFIX)]
+        self._helperQueries.clear()
+        if not names:
+            return []
+        res = self.gsql("USE GRAPH {}\nDROP QUERY {}".format(self.graphname, ", ".join(names)))
+        remaining = self.getInstalledQueries(force=True)
+        failed = [n for n in names if prefix + n in remaining]
+        if failed:
+            raise TigerGraphException("Helper queries {} could not be dropped: {}".format(
+                ", ".join(failed), res), None)
+        return names
+
+    def _filterToPredicate(self, where: str) -> Callable:
+        """Converts a REST++ filter to a function evaluating it on the client.
+
+        Args:
+            where:
+                Comma separated list of conditions in the format accepted by the `filter` parameter
+                of REST++ endpoints (e.g. `a01>1,name="Alice"`). Quoted values are compared as
+                strings (also `DATETIME` values, which compare correctly as strings), others as
+                numbers or booleans (`true` and `false`).
+
+        Returns:
+            A function returning whether a dictionary of attributes meets all the conditions.
+            Conditions comparing values of incompatible types are not met.
+
+        Raises:
+            `TigerGraphException` if a condition cannot be parsed.
+        """
+        ops = {"=": operator.eq, "!=": operator.ne, ">": operator.gt, ">=": operator.ge,
+            "<": operator.lt, "<=": operator.le}
+        conds = []
+        for c in re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', where):
+            m = re.match(r'^\s*(\w+)\s*(>=|<=|!=|=|>|<)\s*(.+?)\s*$', c)
+            if not m:
+                raise TigerGraphException("Invalid condition: {}".format(c), None)
+            attr, op, value = m.groups()
+            if len(value) >= 2 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            elif value in ("true", "false"):
+                value = value == "true"
+            else:
+                try:
+                    value = float(value) if re.search(r"[.eE]", value) else int(value)
+                except ValueError:
+                    pass  # Unquoted string
+            conds.append((attr, ops[op], value))
+
+        def predicate(attributes: dict) -> bool:
+            try:
+                return all(op(attributes[attr], value) for attr, op, value in conds)
+            except (KeyError, TypeError):
+                return False
+
+        return predicate
+
     # TODO getQueryMetadata()
     #   GET /gsqlserver/gsql/queryinfo
     #   xref:tigergraph-server:API:built-in-endpoints.adoc#get-query-metadata[Get query metadata]
@@ -101,7 +221,8 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
         return ret[:-1]
 
     def runInstalledQuery(self, queryName: str, params: Union[str, dict] = None,
-            timeout: int = None, sizeLimit: int = None, usePost: bool = False) -> list:
+            timeout: int = None, sizeLimit: int = None, usePost: bool = False,
+            fmt: str = "py", streamKey: str = None) -> Union[list, bytes, Iterator]:
         """Runs an installed query.
 
         The query must be already created and installed in the graph.
@@ -123,11 +244,27 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
             usePost:
                 The RESTPP accepts a maximum URL length of 8192 characters. Use POST if additional parameters cause
                 you to exceed this limit.
+            fmt:
+                Format of the results:
+                - "py":   Python objects
+                - "raw":  The complete, undecoded response of the endpoint (bytes). Useful when the
+                    output is passed on unchanged, or parsed by a different tool.
+                - "stream": An iterator of the output elements (Python objects), or of the items
+                    of the output element specified by `streamKey`, parsed incrementally as they
+                    are consumed. Requires the `ijson` package.
+            streamKey:
+                (When the output format is "stream") the key of the output element (e.g. the name
+                of the vertex set in a `PRINT` statement) whose items (e.g. vertices) should be
+                returned one by one. The key is looked up in each output element that has it.
 
         Returns:
             The output of the query, a list of output elements (vertex sets, edge sets, variables,
             accumulators, etc.
 
+            If the output format is "stream", the elements (or the items of the `streamKey` output
+            element) are returned as an iterator. The response is read while the iterator is
+            consumed, so the size of the output does not limit the memory available.
+
         Notes:
             When specifying parameter values in a dictionary:
 
@@ -154,6 +291,27 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
         TODO Specify thread limit: GSQL-THREAD-LIMIT
         TODO Detached mode
         """
+        url, params, headers = self._prepRunInstalledQuery(queryName, params, timeout, sizeLimit)
+
+        if fmt == "stream":
+            prefix = "results.item" + ("." + streamKey + ".item" if streamKey else "")
+            if usePost:
+                return self._reqStream("POST", url, prefix, headers=headers, data=params)
+            return self._reqStream("GET", url, prefix, headers=headers, params=params)
+        if usePost:
+            return self._post(url, data=params, headers=headers, raw=fmt == "raw")
+        else:
+            return self._get(url, params=params, headers=headers, raw=fmt == "raw")
+
+    def _prepRunInstalledQuery(self, queryName: str, params: Union[str, dict] = None,
+            timeout: int = None, sizeLimit: int = None) -> tuple:
+        """Builds the URL, parameters and headers of `runInstalledQuery()`.
+
+        See `runInstalledQuery()` for the description of the arguments.
+
+        Returns:
+            A tuple of `(<url>, <params>, <headers>)`.
+        """
         headers = {}
         if timeout and timeout > 0:
             headers["GSQL-TIMEOUT"] = str(timeout)
@@ -163,12 +321,7 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
         if isinstance(params, dict):
             params = self._parseQueryParameters(params)
 
-        if usePost:
-            return self._post(self.restppUrl + "/query/" + self.graphname + "/" + queryName,
-                data=params, headers=headers)
-        else:
-            return self._get(self.restppUrl + "/query/" + self.graphname + "/" + queryName,
-                params=params, headers=headers)
+        return self.restppUrl + "/query/" + self.graphname + "/" + queryName, params, headers
 
     # TODO checkQueryStatus()
     #   GET /query_status/{graph_name}
@@ -178,7 +331,8 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
     #   GET /query_result/{requestid}
     #   xref:tigergraph-server:API:built-in-endpoints.adoc#_check_query_results_detached_mode[Check query results (detached mode)]
 
-    def runInterpretedQuery(self, queryText: str, params: Union[str, dict] = None) -> list:
+    def runInterpretedQuery(self, queryText: str, params: Union[str, dict] = None,
+            fmt: str = "py") -> Union[list, bytes]:
         """Runs an interpreted query.
 
         Use ``$graphname`` or ``@graphname@`` in the ``FOR GRAPH`` clause to avoid hardcoding the
@@ -198,6 +352,10 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
             params:
                 A string of `param1=value1&param2=value2...` format or a dictionary.
                 See below for special rules for dictionaries.
+            fmt:
+                Format of the results:
+                - "py":   Python objects
+                - "raw":  The complete, undecoded response of the endpoint (bytes)
 
         Returns:
             The output of the query, a list of output elements such as vertex sets, edge sets, variables and
@@ -232,7 +390,7 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema):
         if isinstance(params, dict):
             params = self._parseQueryParameters(params)
         return self._post(self.gsUrl + "/gsqlserver/interpreted_query", data=queryText,
-            params=params, authMode="pwd")
+            params=params, authMode="pwd", raw=fmt == "raw")
 
     # TODO getRunningQueries()
     # GET /showprocesslist/{graph_name}
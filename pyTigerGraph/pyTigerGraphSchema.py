@@ -3,11 +3,71 @@
 The functions in this page retrieve information about the graph schema.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object]. 
 """
-import json
+import hashlib
+import os
 import re
-from typing import Union
+import tempfile
+import time
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+
+import requests
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 from pyTigerGraph.pyTigerGraphBase import pyTigerGraphBase
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraph.pyTigerGraphJSON import dumpb, loads
+from pyTigerGraph.pyTigerGraphWriter import GraphWriter
+
+STREAM_BATCH_SIZE = 1000
+"""The default batch size used when upserting from a generator or other non-list iterable."""
+MAX_ITER_PARTITIONS = 100
+"""The default maximum number of partitions of `iterVertices()` and `iterEdgesByType()`; the
+server scans the vertices for each partition."""
+
+
+def _add(a, b):
+    return a + b
+
+
+def _and(a, b):
+    return a & b
+
+
+def _or(a, b):
+    return a | b
+
+
+def _first(a, b):
+    return a
+
+
+UPSERT_OPERATORS = {
+    "+": _add, "add": _add,
+    "max": max, ">": max,
+    "min": min, "<": min,
+    "and": _and, "&": _and,
+    "or": _or, "|": _or,
+    "ignore_if_exists": _first, "~": _first
+}
+"""Commutative upsert operators (and their aliases) and the functions combining two values
+updated with them; used to coalesce repeated updates of the same vertex or edge in a batch."""
+
+ATTRIBUTE_DTYPES = {
+    "INT": "int64",
+    "UINT": "uint64",
+    "FLOAT": "float64",
+    "DOUBLE": "float64",
+    "BOOL": "bool"
+}
+"""The numpy data types of the attribute types with a fixed size representation."""
+
+NULLABLE_DTYPES = {"i": "Int64", "u": "UInt64", "b": "boolean"}
+"""The pandas data types of integer and boolean columns with missing values, by numpy dtype kind."""
 
 
 class pyTigerGraphSchema(pyTigerGraphBase):
@@ -54,6 +114,60 @@ class pyTigerGraphSchema(pyTigerGraphBase):
                 vals[attr] = {"value": val}
         return vals
 
+    def _upsertAttrsFromDataFrame(self, df: 'pd.DataFrame', attributes: dict = None,
+            ops: dict = None, skipNA: bool = False) -> list:
+        """Transforms the columns of a DataFrame into a list of attribute hierarchies as expected by
+            the upsert functions (see `_upsertAttrs()`), one per row.
+
+        The conversion works on whole columns rather than on individual rows.
+
+        Args:
+            df:
+                The DataFrame to transform.
+            attributes:
+                A dictionary in the form of `{target: source}` where source is the column name in
+                the dataframe and target is the attribute name. When omitted, all columns are used
+                with their current names.
+            ops:
+                A dictionary in the form of `{target: operator}` specifying the operator applied
+                to the attribute by the upsert.
+            skipNA:
+                If `True`, missing (`NaN`, `None`, `NaT`) values are left out, so that the
+                attribute keeps its current value. Otherwise they are sent as `null`.
+
+        Returns:
+            A list of dictionaries in this format:
+                {
+                    <attribute_name>: {"value": <attribute_value>},
+                    <attribute_name>: {"value": <attribute_value>, "op": <operator>}
+                }
+
+        Documentation:
+            xref:tigergraph-server:API:built-in-endpoints.adoc#operation-codes[Operation codes]
+        """
+        if attributes is None:
+            attributes = {c: c for c in df.columns}
+        if not ops:
+            ops = {}
+        names = list(attributes)
+        cols = []
+        for target in names:
+            col = df[attributes[target]]
+            if col.dtype.kind == "M":  # datetime64
+                col = col.dt.strftime("%Y-%m-%d %H:%M:%S")
+            values = col.astype(object).where(col.notna(), None).tolist()
+            op = ops.get(target)
+            if op:
+                cols.append([None if v is None and skipNA else {"value": v, "op": op}
+                    for v in values])
+            else:
+                cols.append([None if v is None and skipNA else {"value": v} for v in values])
+        if skipNA:
+            return [{n: v for n, v in zip(names, row) if v is not None} for row in zip(*cols)]
+        if not cols:
+            return [{} for _ in range(len(df.index))]
+        return [dict(zip(names, row)) for row in zip(*cols)]
+
     def getSchema(self, udts: bool = True, force: bool = False) -> dict:
         """Retrieves the schema metadata (of all vertex and edge type and, if not disabled, the
             User-Defined Type details) of the graph.
@@ -72,16 +186,322 @@ class pyTigerGraphSchema(pyTigerGraphBase):
             - `GET /gsqlserver/gsql/schema`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_show_graph_schema_metadata[Show graph schema metadata]
         """
+        if not self.schema and not force and self.metadataCache:
+            self.schema = self._getMetadataCache().get("schema")
+        fetched = False
         if not self.schema or force:
             self.schema = self._get(self.gsUrl + "/gsqlserver/gsql/schema?graph=" + self.graphname,
                 authMode="pwd")
+            fetched = True
         if udts and ("UDTs" not in self.schema or force):
             self.schema["UDTs"] = self._getUDTs()
+            fetched = True
+        if fetched and self.metadataCache:
+            self._updateMetadataCache("schema", self.schema)
         return self.schema
 
+    def _getMetadataCache(self) -> dict:
+        """Returns the metadata of the graph cached on disk (see the `metadataCache` argument of
+            the constructor).
+
+        The cache file is read and validated once per connection: it is discarded if it is older
+        than `metadataCacheTTL` or was written for a different server version. The server version
+        does not change with the schema, so the TTL is what limits the staleness of the cache.
+        If the server version cannot be retrieved, the cache is not used (the metadata is
+        retrieved as if it was not cached).
+
+        Returns:
+            The cached metadata; a dictionary with (some of) the `schema` and `queries` keys.
+        """
+        if self._metadataCacheEntry is not None:
+            return self._metadataCacheEntry
+
+        try:
+            with open(self._metadataCachePath(), "rb") as f:
+                entry = loads(f.read())
+        except (OSError, ValueError):
+            entry = {}
+
+        _headers, _, verify = self._prepReq("GET")
+        try:
+            res = self._getSession(self.restppUrl).request("GET",
+                self.restppUrl + "/version/" + self.graphname, headers=_headers, verify=verify)
+            version = hashlib.sha1(res.content).hexdigest() if res.ok else None
+        except requests.exceptions.RequestException:
+            version = None
+
+        if version is None or entry.get("version") != version or \
+                time.time() - entry.get("time", 0) > self.metadataCacheTTL:
+            entry = {"version": version, "time": time.time()}
+        self._metadataCacheEntry = entry
+        return entry
+
+    def _updateMetadataCache(self, key: str, value: object):
+        """Stores an item of the metadata of the graph in the disk cache.
+
+        Args:
+            key:
+                `"schema"` or `"queries"`.
+            value:
+                The metadata to be stored, or `None` to remove the item.
+        """
+        entry = self._getMetadataCache()
+        if value is None:
+            entry.pop(key, None)
+        else:
+            entry[key] = value
+        os.makedirs(self.metadataCache, exist_ok=True)
+        path = self._metadataCachePath()
+        # A unique temporary file, so that threads and processes do not write the same one
+        fd, tmp = tempfile.mkstemp(dir=self.metadataCache, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumpb(entry))
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def _metadataCachePath(self) -> str:
+        """Returns the path of the metadata cache file of the graph."""
+        key = "|".join([self.host, str(self.restppPort), str(self.gsPort), self.graphname])
+        return os.path.join(self.metadataCache,
+            "pyTG_" + hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def _getSchemaIndex(self, force: bool = False) -> dict:
+        """Returns the lookup tables of the schema, built when the schema is (re)fetched.
+
+        Args:
+            force:
+                If `True`, retrieves the schema metadata again.
+
+        Returns:
+            A dictionary of dictionaries, each keyed by vertex or edge type name:
+            - `VertexTypes`, `EdgeTypes`: The metadata of the type, as in the schema.
+            - `AttributeTypes`: A dictionary with `VertexTypes` and `EdgeTypes` keys, each a
+              dictionary of type names and `<attribute_name>: <attribute_type_name>` pairs.
+            - `SourceVertexTypes`, `TargetVertexTypes`: The source and target vertex types of
+              edge types, as returned by `getEdgeSourceVertexType()` and
+              `getEdgeTargetVertexType()`.
+            - `ReverseEdges`: The reverse edges of edge types that have one.
+        """
+        schema = self.getSchema(udts=False, force=force)
+        index = self._schemaIndex
+        if index is not None and index["schema"] is schema:
+            return index
+
+        index = {
+            "schema": schema,
+            "VertexTypes": {vt["Name"]: vt for vt in schema["VertexTypes"]},
+            "EdgeTypes": {et["Name"]: et for et in schema["EdgeTypes"]},
+            "AttributeTypes": {},
+            "SourceVertexTypes": {},
+            "TargetVertexTypes": {},
+            "ReverseEdges": {}
+        }
+        for elementTypes in ("VertexTypes", "EdgeTypes"):
+            index["AttributeTypes"][elementTypes] = {
+                t["Name"]: {a["AttributeName"]: a["AttributeType"]["Name"]
+                    for a in t["Attributes"]}
+                for t in schema[elementTypes]
+            }
+        for name, et in index["EdgeTypes"].items():
+            for key, end, pairKey in (("SourceVertexTypes", "FromVertexTypeName", "From"),
+                    ("TargetVertexTypes", "ToVertexTypeName", "To")):
+                if et[end] != "*":
+                    # Edge type with a single source/target vertex type
+                    index[key][name] = et[end]
+                elif "EdgePairs" in et:
+                    # v3.0 and later notation
+                    index[key][name] = {ep[pairKey] for ep in et["EdgePairs"]}
+                else:
+                    # 2.6.1 and earlier notation
+                    index[key][name] = "*"
+            if et["IsDirected"] and "REVERSE_EDGE" in et.get("Config", {}):
+                index["ReverseEdges"][name] = et["Config"]["REVERSE_EDGE"]
+        self._schemaIndex = index
+        return index
+
+    def _getAttributeTypes(self, elementTypes: str, typeName: str) -> dict:
+        """Returns the types of the attributes of a vertex or edge type, if the schema has
+            already been fetched. This function does not send requests to the server.
+
+        Args:
+            elementTypes:
+                `"VertexTypes"` or `"EdgeTypes"`.
+            typeName:
+                The name of the vertex or edge type.
+
+        Returns:
+            A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+            `"DATETIME"`, `"LIST"`), or an empty dictionary if the type is not in the schema or
+            the schema has not been fetched.
+        """
+        if not self.schema:
+            return {}
+        return self._getSchemaIndex()["AttributeTypes"][elementTypes].get(typeName, {})
+
+    def _elementSetToNumpy(self, elementSet: list, elementTypes: str, columns: list,
+            typeColumn: str, types: dict = None) -> dict:
+        """Converts a vertex or edge set to numpy arrays, in a single pass per column.
+
+        The columns of attributes whose type is known (from the `types` argument or from the
+        schema, if it has already been fetched) are created with the corresponding data type:
+        - `INT`, `UINT`, `FLOAT`, `DOUBLE` and `BOOL` as arrays of the numpy data type (masked
+          arrays if values are missing),
+        - `DATETIME` as `datetime64[s]`,
+        - all other types (e.g. strings and collections) as objects.
+        The data type of other columns (e.g. accumulators printed by queries) is inferred by numpy
+        if all their values are of the same scalar type; otherwise they are objects.
+        The schema is not fetched by this function, so the conversion does not send requests to
+        the server.
+
+        Args:
+            elementSet:
+                The vertex or edge set as returned by an endpoint or query.
+            elementTypes:
+                `"VertexTypes"` or `"EdgeTypes"`.
+            columns:
+                The (non-attribute) keys of the elements to be included as columns, before the
+                attributes.
+            typeColumn:
+                The key of the vertex or edge type of the elements, used to look up the attribute
+                types.
+            types:
+                A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+                `"DATETIME"`), overriding the attribute types in the schema.
+
+        Returns:
+            A dictionary of `<column_name>: <array>` pairs.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required to use this function. "
+                "Download numpy using 'pip install numpy'.")
+        n = len(elementSet)
+        data = {}
+        for c in columns:
+            data[c] = np.fromiter(map(itemgetter(c), elementSet), object, count=n)
+        if not n:
+            return data
+
+        try:
+            attrs = list(map(itemgetter("attributes"), elementSet))
+        except KeyError:
+            attrs = [e.get("attributes", {}) for e in elementSet]
+        elementTypeNames = set(map(itemgetter(typeColumn), elementSet))
+        if len(elementTypeNames) == 1 and len(set(map(len, attrs))) == 1:
+            # Elements of the same type have the same attributes
+            names = attrs[0]
+        else:
+            names = dict.fromkeys(chain.from_iterable(attrs))
+        attrTypes = {}
+        for t in elementTypeNames:
+            attrTypes.update(self._getAttributeTypes(elementTypes, t))
+        if types:
+            attrTypes.update(types)
+
+        for name in names:
+            typ = attrTypes.get(name)
+            if typ in ATTRIBUTE_DTYPES:
+                try:
+                    values = map(itemgetter(name), attrs)
+                    if typ == "BOOL":
+                        # Unlike the numeric conversions, the conversion to bool accepts nulls
+                        values = list(values)
+                        if None in values:
+                            raise TypeError
+                    data[name] = np.fromiter(values, ATTRIBUTE_DTYPES[typ], count=n)
+                    continue
+                except (KeyError, TypeError, ValueError):
+                    pass  # Missing or null values; fall back to a masked array
+            try:
+                values = list(map(itemgetter(name), attrs))
+            except KeyError:
+                values = [a.get(name) for a in attrs]
+            if typ in ATTRIBUTE_DTYPES:
+                mask = np.fromiter((v is None for v in values), bool, count=n)
+                data[name] = np.ma.masked_array(
+                    np.array([0 if v is None else v for v in values], ATTRIBUTE_DTYPES[typ]),
+                    mask)
+            elif typ == "DATETIME":
+                data[name] = np.array(values, "datetime64[s]")
+            elif typ is None and len(set(map(type, values))) == 1 and \
+                    isinstance(values[0], (bool, int, float, str)):
+                data[name] = np.array(values)
+            else:
+                # Mixed or nested values are kept as they are
+                data[name] = np.fromiter(values, object, count=n)
+        return data
+
+    def _elementSetToDataFrame(self, elementSet: list, elementTypes: str, columns: list,
+            typeColumn: str, types: dict = None) -> 'pd.DataFrame':
+        """Converts a vertex or edge set to pandas DataFrame.
+
+        The columns are built by `_elementSetToNumpy()`; masked arrays are converted to pandas
+        nullable data types, and type columns (`v_type`, `e_type`, `from_type` and `to_type`)
+        are categorical.
+
+        See `_elementSetToNumpy()` for the description of the arguments.
+
+        Returns:
+            The DataFrame.
+        """
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError:
+            raise ImportError("Pandas is required to use this function. "
+                "Download pandas using 'pip install pandas'.")
+        data = self._elementSetToNumpy(elementSet, elementTypes, columns, typeColumn, types)
+        for name, col in data.items():
+            if name.endswith("_type") and name in columns:
+                codes, categories = pd.factorize(col)
+                data[name] = pd.Categorical.from_codes(codes, categories)
+            elif isinstance(col, np.ma.MaskedArray):
+                if col.dtype.kind == "f":
+                    data[name] = col.filled(np.nan)
+                else:
+                    data[name] = pd.array(col.tolist(), dtype=NULLABLE_DTYPES[col.dtype.kind])
+            elif col.dtype == object:
+                data[name] = pd.Series(col.tolist())
+        return pd.DataFrame(data, columns=list(data), copy=False)
+
+    def _elementSetToArrow(self, elementSet: list, elementTypes: str, columns: list,
+            typeColumn: str, types: dict = None) -> 'pa.Table':
+        """Converts a vertex or edge set to Arrow table.
+
+        The columns are built by `_elementSetToNumpy()`; type columns (`v_type`, `e_type`,
+        `from_type` and `to_type`) are dictionary encoded.
+
+        See `_elementSetToNumpy()` for the description of the arguments.
+
+        Returns:
+            The `pyarrow.Table`.
+        """
+        try:
+            import numpy as np
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required to use this function. "
+                "Download pyarrow using 'pip install pyarrow'.")
+        data = self._elementSetToNumpy(elementSet, elementTypes, columns, typeColumn, types)
+        arrays = []
+        for name, col in data.items():
+            if isinstance(col, np.ma.MaskedArray):
+                arrays.append(pa.array(col.data, mask=col.mask))
+            elif col.dtype == object:
+                a = pa.array(col.tolist())
+                arrays.append(a.dictionary_encode() if name.endswith("_type") else a)
+            else:
+                arrays.append(pa.array(col))
+        return pa.Table.from_arrays(arrays, names=list(data))
+
     def upsertData(self, data: Union[str, object], atomic: bool = False, ackAll: bool = False,
             newVertexOnly: bool = False, vertexMustExist: bool = False,
-            updateVertexOnly: bool = False) -> dict:
+            updateVertexOnly: bool = False, batchSize: int = 0, batchBytes: int = 0,
+            concurrency: int = 1) -> dict:
         """Upserts data (vertices and edges) from a JSON file or a file with equivalent object structure.
 
         Args:
@@ -90,7 +510,8 @@ class pyTigerGraphSchema(pyTigerGraphBase):
             atomic:
                 The request is an atomic transaction. An atomic transaction means that updates to
                 the database contained in the request are all-or-nothing: either all changes are
-                successful, or none are successful.
+                successful, or none are successful. If the data is split into batches, each batch
+                is a separate transaction.
             ackAll:
                 If `True`, the request will return after all GPE instances have acknowledged the
                 POST. Otherwise, the request will return immediately after RESTPP processes the POST.
@@ -104,16 +525,49 @@ class pyTigerGraphSchema(pyTigerGraphBase):
             updateVertexOnly:
                 If `True`, the request will only update existing vertices and not insert new
                 vertices.
+            batchSize:
+                If greater than `0`, the data is split into batches of (at most) this many vertices
+                and edges, and each batch is upserted in a separate request.
+            batchBytes:
+                If greater than `0`, the data is split into batches whose JSON document is
+                (approximately) at most this many bytes long. Can be combined with `batchSize`.
+            concurrency:
+                The maximum number of batches upserted at the same time.
 
         Returns:
-            The result of upsert (number of vertices and edges accepted/upserted).
+            The result of upsert (number of vertices and edges accepted/upserted). If the data is
+            split into batches, the results of the batches are merged, and the list of failed
+            batches is returned under the `"failed_batches"` key. Each failed batch is a dictionary
+            with the data of the batch (`"data"`, in the format accepted by this function) and the
+            exception raised (`"error"`), so that the batch can be retried.
 
         Endpoint:
             - `POST /graph/{graph_name}`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
-        if not isinstance(data, str):
-            data = json.dumps(data)
+        if batchSize > 0 or batchBytes > 0:
+            if isinstance(data, (str, bytes)):
+                data = loads(data)
+            return self._upsertDataInBatches(self._upsertDataRecords(data), batchSize, batchBytes,
+                concurrency, atomic, ackAll, newVertexOnly, vertexMustExist, updateVertexOnly)
+
+        data, headers, params = self._prepUpsertData(data, atomic, ackAll, newVertexOnly,
+            vertexMustExist, updateVertexOnly)
+        return self._post(self.restppUrl + "/graph/" + self.graphname, headers=headers, data=data,
+            params=params)[0]
+
+    def _prepUpsertData(self, data: Union[str, object], atomic: bool = False, ackAll: bool = False,
+            newVertexOnly: bool = False, vertexMustExist: bool = False,
+            updateVertexOnly: bool = False) -> tuple:
+        """Builds the payload, headers and URL parameters of `upsertData()`.
+
+        See `upsertData()` for the description of the arguments.
+
+        Returns:
+            A tuple of `(<payload>, <headers>, <params>)`.
+        """
+        if not isinstance(data, (str, bytes)):
+            data = dumpb(data)
         headers = {}
         if atomic:
             headers["gsql-atomic-level"] = "atomic"
@@ -126,8 +580,217 @@ class pyTigerGraphSchema(pyTigerGraphBase):
             params["vertex_must_exist"] = True
         if updateVertexOnly:
             params["update_vertex_only"] = True
-        return self._post(self.restppUrl + "/graph/" + self.graphname, headers=headers, data=data,
-            params=params)[0]
+        data, headers = self._compressPayload(data, headers)
+        return data, headers, params
+
+    def _upsertDataRecords(self, data: dict) -> Iterator[tuple]:
+        """Flattens the object structure accepted by `upsertData()` into individual records.
+
+        Args:
+            data:
+                The data of vertex and edge instances.
+
+        Returns:
+            An iterator of `(<path>, <attributes>)` tuples, where path is
+            `("vertices", <vertex_type>, <vertex_id>)` or
+            `("edges", <source_vertex_type>, <source_vertex_id>, <edge_type>, <target_vertex_type>, <target_vertex_id>)`.
+        """
+        for vt, vs in data.get("vertices", {}).items():
+            for vid, attrs in vs.items():
+                yield ("vertices", vt, vid), attrs
+        for svt, svs in data.get("edges", {}).items():
+            for svid, ets in svs.items():
+                for et, tvts in ets.items():
+                    for tvt, tvs in tvts.items():
+                        for tvid, attrs in tvs.items():
+                            yield ("edges", svt, svid, et, tvt, tvid), attrs
+
+    def _batchUpsertData(self, records: Iterable, batchSize: int = 0,
+            batchBytes: int = 0) -> Iterator[dict]:
+        """Groups upsert records into batches.
+
+        Args:
+            records:
+                An iterable of `(<path>, <attributes>)` tuples, see `_upsertDataRecords()`.
+                Consumed lazily.
+            batchSize:
+                The maximum number of records in a batch (`0` = no limit).
+            batchBytes:
+                The approximate maximum size of the JSON document of a batch (`0` = no limit).
+                A record exceeding the limit on its own is sent in a batch of its own.
+
+        Repeated updates of the same vertex or edge (identified by its type and ID, or by its
+        source vertex, edge type and target vertex) within a batch are coalesced, see
+        `_mergeUpsertAttrs()`.
+
+        Returns:
+            An iterator of objects in the format accepted by `upsertData()`.
+        """
+        batch = {}
+        count = size = 0
+        for path, attrs in records:
+            if batchBytes > 0:
+                # Keys are quoted and followed by a colon; nested objects add braces and commas
+                recSize = len(dumpb(attrs)) + sum(len(str(p)) + 6 for p in path)
+                if count and size + recSize > batchBytes:
+                    yield batch
+                    batch = {}
+                    count = size = 0
+                size += recSize
+            node = batch
+            for key in path[:-1]:
+                node = node.setdefault(str(key), {})
+            key = str(path[-1])
+            if key in node:
+                merged = self._mergeUpsertAttrs(node[key], attrs)
+                if merged is not None:
+                    node[key] = merged
+                    continue
+                # The two updates cannot be combined, so they are sent in consecutive batches
+                yield batch
+                batch = {}
+                count = size = 0
+                node = batch
+                for k in path[:-1]:
+                    node = node.setdefault(str(k), {})
+            node[key] = attrs
+            count += 1
+            if 0 < batchSize <= count:
+                yield batch
+                batch = {}
+                count = size = 0
+        if count:
+            yield batch
+
+    def _mergeUpsertAttrs(self, old: dict, new: dict) -> Union[dict, None]:
+        """Coalesces two updates of the same vertex or edge into one.
+
+        Plain values of the later update overwrite the earlier ones. Values updated with the same
+        commutative operator (`+`, `max`, `min`, `and`, `or`, `ignore_if_exists`) in both updates
+        are combined, as are plain values followed by one of these operators.
+
+        Args:
+            old:
+                The attributes of the earlier update, as returned by `_upsertAttrs()`.
+            new:
+                The attributes of the later update.
+
+        Returns:
+            The attributes of the combined update, or `None` if the updates cannot be combined
+            (e.g. an attribute is updated with two different operators).
+        """
+        ret = dict(old)
+        for attr, val in new.items():
+            op = val.get("op")
+            if attr not in ret or op is None:
+                ret[attr] = val
+                continue
+            prev = ret[attr]
+            prevOp = prev.get("op")
+            merge = UPSERT_OPERATORS.get(op)
+            if merge is None or (prevOp is not None and
+                    UPSERT_OPERATORS.get(prevOp) is not merge):
+                return None
+            try:
+                value = merge(prev["value"], val["value"])
+            except TypeError:
+                return None
+            ret[attr] = {"value": value} if prevOp is None else {"value": value, "op": prevOp}
+        return ret
+
+    def _upsertDataInBatches(self, records: Iterable, batchSize: int = 0, batchBytes: int = 0,
+            concurrency: int = 1, atomic: bool = False, ackAll: bool = False,
+            newVertexOnly: bool = False, vertexMustExist: bool = False,
+            updateVertexOnly: bool = False) -> dict:
+        """Upserts records in batches, sending up to `concurrency` batches at the same time.
+
+        Batches are built only when a request slot becomes available, so the records are
+        consumed lazily.
+
+        See `upsertData()` for the description of the arguments.
+
+        Returns:
+            The results of the batches merged (counts summed up, lists concatenated), and the list
+            of failed batches under the `"failed_batches"` key.
+        """
+        url = self.restppUrl + "/graph/" + self.graphname
+
+        def upsertBatch(batch: dict) -> dict:
+            try:
+                data, headers, params = self._prepUpsertData(batch, atomic, ackAll,
+                    newVertexOnly, vertexMustExist, updateVertexOnly)
+                return self._post(url, headers=headers, data=data, params=params)[0]
+            except Exception as e:
+                return {"data": batch, "error": e}
+
+        ret = {"accepted_vertices": 0, "accepted_edges": 0, "failed_batches": []}
+        for res in self._imapConcurrently(upsertBatch,
+                self._batchUpsertData(records, batchSize, batchBytes), concurrency):
+            if "error" in res:
+                ret["failed_batches"].append(res)
+                continue
+            for k, v in res.items():
+                if isinstance(v, list):
+                    ret[k] = ret.get(k, []) + v
+                elif isinstance(v, int) and not isinstance(v, bool):
+                    ret[k] = ret.get(k, 0) + v
+        return ret
+
+    def _checkBatchReport(self, report: dict, key: str, reportFunc: str) -> int:
+        """Returns the count of a batched operation, or raises an exception if batches failed.
+
+        Args:
+            report:
+                The report of the batched operation.
+            key:
+                The key of the count in the report.
+            reportFunc:
+                The name of the function returning the report, to be referred to in the error
+                message.
+
+        Returns:
+            The count.
+
+        Raises:
+            `TigerGraphException` if any batch failed. The other batches are not rolled back.
+        """
+        failed = report["failed_batches"]
+        if failed:
+            error = failed[0]["error"]
+            raise TigerGraphException("{} of the batches failed ({}: {}); the first error: {}. "
+                "Use {}() to get the failed batches.".format(len(failed), key, report[key],
+                getattr(error, "message", error), reportFunc), None) from error
+        return report[key]
+
+    def writer(self, maxRecords: int = 1000, flushInterval: float = 1.0, maxPending: int = 0,
+            atomic: bool = False, ackAll: bool = False, newVertexOnly: bool = False,
+            vertexMustExist: bool = False, updateVertexOnly: bool = False) -> GraphWriter:
+        """Creates a buffered writer that combines individual vertex and edge upserts into
+            `upsertData()` requests sent from a background thread.
+
+        The writer should be closed (or used as a context manager) to send the remaining records.
+
+        Args:
+            maxRecords:
+                The buffer is flushed when this many vertices and edges are collected.
+            flushInterval:
+                The buffer is flushed (at the latest) this many seconds after the previous flush.
+                If `0`, there is no time-based flush.
+            maxPending:
+                The maximum number of records held in memory; upserts block while it is reached.
+                Defaults to `10 * maxRecords`; values below `maxRecords` are raised to `maxRecords`.
+            atomic, ackAll, newVertexOnly, vertexMustExist, updateVertexOnly:
+                Applied to each flush; see `upsertData()`.
+
+        Returns:
+            A `GraphWriter` object.
+
+        Endpoint:
+            - `POST /graph/{graph_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
+        """
+        return GraphWriter(self, maxRecords, flushInterval, maxPending, atomic, ackAll,
+            newVertexOnly, vertexMustExist, updateVertexOnly)
 
     def getEndpoints(self, builtin: bool = False, dynamic: bool = False,
             static: bool = False) -> dict:
@@ -0,0 +1,265 @@
+"""Token Manager
+
+A `TokenManager` keeps the REST++ authorization token of connections valid: it requests a token
+(see link:https://docs.tigergraph.com/pytigergraph/current/core-functions/auth#_gettoken[`getToken()`]),
+tracks its expiration and, from a background thread, requests a new token shortly before the
+current one expires and sets it on the connections it manages.
+
+Managers are created by calling `autoRefreshToken()` on a `TigerGraphConnection` object.
+Connections of a process to the same graph that use the same secret share a manager, so the token
+is requested once, not by each connection. Processes can share the token through a file, too
+(see the `tokenCache` argument).
+"""
+import hashlib
+import os
+import random
+import tempfile
+import threading
+import time
+import weakref
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyTigerGraph.pyTigerGraph import TigerGraphConnection
+
+from pyTigerGraph.pyTigerGraphJSON import dumpb, loads
+
+REFRESH_BEFORE_RATIO = 0.1
+"""The fraction of the token lifetime remaining when the token is refreshed by default."""
+REFRESH_JITTER = 0.5
+"""The random extension of the refresh margin (as a fraction of it), so that processes sharing a
+token cache do not refresh at the same time."""
+MAX_REFRESH_BEFORE_RATIO = 0.5
+"""The largest fraction of the token lifetime the refresh margin (with the jitter) can take."""
+RETRY_INTERVAL = 10
+"""The number of seconds to wait before retrying a failed refresh."""
+
+_managers = {}
+_managersLock = threading.Lock()
+
+
+class TokenManager:
+    """Requests the token of connections and refreshes it before it expires.
+
+    Example:
+        [source.wrap,python]
+        ----
+        conn = TigerGraphConnection(host="https://...", graphname="MyGraph")
+        conn.autoRefreshToken(secret, lifetime=3600)
+        # Requests of conn (and of other connections to MyGraph using the same secret) are
+        # authenticated with a valid token from now on.
+        ----
+
+    If a refresh fails (e.g. the database is not available), the current token is used and the
+    refresh is retried until the token expires. The last error is available as `lastError`.
+    The background thread stops when the manager is closed or when none of its connections is
+    in use anymore.
+    """
+
+    def __init__(self, key: str, secret: str, lifetime: int = None, refreshBefore: float = None,
+            tokenCache: str = None):
+        """Initiates a token manager. Use `autoRefreshToken()` instead.
+
+        Args:
+            key:
+                The identifier of the graph and secret the tokens are requested for.
+            secret, lifetime, refreshBefore, tokenCache:
+                See `autoRefreshToken()`.
+        """
+        self.secret = secret
+        self.lifetime = lifetime
+        self.refreshBefore = refreshBefore
+        self.tokenCache = tokenCache
+        self.lastError = None
+
+        self._key = key
+        self._conns = weakref.WeakSet()
+        self._token = None
+        self._refreshAt = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._refreshLock = threading.Lock()
+        self._thread = None
+
+    def __enter__(self) -> "TokenManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def token(self) -> tuple:
+        """The current token, as a tuple of
+        `(<token>, <expiration_timestamp_unixtime>, <expiration_timestamp_ISO8601>)`."""
+        token = self._token
+        if token is None:
+            return None
+        return token["token"], token["expiration"], \
+            datetime.utcfromtimestamp(token["expiration"]).strftime('%Y-%m-%d %H:%M:%S')
+
+    def _add(self, conn: 'TigerGraphConnection'):
+        """Sets the token on a connection and keeps it updated.
+
+        Requests the token if the manager does not have a valid one yet.
+        """
+        if self._token is None or self._token["expiration"] <= time.time():
+            self._refresh(conn)
+        conn._setToken(self._token["token"])
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                    name="pyTigerGraph-TokenManager", daemon=True)
+                self._thread.start()
+
+    def refresh(self):
+        """Requests a new token and sets it on the connections."""
+        conn = next(iter(list(self._conns)), None)
+        if conn is not None:
+            self._refresh(conn, True)
+
+    def _dueTime(self, token: dict) -> float:
+        """Returns the time a token is due for refresh.
+
+        The token is used for at least half of its lifetime (whatever `refreshBefore` is), and
+        at least `RETRY_INTERVAL` seconds, so that refreshes cannot follow each other without
+        a pause.
+        """
+        lifetime = token["expiration"] - token["issued"]
+        refreshBefore = self.refreshBefore
+        if refreshBefore is None:
+            refreshBefore = lifetime * REFRESH_BEFORE_RATIO
+        margin = min(refreshBefore * (1 + random.random() * REFRESH_JITTER),
+            lifetime * MAX_REFRESH_BEFORE_RATIO)
+        return max(token["expiration"] - margin, token["issued"] + RETRY_INTERVAL)
+
+    def _refresh(self, conn: 'TigerGraphConnection', force: bool = False):
+        """Obtains a valid token, from the token cache or from the database, and sets it on the
+        connections.
+
+        Args:
+            conn:
+                The connection the token is requested through.
+            force:
+                If `True`, a new token is requested even if the current one is not due for refresh.
+        """
+        with self._refreshLock:
+            # Another thread might have refreshed the token while this one was waiting
+            if not force and self._token is not None and time.time() < self._refreshAt:
+                return
+            token = None if force else self._readCache()
+            if token is not None:
+                # Refreshed by another process
+                refreshAt = self._dueTime(token)
+                if time.time() >= refreshAt:
+                    token = None
+            if token is None:
+                issued = time.time()
+                res = conn._requestToken(self.secret, self.lifetime)
+                token = {"token": res[0], "expiration": float(res[1]), "issued": issued}
+                refreshAt = self._dueTime(token)
+                self._writeCache(token)
+
+            with self._cond:
+                self._token = token
+                self._refreshAt = refreshAt
+                self._cond.notify_all()
+            for c in list(self._conns):
+                c._setToken(token["token"])
+
+    def _run(self):
+        """The loop of the background thread, refreshing the token when it is due."""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    remaining = self._refreshAt - time.time()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+
+            conn = next(iter(list(self._conns)), None)
+            if conn is None:
+                with _managersLock:
+                    if not self._conns:
+                        self._close()
+                        return
+                continue
+
+            try:
+                self._refresh(conn)
+                self.lastError = None
+            except Exception as e:
+                self.lastError = e
+                with self._cond:
+                    self._refreshAt = time.time() + RETRY_INTERVAL
+            # Not to keep the connection alive while waiting
+            conn = None
+
+    def _cachePath(self) -> str:
+        """Returns the path of the token cache file."""
+        return os.path.join(self.tokenCache,
+            "pyTG_token_" + hashlib.sha1(self._key.encode()).hexdigest() + ".json")
+
+    def _readCache(self) -> dict:
+        """Returns the token stored in the token cache, or `None` if there is no valid one."""
+        if not self.tokenCache:
+            return None
+        try:
+            with open(self._cachePath(), "rb") as f:
+                token = loads(f.read())
+            if token["expiration"] > time.time():
+                return token
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _writeCache(self, token: dict):
+        """Stores a token in the token cache, readable by the current user only."""
+        if not self.tokenCache:
+            return
+        os.makedirs(self.tokenCache, exist_ok=True)
+        path = self._cachePath()
+        # mkstemp creates a unique file with mode 0o600
+        fd, tmp = tempfile.mkstemp(dir=self.tokenCache, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumpb(token))
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def _close(self):
+        """Stops the background thread and unregisters the manager; `_managersLock` is held."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if _managers.get(self._key) is self:
+            del _managers[self._key]
+
+    def close(self):
+        """Stops refreshing the token.
+
+        The connections keep using the current token until it expires.
+        """
+        with _managersLock:
+            self._close()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+
+def _getTokenManager(conn: 'TigerGraphConnection', secret: str, lifetime: int = None,
+        refreshBefore: float = None, tokenCache: str = None) -> TokenManager:
+    """Returns the token manager of the graph and secret, creating it if needed, and adds the
+    connection to it. See `autoRefreshToken()`."""
+    key = "|".join([conn.restppUrl, conn.graphname, hashlib.sha1(secret.encode()).hexdigest()])
+    with _managersLock:
+        manager = _managers.get(key)
+        if manager is None or manager._closed:
+            manager = TokenManager(key, secret, lifetime, refreshBefore, tokenCache)
+            _managers[key] = manager
+        manager._conns.add(conn)
+    manager._add(conn)
+    return manager
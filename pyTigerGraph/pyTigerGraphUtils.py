@@ -9,7 +9,6 @@ import urllib
 from typing import Any, Union
 from urllib.parse import urlparse
 
-import requests
 from typing import TYPE_CHECKING, Union
 
 from pyTigerGraph.pyTigerGraphBase import pyTigerGraphBase
@@ -69,12 +68,14 @@ class pyTigerGraphUtils(pyTigerGraphBase):
             - `GET /version`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_show_component_versions[Show component versions]
         """
+        headers, _, _ = self._prepReq("GET")
+        session = self._getSession(self.restppUrl)
         if self.useCert and self.certPath:
-            response = requests.request("GET", self.restppUrl + "/version/" + self.graphname,
-                headers=self.authHeader, verify=False)
+            response = session.request("GET", self.restppUrl + "/version/" + self.graphname,
+                headers=headers, verify=False)
         else:
-            response = requests.request("GET", self.restppUrl + "/version/" + self.graphname,
-                headers=self.authHeader)
+            response = session.request("GET", self.restppUrl + "/version/" + self.graphname,
+                headers=headers)
         res = json.loads(response.text, strict=False)  # "strict=False" is why _get() was not used
         self._errorCheck(res)
 
@@ -4,20 +4,54 @@ Functions to upsert, retrieve and delete vertices.
 
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object].
 """
-import json
+import hashlib
+import math
 import warnings
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
-from pyTigerGraph.pyTigerGraphSchema import pyTigerGraphSchema
-from pyTigerGraph.pyTigerGraphUtils import pyTigerGraphUtils
-
-
-class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
+from pyTigerGraph.pyTigerGraphJSON import dumpb, dumps
+from pyTigerGraph.pyTigerGraphQuery import pyTigerGraphQuery
+from pyTigerGraph.pyTigerGraphSchema import MAX_ITER_PARTITIONS, STREAM_BATCH_SIZE
+
+GET_VERTICES_BY_ID_QUERY = "pyTG_getVerticesById"
+GET_VERTICES_BY_ID_QUERY_TEXT = """
+CREATE QUERY pyTG_getVerticesById(SET<VERTEX> vertices) FOR GRAPH $graphname {
+    result = {vertices};
+    PRINT result;
+}"""
+# The attributes are selected in PRINT, which needs the vertex type, so there is one query per
+# vertex type and selection
+GET_VERTICES_BY_ID_SELECT_QUERY = "pyTG_getVerticesById_"
+GET_VERTICES_BY_ID_SELECT_QUERY_TEXT = """
+CREATE QUERY {name}(SET<VERTEX<{vertexType}>> vertices) FOR GRAPH $graphname {{
+    result = {{vertices}};
+    PRINT result{select};
+}}"""
+DEL_VERTICES_BY_ID_QUERY = "pyTG_delVerticesById"
+DEL_VERTICES_BY_ID_QUERY_TEXT = """
+CREATE QUERY pyTG_delVerticesById(SET<VERTEX> vertices) FOR GRAPH $graphname {
+    start = {vertices};
+    DELETE s FROM start:s;
+    PRINT start.size() AS deleted_vertices;
+}"""
+# One query per vertex type (the seed set needs the type); the attributes are selected and
+# filtered on the client
+ITER_VERTICES_QUERY = "pyTG_iterVertices_"
+ITER_VERTICES_QUERY_TEXT = """
+CREATE QUERY {name}(INT partitions, INT partition) FOR GRAPH $graphname {{
+    start = {{{vertexType}.*}};
+    result = SELECT s FROM start:s WHERE getvid(s) % partitions == partition;
+    PRINT result;
+}}"""
+
+
+class pyTigerGraphVertex(pyTigerGraphQuery):
     def getVertexTypes(self, force: bool = False) -> list:
         """Returns the list of vertex type names of the graph.
 
@@ -29,10 +63,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         Returns:
             The list of vertex types defined in the current graph.
         """
-        ret = []
-        for vt in self.getSchema(force=force)["VertexTypes"]:
-            ret.append(vt["Name"])
-        return ret
+        return list(self._getSchemaIndex(force)["VertexTypes"])
 
     def getVertexType(self, vertexType: str, force: bool = False) -> dict:
         """Returns the details of the specified vertex type.
@@ -47,10 +78,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         Returns:
             The metadata of the vertex type.
         """
-        for vt in self.getSchema(force=force)["VertexTypes"]:
-            if vt["Name"] == vertexType:
-                return vt
-        return {}  # Vertex type was not found
+        return self._getSchemaIndex(force)["VertexTypes"].get(vertexType, {})  # Vertex type was not found
         # TODO Should raise exception instead?
 
     def getVertexCount(self, vertexType: Union[str, list], where: str = "") -> Union[int, dict]:
@@ -144,11 +172,13 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             return None
             # TODO Should return 0 or raise exception instead?
         vals = self._upsertAttrs(attributes)
-        data = json.dumps({"vertices": {vertexType: {vertexId: vals}}})
+        data = dumpb({"vertices": {vertexType: {vertexId: vals}}})
         return self._post(self.restppUrl + "/graph/" + self.graphname, data=data)[0][
             "accepted_vertices"]
 
-    def upsertVertices(self, vertexType: str, vertices: list) -> int:
+    def upsertVertices(self, vertexType: str, vertices: list, atomic: bool = False,
+            ackAll: bool = False, batchSize: int = 0, batchBytes: int = 0,
+            concurrency: int = 1) -> int:
         """Upserts multiple vertices (of the same type).
 
         See the description of ``upsertVertex`` for generic information.
@@ -157,7 +187,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             vertexType:
                 The name of the vertex type.
             vertices:
-                A list of tuples in this format:
+                A list (or any other iterable, e.g. a generator) of tuples in this format:
 
                 [source.wrap,json]
                 ----
@@ -180,26 +210,108 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
 
                 For valid values of `<operator>` see xref:tigergraph-server:API:built-in-endpoints.adoc#_operation_codes[Operation codes].
 
+                An iterable other than a list is consumed lazily and is always upserted in batches
+                (of `STREAM_BATCH_SIZE` vertices, unless `batchSize` or `batchBytes` is specified),
+                so the memory used does not depend on the number of vertices.
+            atomic:
+                If `True`, the request (or each batch) is an all-or-nothing transaction.
+            ackAll:
+                If `True`, the request will return after all GPE instances have acknowledged the
+                POST.
+            batchSize:
+                If greater than `0`, the vertices are upserted in batches of (at most) this many
+                vertices.
+            batchBytes:
+                If greater than `0`, the vertices are upserted in batches whose JSON document is
+                (approximately) at most this many bytes long.
+            concurrency:
+                The maximum number of batches upserted at the same time.
+
         Returns:
-            A single number of accepted (successfully upserted) vertices (0 or positive integer).
+            The number of accepted (successfully upserted) vertices (0 or positive integer),
+            whether or not the vertices are upserted in batches.
+
+        Raises:
+            `TigerGraphException` if any batch failed (the other batches are upserted). Use
+            `upsertVerticesInBatches()` to get the failed batches, e.g. to retry them.
 
         Endpoint:
             - `POST /graph/{graph_name}`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
         """
-        if not isinstance(vertices, list):
+        if isinstance(vertices, (str, bytes, dict)) or not isinstance(vertices, Iterable):
             return None
             # TODO Should return 0 or raise exception instead?
+        if not isinstance(vertices, list) or batchSize > 0 or batchBytes > 0:
+            return self._checkBatchReport(self.upsertVerticesInBatches(vertexType, vertices,
+                batchSize, batchBytes, concurrency, atomic, ackAll), "accepted_vertices",
+                "upsertVerticesInBatches")
+
+        data = self._prepUpsertVertices(vertexType, vertices)
+        data, headers, params = self._prepUpsertData(data, atomic, ackAll)
+        return self._post(self.restppUrl + "/graph/" + self.graphname, headers=headers, data=data,
+            params=params)[0]["accepted_vertices"]
+
+    def upsertVerticesInBatches(self, vertexType: str, vertices: Iterable, batchSize: int = 0,
+            batchBytes: int = 0, concurrency: int = 1, atomic: bool = False,
+            ackAll: bool = False) -> dict:
+        """Upserts multiple vertices (of the same type) in batches, reporting the failed batches.
+
+        A failing batch does not stop the upsert of the other batches.
+
+        Args:
+            vertexType:
+                The name of the vertex type.
+            vertices:
+                A list or any other iterable of vertices; see `upsertVertices()`. Consumed lazily.
+            batchSize:
+                The maximum number of vertices in a batch. If neither `batchSize` nor `batchBytes`
+                is specified, `STREAM_BATCH_SIZE` is used.
+            batchBytes:
+                If greater than `0`, the vertices are upserted in batches whose JSON document is
+                (approximately) at most this many bytes long.
+            concurrency:
+                The maximum number of batches upserted at the same time.
+            atomic:
+                If `True`, each batch is an all-or-nothing transaction.
+            ackAll:
+                If `True`, each request will return after all GPE instances have acknowledged the
+                POST.
+
+        Returns:
+            A dictionary with the number of accepted vertices under the `"accepted_vertices"` key
+            and the list of failed batches under the `"failed_batches"` key (see `upsertData()`).
+
+        Endpoint:
+            - `POST /graph/{graph_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_upsert_data_to_graph[Upsert data to graph]
+        """
+        if batchSize <= 0 and batchBytes <= 0:
+            batchSize = STREAM_BATCH_SIZE
+        records = ((("vertices", vertexType, v[0]), self._upsertAttrs(v[1])) for v in vertices)
+        return self._upsertDataInBatches(records, batchSize, batchBytes, concurrency, atomic,
+            ackAll)
+
+    def _prepUpsertVertices(self, vertexType: str, vertices: list) -> str:
+        """Builds the JSON payload of `upsertVertices()`.
+
+        Args:
+            vertexType:
+                The name of the vertex type.
+            vertices:
+                A list of `(<vertex_id>, {<attribute_name>: <attribute_value>, …})` tuples.
+
+        Returns:
+            The JSON document to be posted.
+        """
         data = {}
         for v in vertices:
             vals = self._upsertAttrs(v[1])
             data[v[0]] = vals
-        data = json.dumps({"vertices": {vertexType: data}})
-        return self._post(self.restppUrl + "/graph/" + self.graphname, data=data)[0][
-            "accepted_vertices"]
+        return dumpb({"vertices": {vertexType: data}})
 
     def upsertVertexDataFrame(self, df: 'pd.DataFrame', vertexType: str, v_id: bool = None,
-            attributes: dict = "") -> int:
+            attributes: dict = None, ops: dict = None, skipNA: bool = False) -> int:
         """Upserts vertices from a Pandas DataFrame.
 
         Args:
@@ -215,26 +327,27 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 the dataframe and target is the attribute name in the graph vertex. When omitted,
                 all columns would be upserted with their current names. In this case column names
                 must match the vertex's attribute names.
+            ops:
+                A dictionary in the form of `{target: operator}`, the operator used to update the
+                attribute, e.g. `{"points": "+"}`.
+                For valid values of `<operator>` see xref:tigergraph-server:API:built-in-endpoints.adoc#_operation_codes[Operation codes].
+            skipNA:
+                If `True`, missing values are left out of the upsert (the attribute keeps its
+                current value); otherwise they are upserted as `null`.
 
         Returns:
             The number of vertices upserted.
         """
-
-        json_up = []
-
-        for index in df.index:
-            json_up.append(json.loads(df.loc[index].to_json()))
-            json_up[-1] = (
-                index if v_id is None else json_up[-1][v_id],
-                json_up[-1] if attributes is None
-                else {target: json_up[-1][source] for target, source in attributes.items()}
-            )
-
-        return self.upsertVertices(vertexType=vertexType, vertices=json_up)
+        ids = (df.index if not v_id else df[v_id]).tolist()
+        attrs = self._upsertAttrsFromDataFrame(df, attributes, ops, skipNA)
+        data, headers, _ = self._prepUpsertData(
+            {"vertices": {vertexType: dict(zip(ids, attrs))}})
+        return self._post(self.restppUrl + "/graph/" + self.graphname, headers=headers,
+            data=data)[0]["accepted_vertices"]
 
     def getVertices(self, vertexType: str, select: str = "", where: str = "",
             limit: Union[int, str] = None, sort: str = "", fmt: str = "py", withId: bool = True,
-            withType: bool = False, timeout: int = 0) -> Union[dict, str, 'pd.DataFrame']:
+            withType: bool = False, timeout: int = 0) -> Union[dict, str, 'pd.DataFrame', Iterator]:
         """Retrieves vertices of the given vertex type.
 
         *Note*:
@@ -262,6 +375,12 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 - "py":   Python objects
                 - "json": JSON document
                 - "df":   pandas DataFrame
+                - "numpy": A dictionary of numpy arrays, one per column of the "df" format
+                - "arrow": `pyarrow.Table` with the columns of the "df" format
+                - "raw":  The complete, undecoded response of the endpoint (bytes)
+                - "stream": An iterator of the vertices (Python objects), parsed incrementally
+                  as they are consumed, so that even huge vertex sets can be processed with
+                  bounded memory. Requires the `ijson` package.
             withId:
                 (When the output format is "df") should the vertex ID be included in the dataframe?
             withType:
@@ -271,12 +390,30 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
 
         Returns:
             The (selected) details of the (matching) vertex instances (sorted, limited) as
-            dictionary, JSON or pandas DataFrame.
+            dictionary, JSON, pandas DataFrame or iterator.
 
         Endpoint:
             - `GET /graph/{graph_name}/vertices/{vertex_type}`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_list_vertices[List vertices]
         """
+        url = self._prepGetVertices(vertexType, select, where, limit, sort, timeout)
+        if fmt == "raw":
+            return self._get(url, raw=True)
+        if fmt == "stream":
+            return self._reqStream("GET", url)
+        ret = self._get(url)
+
+        return self._formatVertexSet(ret, fmt, withId, withType)
+
+    def _prepGetVertices(self, vertexType: str, select: str = "", where: str = "",
+            limit: Union[int, str] = None, sort: str = "", timeout: int = 0) -> str:
+        """Builds the URL of `getVertices()`.
+
+        See `getVertices()` for the description of the arguments.
+
+        Returns:
+            The complete REST++ URL including the query string.
+        """
         url = self.restppUrl + "/graph/" + self.graphname + "/vertices/" + vertexType
         isFirst = True
         if select:
@@ -293,14 +430,34 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             isFirst = False
         if timeout and timeout > 0:
             url += ("?" if isFirst else "&") + "timeout=" + str(timeout)
+        return url
 
-        ret = self._get(url)
+    def _formatVertexSet(self, vertexSet: list, fmt: str = "py", withId: bool = True,
+            withType: bool = False) -> Union[list, str, 'pd.DataFrame']:
+        """Converts a vertex set returned by an endpoint to the requested output format.
 
+        Args:
+            vertexSet:
+                The vertex set as returned by the endpoint.
+            fmt:
+                Format of the results: `"py"`, `"json"`, `"df"`, `"numpy"` or `"arrow"`.
+            withId:
+                (When the output format is "df") should the vertex ID be included in the dataframe?
+            withType:
+                (When the output format is "df") should the vertex type be included in the dataframe?
+
+        Returns:
+            The vertex set as Python objects, JSON, pandas DataFrame, numpy arrays or Arrow table.
+        """
         if fmt == "json":
-            return json.dumps(ret)
+            return dumps(vertexSet)
         if fmt == "df":
-            return self.vertexSetToDataFrame(ret, withId, withType)
-        return ret
+            return self.vertexSetToDataFrame(vertexSet, withId, withType)
+        if fmt == "numpy":
+            return self.vertexSetToNumpy(vertexSet, withId, withType)
+        if fmt == "arrow":
+            return self.vertexSetToArrow(vertexSet, withId, withType)
+        return vertexSet
 
     def getVertexDataFrame(self, vertexType: str, select: str = "", where: str = "",
             limit: Union[int, str] = None, sort: str = "", timeout: int = 0) -> 'pd.DataFrame':
@@ -350,9 +507,125 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         return self.getVertexDataFrame(vertexType, select=select, where=where, limit=limit,
             sort=sort, timeout=timeout)
 
+    def iterVertices(self, vertexType: str, select: str = "", where: str = "",
+            chunkSize: int = 10000, fmt: str = "py", withId: bool = True, withType: bool = False,
+            concurrency: int = 1, cursor: dict = None, timeout: int = 0,
+            maxPartitions: int = MAX_ITER_PARTITIONS) -> Iterator:
+        """Retrieves all vertices of the given vertex type, in chunks.
+
+        Unlike `getVertices()`, which returns all the vertices in a single response, the vertices
+        are divided into partitions (by their internal ID) that are retrieved one by one, so that
+        neither the client nor the database holds more than a few chunks at any time.
+
+        The partitions are retrieved by a helper query which is installed the first time a
+        vertex type is scanned (this can take a minute); see `dropHelperQueries()`. The query
+        selects the vertices of a partition by filtering all vertices of the type, so the server
+        scans the whole vertex type for each partition: the total work on the server grows with
+        the number of vertices times the number of partitions. Therefore the number of
+        partitions is limited by `maxPartitions`. The query returns all attributes of all
+        vertices; `select` and `where` are applied on the client.
+
+        Args:
+            vertexType:
+                The name of the vertex type.
+            select:
+                Comma separated list of vertex attributes to be retrieved.
+            where:
+                Comma separated list of conditions that are all applied on each vertex' attributes,
+                in the same format as in `getVertices()`. Values in quotes are compared as
+                strings, others as numbers or booleans.
+            chunkSize:
+                The approximate number of vertices in a chunk (before `where` is applied). Chunks
+                are larger if the vertex type has more than `chunkSize * maxPartitions` vertices.
+            fmt:
+                Format of the chunks:
+                - "py":   Python objects
+                - "df":   pandas DataFrame
+                - "numpy": A dictionary of numpy arrays, one per column of the "df" format
+                - "arrow": `pyarrow.Table` with the columns of the "df" format
+            withId:
+                (When the output format is "df") should the vertex ID be included in the dataframe?
+            withType:
+                (When the output format is "df") should the vertex type be included in the dataframe?
+            concurrency:
+                The number of partitions retrieved at the same time. If greater than 1, the
+                chunks are returned in the order they arrive.
+            cursor:
+                A dictionary recording the progress of the scan. It is updated before each chunk
+                is returned, so saving it (e.g. as JSON) after processing a chunk and passing it
+                to a later call resumes the scan after the last processed chunk. Pass an empty
+                dictionary to start a new scan.
+            timeout:
+                Time allowed for retrieving a chunk (in seconds; 0 = no limit, default).
+            maxPartitions:
+                The maximum number of partitions (and chunks). If `0`, the number of partitions is
+                not limited. Ignored when a scan is resumed.
+
+        Returns:
+            An iterator of the chunks of vertices, as lists or pandas DataFrames.
+
+        Raises:
+            `TigerGraphException` if the cursor belongs to a scan with different arguments.
+
+        Example:
+            [source.wrap,python]
+            ----
+            cursor = {}
+            for chunk in conn.iterVertices("Person", select="name", cursor=cursor, fmt="df"):
+                process(chunk)
+                saveCursor(cursor)
+            ----
+        """
+        if cursor is None:
+            cursor = {}
+        scan = {"vertexType": vertexType, "select": select, "where": where}
+        if "partitions" in cursor:
+            if any(cursor[k] != v for k, v in scan.items()):
+                raise TigerGraphException("The cursor belongs to a different scan.", None)
+        else:
+            cursor.update(scan)
+            partitions = max(1, math.ceil(self.getVertexCount(vertexType) / chunkSize))
+            if maxPartitions > 0:
+                partitions = min(partitions, maxPartitions)
+            cursor["partitions"] = partitions
+            cursor["done"] = []
+
+        queryName = self._installHelperQuery(*self._prepIterVerticesQuery(vertexType))
+        partitions = cursor["partitions"]
+        done = set(cursor["done"])
+        predicate = self._filterToPredicate(where) if where else None
+        attrs = [a.strip() for a in select.split(",")] if select else None
+
+        def getPartition(partition: int) -> tuple:
+            res = self.runInstalledQuery(queryName,
+                {"partitions": partitions, "partition": partition}, timeout=timeout * 1000)
+            res = res[0]["result"]
+            if predicate is not None:
+                res = [v for v in res if predicate(v["attributes"])]
+            if attrs is not None:
+                for v in res:
+                    v["attributes"] = {a: v["attributes"][a] for a in attrs
+                        if a in v["attributes"]}
+            return partition, res
+
+        for partition, res in self._imapConcurrently(getPartition,
+                (p for p in range(partitions) if p not in done), concurrency):
+            cursor["done"].append(partition)
+            yield self._formatVertexSet(res, fmt, withId, withType)
+
+    def _prepIterVerticesQuery(self, vertexType: str) -> tuple:
+        """Builds the helper query of `iterVertices()` for a vertex type.
+
+        Returns:
+            A tuple of `(<query_name>, <query_text>)`.
+        """
+        name = ITER_VERTICES_QUERY + vertexType
+        return name, ITER_VERTICES_QUERY_TEXT.format(name=name, vertexType=vertexType)
+
     def getVerticesById(self, vertexType: str, vertexIds: Union[int, str, list], select: str = "",
             fmt: str = "py", withId: bool = True, withType: bool = False,
-            timeout: int = 0) -> Union[list, str, 'pd.DataFrame']:
+            timeout: int = 0, batchSize: int = 0,
+            concurrency: int = 1) -> Union[list, str, 'pd.DataFrame']:
         """Retrieves vertices of the given vertex type, identified by their ID.
 
         Args:
@@ -367,47 +640,178 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                     "py":   Python objects (in a list)
                     "json": JSON document
                     "df":   pandas DataFrame
+                    "numpy": A dictionary of numpy arrays, one per column of the "df" format
+                    "arrow": `pyarrow.Table` with the columns of the "df" format
             withId:
                 (If the output format is "df") should the vertex ID be included in the dataframe?
             withType:
                 (If the output format is "df") should the vertex type be included in the dataframe?
             timeout:
                 Time allowed for successful execution (0 = no limit, default).
+            batchSize:
+                If greater than `0`, up to this many vertices are fetched in one request through
+                a helper query, which is installed on first use (this requires the privilege to
+                create and install queries; if `select` is specified, a query is installed for each
+                combination of `vertexType` and `select`). `select` and `timeout` are honored in
+                this mode only; the attributes are selected on the server. If `0` (default), one
+                request is sent per vertex ID.
+            concurrency:
+                The maximum number of requests sent at the same time.
 
         Returns:
             The (selected) details of the (matching) vertex instances as dictionary, JSON or pandas
-            DataFrame.
+            DataFrame, in the order of `vertexIds`.
 
-        Endpoint:
+        Endpoints:
             - `GET /graph/{graph_name}/vertices/{vertex_type}/{vertex_id}`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_retrieve_a_vertex[Retrieve a vertex]
+            - `POST /query/{graph_name}/pyTG_getVerticesById[_<hash>]` (if `batchSize` is specified)
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_post[Run an installed query (POST)]
 
         TODO Find out how/if select and timeout can be specified
         """
+        if batchSize > 0:
+            vids = self._prepVertexIds(vertexIds)
+            if vids is None:
+                return None
+            queryName = self._installHelperQuery(
+                *self._prepGetVerticesByIdQuery(vertexType, select))
+            res = self._mapConcurrently(
+                lambda params: self.runInstalledQuery(queryName, params,
+                    timeout=timeout * 1000, usePost=True),
+                [b[1] for b in self._prepVertexIdBatches(vertexType, vids, batchSize,
+                    bool(select))],
+                concurrency)
+            ret = self._orderVertexSet(vids, [r[0]["result"] for r in res])
+        else:
+            urls = self._prepGetVerticesById(vertexType, vertexIds)
+            if urls is None:
+                return None
+                # TODO Should return 0 or raise exception?
+
+            ret = []
+            for r in self._mapConcurrently(self._get, urls, concurrency):
+                ret += r
+
+        return self._formatVertexSet(ret, fmt, withId, withType)
+
+    def _prepVertexIds(self, vertexIds: Union[int, str, list]) -> Union[list, None]:
+        """Normalizes a single vertex ID or a list of vertex IDs to a list.
+
+        Args:
+            vertexIds:
+                A single vertex ID or a list of vertex IDs.
+
+        Returns:
+            The list of vertex IDs, or `None` if `vertexIds` is of invalid type.
+
+        Raises:
+            `TigerGraphException` if no vertex ID was specified.
+        """
         if not vertexIds:
             raise TigerGraphException("No vertex ID was specified.", None)
-        vids = []
         if isinstance(vertexIds, (int, str)):
-            vids.append(vertexIds)
-        elif not isinstance(vertexIds, list):
+            return [vertexIds]
+        if not isinstance(vertexIds, list):
+            return None
+        return vertexIds
+
+    def _prepGetVerticesById(self, vertexType: str,
+            vertexIds: Union[int, str, list]) -> Union[list, None]:
+        """Builds the URLs of `getVerticesById()`.
+
+        Args:
+            vertexType:
+                The name of the vertex type.
+            vertexIds:
+                A single vertex ID or a list of vertex IDs.
+
+        Returns:
+            The list of REST++ URLs, one per vertex ID, or `None` if `vertexIds` is of invalid
+            type.
+
+        Raises:
+            `TigerGraphException` if no vertex ID was specified.
+        """
+        vids = self._prepVertexIds(vertexIds)
+        if vids is None:
             return None
-            # TODO Should return 0 or raise exception?
-        else:
-            vids = vertexIds
         url = self.restppUrl + "/graph/" + self.graphname + "/vertices/" + vertexType + "/"
+        return [url + self._safeChar(vid) for vid in vids]
 
-        ret = []
-        for vid in vids:
-            ret += self._get(url + self._safeChar(vid))
+    def _prepGetVerticesByIdQuery(self, vertexType: str, select: str = "") -> tuple:
+        """Returns the helper query of the batched `getVerticesById()`.
 
-        if fmt == "json":
-            return json.dumps(ret)
-        if fmt == "df":
-            return self.vertexSetToDataFrame(ret, withId, withType)
+        Args:
+            vertexType:
+                The name of the vertex type.
+            select:
+                Comma separated list of vertex attributes to be retrieved.
+
+        Returns:
+            A tuple of `(<query_name>, <query_text>)`: the generic query if no attributes are
+            selected, otherwise a query printing the selected attributes of `vertexType`.
+        """
+        if not select:
+            return GET_VERTICES_BY_ID_QUERY, GET_VERTICES_BY_ID_QUERY_TEXT
+        name = GET_VERTICES_BY_ID_SELECT_QUERY + hashlib.md5(
+            "|".join([self.graphname, vertexType, select]).encode()).hexdigest()[:12]
+        select = "[" + ", ".join("result.{0} AS {0}".format(a.strip())
+            for a in select.split(",")) + "]"
+        return name, GET_VERTICES_BY_ID_SELECT_QUERY_TEXT.format(name=name,
+            vertexType=vertexType, select=select)
+
+    def _prepVertexIdBatches(self, vertexType: str, vertexIds: list, batchSize: int,
+            typed: bool = False) -> list:
+        """Splits vertex IDs into batches passed to a helper query as its `vertices` parameter.
+
+        Args:
+            vertexType:
+                The name of the vertex type.
+            vertexIds:
+                The list of vertex IDs.
+            batchSize:
+                The maximum number of vertex IDs in one batch.
+            typed:
+                `True` if the parameter is a `SET<VERTEX<vertexType>>`, `False` if it is a
+                `SET<VERTEX>`.
+
+        Returns:
+            A list of `(<vertex_ids>, <query_parameters>)` tuples, one per batch, where the
+            parameters are the JSON document expected by `POST /query`.
+        """
+        # Duplicates would only make the requests longer
+        vids = list(dict.fromkeys(str(vid) for vid in vertexIds))
+        ret = []
+        for i in range(0, len(vids), batchSize):
+            batch = vids[i:i + batchSize]
+            if typed:
+                vertices = batch
+            else:
+                vertices = [{"id": vid, "type": vertexType} for vid in batch]
+            ret.append((batch, dumps({"vertices": vertices})))
         return ret
 
+    def _orderVertexSet(self, vertexIds: list, vertexSets: list) -> list:
+        """Merges vertex sets and orders the vertices by the list of their IDs.
+
+        Args:
+            vertexIds:
+                The list of vertex IDs, in the expected order of the output.
+            vertexSets:
+                The vertex sets returned by the batches.
+
+        Returns:
+            A single vertex set. IDs not found in the vertex sets are omitted.
+        """
+        found = {}
+        for vs in vertexSets:
+            for v in vs:
+                found[v["v_id"]] = v
+        return [found[str(vid)] for vid in vertexIds if str(vid) in found]
+
     def getVertexDataFrameById(self, vertexType: str, vertexIds: Union[int, str, list],
-            select: str = "") -> 'pd.DataFrame':
+            select: str = "", batchSize: int = 0, concurrency: int = 1) -> 'pd.DataFrame':
         """Retrieves vertices of the given vertex type, identified by their ID.
 
         This is a shortcut to ``getVerticesById(..., fmt="df", withId=True, withType=False)``.
@@ -419,12 +823,16 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 A single vertex ID or a list of vertex IDs.
             select:
                 Comma separated list of vertex attributes to be retrieved.
+            batchSize:
+                The number of vertices fetched in one request. See `getVerticesById()`.
+            concurrency:
+                The maximum number of requests sent at the same time.
 
         Returns:
             The (selected) details of the (matching) vertex instances as pandas DataFrame.
         """
         return self.getVerticesById(vertexType, vertexIds, select, fmt="df", withId=True,
-            withType=False)
+            withType=False, batchSize=batchSize, concurrency=concurrency)
 
     def getVertexDataframeById(self, vertexType: str, vertexIds: Union[int, str, list],
             select: str = "") -> 'pd.DataFrame':
@@ -536,9 +944,15 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         return self._delete(url)["deleted_vertices"]
 
     def delVerticesById(self, vertexType: str, vertexIds: Union[int, str, list],
-            permanent: bool = False, timeout: int = 0) -> int:
+            permanent: bool = False, timeout: int = 0, batchSize: int = 1000,
+            concurrency: int = 1) -> int:
         """Deletes vertices from graph identified by their ID.
 
+        Multiple vertices are deleted in batches through the `pyTG_delVerticesById` helper query
+        (see `delVerticesByIdInBatches()`), which is installed on first use; this requires the
+        privilege to create and install queries. A single vertex, permanent deletion or a
+        `batchSize` of `0` sends one request per vertex ID instead.
+
         Args:
             vertexType:
                 The name of the vertex type.
@@ -546,17 +960,34 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 A single vertex ID or a list of vertex IDs.
             permanent:
                 If true, the deleted vertex IDs can never be inserted back, unless the graph is
-                dropped or the graph store is cleared.
+                dropped or the graph store is cleared. Vertices are deleted one by one in this case.
             timeout:
                 Time allowed for successful execution (0 = no limit, default).
+            batchSize:
+                The maximum number of vertices deleted in one request. If `0`, one request is sent
+                per vertex ID.
+            concurrency:
+                The maximum number of requests sent at the same time.
 
         Returns:
-            A single number of vertices deleted.
+            The number of vertices deleted, whether or not they are deleted in batches.
 
-        Endpoint:
+        Raises:
+            `TigerGraphException` if any batch failed (the other batches are deleted). Use
+            `delVerticesByIdInBatches()` to get the failed batches, e.g. to retry them.
+
+        Endpoints:
             - `DELETE /graph/{graph_name}/vertices/{vertex_type}/{vertex_id}`
                 See xref:tigergraph-server:API:built-in-endpoints.adoc#_delete_a_vertex[Delete a vertex]
+            - `POST /query/{graph_name}/pyTG_delVerticesById` (batches of vertices)
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_post[Run an installed query (POST)]
         """
+        if batchSize > 0 and not permanent and isinstance(vertexIds, list) and \
+                len(vertexIds) > 1:
+            res = self.delVerticesByIdInBatches(vertexType, vertexIds, batchSize, timeout,
+                concurrency)
+            return self._checkBatchReport(res, "deleted_vertices", "delVerticesByIdInBatches")
+
         if not vertexIds:
             raise TigerGraphException("No vertex ID was specified.", None)
         vids = []
@@ -573,10 +1004,60 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             url2 = "?permanent=true"
         if timeout and timeout > 0:
             url2 += ("&" if url2 else "?") + "timeout=" + str(timeout)
-        ret = 0
-        for vid in vids:
-            ret += self._delete(url1 + str(vid) + url2)["deleted_vertices"]
-        return ret
+        res = self._mapConcurrently(lambda vid: self._delete(url1 + str(vid) + url2),
+            vids, concurrency)
+        return sum(r["deleted_vertices"] for r in res)
+
+    def delVerticesByIdInBatches(self, vertexType: str, vertexIds: Union[int, str, list],
+            batchSize: int = 1000, timeout: int = 0, concurrency: int = 1) -> dict:
+        """Deletes vertices identified by their ID in batches, reporting the failed batches.
+
+        Up to `batchSize` vertices are deleted in one request through the `pyTG_delVerticesById`
+        helper query, which is installed on first use (this requires the privilege to create and
+        install queries). A failing batch does not stop the deletion of the other batches.
+
+        Args:
+            vertexType:
+                The name of the vertex type.
+            vertexIds:
+                A single vertex ID or a list of vertex IDs.
+            batchSize:
+                The maximum number of vertices deleted in one request.
+            timeout:
+                Time allowed for the execution of each batch (0 = no limit, default).
+            concurrency:
+                The maximum number of requests sent at the same time.
+
+        Returns:
+            A dictionary with the number of vertices deleted under the `"deleted_vertices"` key
+            and the list of failed batches under the `"failed_batches"` key. Each failed batch is
+            a dictionary with the vertex IDs of the batch (`"vertex_ids"`) and the exception
+            raised (`"error"`), so that the batch can be retried.
+
+        Endpoint:
+            - `POST /query/{graph_name}/pyTG_delVerticesById`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_post[Run an installed query (POST)]
+        """
+        vids = self._prepVertexIds(vertexIds)
+        if vids is None:
+            return None
+        self._installHelperQuery(DEL_VERTICES_BY_ID_QUERY, DEL_VERTICES_BY_ID_QUERY_TEXT)
+
+        def delBatch(batch: tuple) -> dict:
+            try:
+                res = self.runInstalledQuery(DEL_VERTICES_BY_ID_QUERY, batch[1],
+                    timeout=timeout * 1000, usePost=True)
+                return {"deleted_vertices": res[0]["deleted_vertices"]}
+            except Exception as e:
+                return {"deleted_vertices": 0, "vertex_ids": batch[0], "error": e}
+
+        res = self._mapConcurrently(delBatch,
+            self._prepVertexIdBatches(vertexType, vids, max(batchSize, 1)), concurrency)
+        return {
+            "deleted_vertices": sum(r["deleted_vertices"] for r in res),
+            "failed_batches": [{"vertex_ids": r["vertex_ids"], "error": r["error"]}
+                for r in res if "error" in r]
+        }
 
     # def delVerticesByType(self, vertexType: str, permanent: bool = False):
     # TODO Implementation
@@ -586,7 +1067,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
     # TODO GET /deleted_vertex_check/{graph_name}
 
     def vertexSetToDataFrame(self, vertexSet: list, withId: bool = True,
-            withType: bool = False) -> 'pd.DataFrame':
+            withType: bool = False, types: dict = None) -> 'pd.DataFrame':
         """Converts a vertex set to Pandas DataFrame.
 
         Vertex sets are used for both the input and output of `SELECT` statements. They contain
@@ -621,21 +1102,74 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 Whether to include vertex primary ID as a column.
             withType:
                 Whether to include vertex type info as a column.
+            types:
+                A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+                `"DATETIME"`) for attributes whose type is not (or not yet) known from the
+                schema.
 
         Returns:
             A pandas DataFrame containing the vertex attributes (and optionally the vertex primary
-            ID and type).
+            ID and type). The columns of attributes are typed according to the schema of the
+            vertex type (e.g. `DATETIME` attributes as `datetime64`); the vertex type column is
+            categorical.
+        """
+        return self._elementSetToDataFrame(vertexSet, "VertexTypes",
+            self._vertexSetColumns(withId, withType), "v_type", types)
+
+    def vertexSetToNumpy(self, vertexSet: list, withId: bool = True,
+            withType: bool = False, types: dict = None) -> dict:
+        """Converts a vertex set to numpy arrays.
+
+        The columns are the same as those of `vertexSetToDataFrame()`. Attribute columns are
+        typed according to the schema of the vertex type: numeric and boolean attributes as
+        arrays of the corresponding numpy data type (masked arrays if values are missing),
+        `DATETIME` attributes as `datetime64[s]`, other attributes as objects.
+        The schema is not fetched by this function: if it has not been fetched yet (e.g. by
+        `getSchema()`) and `types` is not specified, the data types are inferred from the values.
+
+        Args:
+            vertexSet:
+                A JSON array containing a vertex set in the format returned by queries.
+            withId:
+                Whether to include vertex primary ID.
+            withType:
+                Whether to include vertex type info.
+            types:
+                A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+                `"DATETIME"`) for attributes whose type is not (or not yet) known from the
+                schema.
+
+        Returns:
+            A dictionary of `<column_name>: <numpy_array>` pairs.
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError("Pandas is required to use this function. "
-                "Download pandas using 'pip install pandas'.")
-        df = pd.DataFrame(vertexSet)
-        cols = []
-        if withId:
-            cols.append(df["v_id"])
-        if withType:
-            cols.append(df["v_type"])
-        cols.append(pd.DataFrame(df["attributes"].tolist()))
-        return pd.concat(cols, axis=1)
+        return self._elementSetToNumpy(vertexSet, "VertexTypes",
+            self._vertexSetColumns(withId, withType), "v_type", types)
+
+    def vertexSetToArrow(self, vertexSet: list, withId: bool = True,
+            withType: bool = False, types: dict = None) -> 'pa.Table':
+        """Converts a vertex set to Arrow table.
+
+        The columns are the same as those of `vertexSetToDataFrame()`, typed like in
+        `vertexSetToNumpy()`; the vertex type column is dictionary encoded.
+
+        Args:
+            vertexSet:
+                A JSON array containing a vertex set in the format returned by queries.
+            withId:
+                Whether to include vertex primary ID.
+            withType:
+                Whether to include vertex type info.
+            types:
+                A dictionary of `<attribute_name>: <attribute_type_name>` pairs (e.g. `"INT"`,
+                `"DATETIME"`) for attributes whose type is not (or not yet) known from the
+                schema.
+
+        Returns:
+            A `pyarrow.Table`.
+        """
+        return self._elementSetToArrow(vertexSet, "VertexTypes",
+            self._vertexSetColumns(withId, withType), "v_type", types)
+
+    def _vertexSetColumns(self, withId: bool = True, withType: bool = False) -> list:
+        """Returns the non-attribute columns of the tabular formats of vertex sets."""
+        return (["v_id"] if withId else []) + (["v_type"] if withType else [])
@@ -0,0 +1,254 @@
+"""Buffered Writer
+
+A `GraphWriter` collects individual vertex and edge upserts in memory and sends them to the
+database in combined requests (in the format of
+link:https://docs.tigergraph.com/pytigergraph/current/core-functions/schema#_upsertdata[`upsertData()`]),
+from a background thread, whenever a size or time threshold is reached.
+
+Writers are created by calling `writer()` on a `TigerGraphConnection` object.
+"""
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyTigerGraph.pyTigerGraph import TigerGraphConnection
+
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+
+
+class GraphWriter:
+    """Buffers upserts and flushes them in the background.
+
+    Example:
+        [source.wrap,python]
+        ----
+        with conn.writer(maxRecords=5000, flushInterval=2) as w:
+            for p in people:
+                w.upsertVertex("Person", p["id"], {"name": p["name"]})
+            w.upsertEdge("Person", 1, "Friendship", "Person", 2)
+        print(w.getStats())
+        ----
+
+    The upsert functions of the writer can be called from multiple threads. If a flush fails
+    (also in the background), the writer does not accept further records: the error is raised
+    by the upsert functions, `flush()` and `close()` from then on. The failed batches are
+    reported by `getStats()` and can be retried with `upsertData()`.
+    """
+
+    def __init__(self, conn: 'TigerGraphConnection', maxRecords: int = 1000,
+            flushInterval: float = 1.0, maxPending: int = 0, atomic: bool = False,
+            ackAll: bool = False, newVertexOnly: bool = False, vertexMustExist: bool = False,
+            updateVertexOnly: bool = False):
+        """Initiates a writer and starts its background thread.
+
+        Args:
+            conn:
+                The connection the data is written through.
+            maxRecords:
+                The buffer is flushed when this many vertices and edges are collected.
+            flushInterval:
+                The buffer is flushed (at the latest) this many seconds after the previous flush.
+                If `0`, the buffer is only flushed when it is full, when `flush()` is called or
+                when the writer is closed.
+            maxPending:
+                The maximum number of records held in memory. When it is reached, the upsert
+                functions of the writer block until the buffer is flushed. Defaults to
+                `10 * maxRecords`; values below `maxRecords` are raised to `maxRecords`.
+            atomic, ackAll, newVertexOnly, vertexMustExist, updateVertexOnly:
+                Applied to each flush; see `upsertData()`.
+        """
+        self.conn = conn
+        self.maxRecords = maxRecords
+        self.flushInterval = flushInterval
+        # A smaller limit would block the upserts before the buffer is full enough to be flushed
+        self.maxPending = max(maxPending or 10 * maxRecords, maxRecords)
+        self._upsertArgs = (atomic, ackAll, newVertexOnly, vertexMustExist, updateVertexOnly)
+
+        self._records = []
+        self._closed = False
+        self._error = None
+        self._cond = threading.Condition()
+        self._flushLock = threading.Lock()
+        self._lastFlush = time.monotonic()
+        self._stats = {
+            "flushes": 0,
+            "flushed_records": 0,
+            "accepted_vertices": 0,
+            "accepted_edges": 0,
+            "failed_batches": [],
+            "last_flush_latency": 0.0,
+            "max_flush_latency": 0.0,
+            "total_flush_latency": 0.0
+        }
+        self._thread = threading.Thread(target=self._run, name="pyTigerGraph-GraphWriter",
+            daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "GraphWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self.close()
+        except Exception:
+            if exc_type is None:
+                raise
+            # The exception raised in the block is more relevant than the failure of the writer
+
+    def _add(self, path: tuple, attributes: dict):
+        """Adds a record to the buffer, waiting for a flush if the buffer is full.
+
+        Args:
+            path:
+                The location of the record in the upsert payload, see `_upsertDataRecords()`.
+            attributes:
+                The attributes of the record, as returned by `_upsertAttrs()`.
+
+        Raises:
+            `TigerGraphException` if the writer is closed; the error of a failed flush if a flush
+            failed.
+        """
+        with self._cond:
+            while len(self._records) >= self.maxPending and not self._closed and \
+                    self._error is None:
+                self._cond.wait()
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                raise TigerGraphException("The writer is closed.", None)
+            self._records.append((path, attributes))
+            if len(self._records) >= self.maxRecords:
+                self._cond.notify_all()
+
+    def upsertVertex(self, vertexType: str, vertexId: str, attributes: dict = None):
+        """Adds a vertex to the buffer.
+
+        See `upsertVertex()` of `TigerGraphConnection` for the description of the arguments.
+        """
+        self._add(("vertices", vertexType, vertexId), self.conn._upsertAttrs(attributes))
+
+    def upsertEdge(self, sourceVertexType: str, sourceVertexId: str, edgeType: str,
+            targetVertexType: str, targetVertexId: str, attributes: dict = None):
+        """Adds an edge to the buffer.
+
+        See `upsertEdge()` of `TigerGraphConnection` for the description of the arguments.
+        """
+        self._add(("edges", sourceVertexType, sourceVertexId, edgeType, targetVertexType,
+            targetVertexId), self.conn._upsertAttrs(attributes))
+
+    def flush(self):
+        """Sends the buffered records to the database and waits for the result.
+
+        Raises:
+            `TigerGraphException` (or the exception raised while sending the records) if this or
+            an earlier flush failed.
+        """
+        with self._flushLock:
+            with self._cond:
+                records = self._records
+                self._records = []
+                self._lastFlush = time.monotonic()
+                self._cond.notify_all()
+            if records:
+                self._flushRecords(records)
+        with self._cond:
+            if self._error is not None:
+                raise self._error
+
+    def _flushRecords(self, records: list):
+        """Sends records to the database, updates the statistics and records the error if the
+            records could not be (completely) upserted.
+        """
+        start = time.monotonic()
+        try:
+            res = self.conn._upsertDataInBatches(records, self.maxRecords, 0, 1,
+                *self._upsertArgs)
+        except Exception as e:
+            self._setError(e)
+            return
+        latency = time.monotonic() - start
+
+        with self._cond:
+            s = self._stats
+            s["flushes"] += 1
+            s["flushed_records"] += len(records)
+            s["accepted_vertices"] += res.get("accepted_vertices", 0)
+            s["accepted_edges"] += res.get("accepted_edges", 0)
+            s["failed_batches"] += res["failed_batches"]
+            s["last_flush_latency"] = latency
+            s["max_flush_latency"] = max(s["max_flush_latency"], latency)
+            s["total_flush_latency"] += latency
+        failed = res["failed_batches"]
+        if failed:
+            error = failed[0]["error"]
+            e = TigerGraphException("{} of the batches failed to flush; the first error: {}. "
+                "The failed batches are reported by getStats().".format(len(failed),
+                getattr(error, "message", error)), None)
+            e.__cause__ = error
+            self._setError(e)
+
+    def _setError(self, error: Exception):
+        """Records the first error of the writer and wakes up the upserts waiting for a flush."""
+        with self._cond:
+            if self._error is None:
+                self._error = error
+            self._cond.notify_all()
+
+    def _run(self):
+        """The loop of the background thread, flushing the buffer when a threshold is reached."""
+        while True:
+            with self._cond:
+                while not self._closed and len(self._records) < self.maxRecords:
+                    if self.flushInterval > 0:
+                        remaining = self._lastFlush + self.flushInterval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception as e:
+                self._setError(e)  # Raised by the upserts, flush() and close()
+            if closed:
+                return
+
+    def close(self):
+        """Flushes the remaining records and stops the background thread.
+
+        Further upserts raise an exception.
+
+        Raises:
+            `TigerGraphException` (or the exception raised while sending records) if a flush
+            failed. The writer is closed anyway.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+
+    def getStats(self) -> dict:
+        """Returns the statistics of the writer.
+
+        Returns:
+            A dictionary with the following keys:
+            - `queued`: The number of records waiting in the buffer.
+            - `flushes`: The number of flushes that sent data.
+            - `flushed_records`: The number of records sent.
+            - `accepted_vertices`, `accepted_edges`: The number of vertices and edges accepted
+              by the database.
+            - `failed_batches`: The list of failed batches (see `upsertData()`).
+            - `last_flush_latency`, `max_flush_latency`, `avg_flush_latency`: The duration of
+              flushes, in seconds.
+        """
+        with self._cond:
+            ret = dict(self._stats)
+            ret["failed_batches"] = list(ret["failed_batches"])
+            ret["queued"] = len(self._records)
+        total = ret.pop("total_flush_latency")
+        ret["avg_flush_latency"] = total / ret["flushes"] if ret["flushes"] else 0.0
+        return ret
@@ -61,6 +61,10 @@ setup(
     ],
     extras_require={
         "gds": ["pandas", "kafka-python", "numpy"],
+        "async": ["aiohttp"],
+        "fastjson": ["orjson"],
+        "streaming": ["ijson"],
+        "arrow": ["pyarrow"],
     },
     project_urls={
         "Bug Reports": "https://github.com/tigergraph/pyTigerGraph/issues",
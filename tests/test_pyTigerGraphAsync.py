@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+
+import pyTigerGraph as pyTG
+from pyTigerGraphUnitTest import pyTigerGraphUnitTest
+
+
+class test_pyTigerGraphAsync(pyTigerGraphUnitTest):
+    conn = None
+
+    def setUp(self):
+        super().setUp()
+        c = self.conn
+        self.aconn = pyTG.AsyncTigerGraphConnection(host=c.host, graphname=c.graphname,
+            username=c.username, password=c.password, tgCloud=c.tgCloud,
+            restppPort=c.restppPort, gsPort=c.gsPort, gsqlVersion=c.version,
+            certPath=c.certPath, sslPort=c.sslPort)
+
+    def test_01_getVertices(self):
+        async def run():
+            async with self.aconn as conn:
+                return await asyncio.gather(
+                    conn.getVerticesAsync("vertex4", where="a01>=3"),
+                    conn.getVerticesByIdAsync("vertex4", [1, 2, 3]))
+
+        res, resById = asyncio.run(run())
+        self.assertIsInstance(res, list)
+        self.assertEqual(3, len(res))
+        self.assertEqual(sorted(self.conn.getVertices("vertex4", where="a01>=3"),
+            key=lambda v: v["v_id"]), sorted(res, key=lambda v: v["v_id"]))
+        self.assertEqual(["1", "2", "3"], [v["v_id"] for v in resById])
+
+    def test_02_upsertVertices(self):
+        vs = [(300, {"a01": 300}), (301, {"a01": 301})]
+
+        async def run():
+            async with self.aconn as conn:
+                return await conn.upsertVerticesAsync("vertex4", vs)
+
+        self.assertEqual(2, asyncio.run(run()))
+        self.assertEqual(2, self.conn.delVerticesById("vertex4", [300, 301]))
+
+        async def runGenerator():
+            return await self.aconn.upsertVerticesAsync("vertex4", (v for v in vs))
+
+        with self.assertRaises(TypeError):
+            asyncio.run(runGenerator())
+
+    def test_03_runInstalledQuery(self):
+        async def run():
+            async with self.aconn as conn:
+                return await conn.runInstalledQueryAsync("query1")
+
+        self.assertEqual(self.conn.runInstalledQuery("query1"), asyncio.run(run()))
+
+    def test_04_inheritedBlockingFunctions(self):
+        # The blocking functions are inherited unchanged, also those calling the functions
+        # having an asynchronous variant
+        conn = pyTG.AsyncTigerGraphConnection(host=self.conn.host, graphname="tests")
+        vertices = [{"v_id": "1", "v_type": "vertex4", "attributes": {"a01": 1}}]
+        conn._get = lambda url, *args, **kwargs: vertices
+        self.assertEqual(vertices, conn.getVertices("vertex4"))
+        self.assertEqual(vertices, conn.getVerticesById("vertex4", 1))
+        self.assertEqual(vertices, conn.runInstalledQuery("query1"))
+        self.assertEqual([1], list(conn.getVertexDataFrame("vertex4")["a01"]))
+
+        self.assertEqual(self.conn.getEdgesByType("edge1_undirected"),
+            self.aconn.getEdgesByType("edge1_undirected"))
+
+    def test_05_getVerticesByIdAsync(self):
+        async def run():
+            async with self.aconn as conn:
+                return await conn.getVerticesByIdAsync("vertex4", [1, 2, 3], fmt="df",
+                    batchSize=2, concurrency=1)
+
+        self.assertEqual(["1", "2", "3"], list(asyncio.run(run())["v_id"]))
+
+    def test_06_close(self):
+        async def run():
+            await self.aconn.runInstalledQueryAsync("query1")
+            self.assertIsNotNone(self.aconn._asyncSession)
+            session = self.aconn._asyncSession
+            await self.aconn.aclose()
+            return session
+
+        self.assertTrue(asyncio.run(run()).closed)
+        self.assertIsNone(self.aconn._asyncSession)
+
+        # From blocking code
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.aconn.runInstalledQueryAsync("query1"))
+            session = self.aconn._asyncSession
+            self.aconn.getVertexCount("vertex4")
+            self.assertNotEqual({}, self.aconn._sessions)
+            self.aconn.close()
+            self.assertEqual({}, self.aconn._sessions)
+            self.assertTrue(session.closed)
+        finally:
+            loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
+import time
 import unittest
 
+from pyTigerGraph import TigerGraphConnection
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraph.pyTigerGraphToken import RETRY_INTERVAL, TokenManager
 from pyTigerGraphUnitTest import pyTigerGraphUnitTest
 
 
@@ -74,5 +77,72 @@ class test_pyTigerGraphPath(pyTigerGraphUnitTest):
         self.assertTrue(self.conn.deleteToken(res, token))
         self.conn.dropSecret("secret7")
 
+    def test_08_autoRefreshToken(self):
+        res = self.conn.createSecret("secret8", True)
+        secret = res["secret8"]
+        conn2 = TigerGraphConnection(host=self.conn.host, graphname=self.conn.graphname,
+            username=self.conn.username, password=self.conn.password,
+            restppPort=self.conn.restppPort, gsPort=self.conn.gsPort)
+        with self.conn.autoRefreshToken(secret, lifetime=30, refreshBefore=10) as manager:
+            self.assertIs(manager, conn2.autoRefreshToken(secret))
+            # Refreshed shortly after it is issued, not to wait for the end of the lifetime
+            manager._dueTime = lambda token: token["issued"] + 0.2
+            manager.refresh()
+            token = manager.token
+            self.assertIsInstance(token, tuple)
+            self.assertEqual(token[0], self.conn.apiToken)
+            self.assertEqual(token[0], conn2.apiToken)
+
+            waitFor(lambda: manager.token[0] != token[0])
+            self.assertIsNone(manager.lastError)
+            self.assertNotEqual(token[0], manager.token[0])
+            self.assertEqual(manager.token[0], self.conn.apiToken)
+            self.assertEqual(manager.token[0], conn2.apiToken)
+            self.assertIsInstance(self.conn.getVertexCount("*"), dict)
+        self.conn.dropSecret("secret8")
+
+    def test_09_tokenManagerRefresh(self):
+        class Connection:
+            def __init__(self):
+                self.tokens = []
+
+            def _requestToken(self, secret, lifetime):
+                return "token{}".format(len(self.tokens)), time.time() + lifetime
+
+            def _setToken(self, token):
+                self.tokens.append(token)
+
+        conn = Connection()
+        manager = TokenManager("test", "secret", lifetime=30)
+        manager._dueTime = lambda token: token["issued"] + 0.1
+        manager._conns.add(conn)
+        with manager:
+            manager._add(conn)
+            self.assertEqual("token0", manager.token[0])
+            waitFor(lambda: len(set(conn.tokens)) >= 3)
+        self.assertIsNone(manager.lastError)
+        self.assertEqual(conn.tokens[-1], manager.token[0])
+
+    def test_10_dueTime(self):
+        manager = TokenManager("test", "secret", lifetime=30, refreshBefore=10)
+        token = {"token": "t", "issued": 1000.0, "expiration": 1030.0}
+        for _ in range(100):
+            self.assertTrue(1015 <= manager._dueTime(token) <= 1020)
+        # Not earlier than RETRY_INTERVAL seconds after it was issued
+        manager.refreshBefore = 100
+        self.assertEqual(1015, manager._dueTime(token))
+        token["expiration"] = 1005.0
+        self.assertEqual(1000 + RETRY_INTERVAL, manager._dueTime(token))
+
+
+def waitFor(condition, timeout: float = 5):
+    """Waits until a condition is met (polling it), or fails after `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met in {} seconds".format(timeout))
+        time.sleep(0.01)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
+import gzip
 import json
 import unittest
 
+from pyTigerGraph import TigerGraphConnection
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from pyTigerGraphUnitTest import pyTigerGraphUnitTest
 
@@ -90,6 +92,79 @@ class test_pyTigerGraphBase(pyTigerGraphUnitTest):
                 "/vertices/non_existent_vertex_type/1")
         self.assertEqual("REST-30000", tge.exception.code)
 
+    def test_05_sessions(self):
+        restpp = self.conn._getSession(self.conn.restppUrl + "/echo/" + self.conn.graphname)
+        self.assertIs(restpp, self.conn._getSession(self.conn.restppUrl + "/version"))
+        gs = self.conn._getSession(self.conn.gsUrl + "/gsqlserver/gsql/schema")
+        self.assertIsNot(restpp, gs)
+
+        self.conn.close()
+        self.assertIsNot(restpp, self.conn._getSession(self.conn.restppUrl + "/echo"))
+
+    def test_06_compressPayload(self):
+        vids = list(range(4100, 4200))
+        data = json.dumps({"vertices": {"vertex4": {str(i): {} for i in vids}}})
+        self.assertEqual((data, None), self.conn._compressPayload(data))
+
+        self.conn.gzipThreshold = 100
+        try:
+            res, headers = self.conn._compressPayload(data, {"GSQL-TIMEOUT": "1000"})
+            self.assertEqual({"GSQL-TIMEOUT": "1000", "Content-Encoding": "gzip"}, headers)
+            self.assertEqual(data.encode(), gzip.decompress(res))
+            self.assertEqual((b"{}", {}), self.conn._compressPayload(b"{}", {}))
+
+            res = self.conn.upsertData(data)
+            self.assertEqual({"accepted_vertices": 100, "accepted_edges": 0}, res)
+            self.assertEqual(100, self.conn.delVerticesById("vertex4", vids))
+        finally:
+            self.conn.gzipThreshold = 0
+
+    def test_07_prepReq(self):
+        authHeader = self.conn.authHeader
+        expected = dict(authHeader)
+        custom = {"GSQL-TIMEOUT": "1000"}
+
+        headers, data, _ = self.conn._prepReq("POST", headers=custom, data="{}")
+        self.assertEqual(dict(expected, **custom), headers)
+        self.assertEqual("{}", data)
+        self.assertEqual(expected, self.conn.authHeader)
+        self.assertEqual({"GSQL-TIMEOUT": "1000"}, custom)
+
+        headers, data, _ = self.conn._prepReq("GET", authMode="pwd")
+        self.assertTrue(headers["Authorization"].startswith("Basic "))
+        self.assertIsNone(data)
+        self.assertIs(authHeader, self.conn.authHeader)
+
+        token = self.conn.apiToken
+        try:
+            self.conn.apiToken = ("token", 0, "")
+            self.assertEqual("token", self.conn.apiToken)
+            self.assertEqual({"Authorization": "Bearer token"}, self.conn.authHeader)
+            self.assertEqual(expected, authHeader)
+        finally:
+            self.conn.apiToken = token
+
+    def test_08_hostPool(self):
+        self.assertEqual([], self.conn.getHostStats())
+
+        conn = TigerGraphConnection(host=[self.conn.host, self.conn.host],
+            graphname=self.conn.graphname, username=self.conn.username,
+            password=self.conn.password, restppPort=self.conn.restppPort,
+            gsPort=self.conn.gsPort, hostPolicy="round_robin")
+        try:
+            for i in range(4):
+                conn.getVertexCount("*")
+            stats = conn.getHostStats()
+            self.assertEqual(2, len(stats))
+            self.assertEqual([2, 2], [h["requests"] for h in stats])
+            self.assertEqual([0, 0], [h["outstanding"] for h in stats])
+            self.assertEqual([False, False], [h["ejected"] for h in stats])
+        finally:
+            conn.close()
+
+        with self.assertRaises(TigerGraphException):
+            TigerGraphConnection(host=[self.conn.host, self.conn.host], hostPolicy="random")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@ import unittest
 
 import pandas
 
+from pyTigerGraph import TigerGraphConnection
 from pyTigerGraphUnitTest import pyTigerGraphUnitTest
 
 
@@ -215,9 +216,27 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         self.assertIsInstance(res, int)
         self.assertEqual(14, res)
 
+        res = self.conn.upsertEdges("vertex6", "edge4_many_to_many", "vertex7", iter(es))
+        self.assertIsInstance(res, int)
+        self.assertEqual(4, res)
+
+        res = self.conn.upsertEdgesInBatches("vertex6", "edge4_many_to_many", "vertex7", es,
+            batchSize=3)
+        self.assertEqual(4, res["accepted_edges"])
+        self.assertEqual([], res["failed_batches"])
+
+        res = self.conn.getEdgeCount("edge4_many_to_many")
+        self.assertEqual(14, res)
+
     def test_11_upsertEdgeDataFrame(self):
-        # TODO Implement
-        pass
+        df = pandas.DataFrame({"from": [2, 2], "to": [1, 2]})
+        res = self.conn.upsertEdgeDataFrame(df, "vertex6", "edge4_many_to_many", "vertex7",
+            from_id="from", to_id="to", attributes={})
+        self.assertIsInstance(res, int)
+        self.assertEqual(2, res)
+
+        res = self.conn.getEdgeCount("edge4_many_to_many")
+        self.assertEqual(14, res)
 
     def test_12_getEdges(self):
         res = self.conn.getEdges("vertex4", 1)
@@ -263,6 +282,26 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         res = self.conn.getEdgesByType("edge1_undirected")
         self.assertIsInstance(res, list)
         self.assertEqual(8, len(res))
+        # Undirected edges between source vertices are returned once, not from both ends
+        self.assertEqual(8, len(set(frozenset([(e["from_type"], e["from_id"]),
+            (e["to_type"], e["to_id"])]) for e in res)))
+
+        res = self.conn.getEdgesByType("edge1_undirected", fmt="numpy", chunkSize=3,
+            concurrency=2)
+        self.assertEqual(8, len(res["from_id"]))
+        self.assertEqual(8, len(res["to_id"]))
+
+        cursor = {}
+        chunks = list(self.conn.iterEdgesByType("edge1_undirected", chunkSize=3, fmt="df",
+            cursor=cursor))
+        self.assertEqual(8, sum(len(c.index) for c in chunks))
+        self.assertEqual(cursor["partitions"], len(cursor["done"]))
+
+        cursor = {}
+        chunks = list(self.conn.iterEdgesByType("edge1_undirected", chunkSize=1,
+            maxPartitions=3, cursor=cursor))
+        self.assertEqual(3, cursor["partitions"])
+        self.assertEqual(8, sum(len(c) for c in chunks))
 
     def test_15_getEdgesDataFrameByType(self):
         pass
@@ -331,7 +370,34 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         self.assertEqual(3, res["edge4_many_to_many"])
 
     def test_18_edgeSetToDataFrame(self):
-        pass
+        res = self.conn.edgeSetToDataFrame(self.conn.getEdgesByType("edge1_undirected"),
+            withType=True)
+        self.assertEqual(8, len(res.index))
+        self.assertEqual(["from_type", "from_id", "to_type", "to_id", "e_type", "a01"],
+            list(res.columns))
+        self.assertEqual("category", str(res["e_type"].dtype))
+        self.assertEqual("int64", str(res["a01"].dtype))
+
+    def test_19_getEdgesByTypeInterpreted(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        edges = [{"e_type": "edge1", "from_type": "vertex4", "from_id": "1", "to_type": "vertex4",
+            "to_id": "2", "directed": False, "attributes": {}}]
+        queries = []
+
+        def runInterpretedQuery(queryText, params=None, **kwargs):
+            queries.append((queryText, params))
+            return [{"edges": edges}]
+
+        def installHelperQuery(name, text):
+            raise AssertionError("Unexpected installation of " + name)
+
+        conn.getEdgeSourceVertexType = lambda edgeType: {"vertex5", "vertex4"}
+        conn.runInterpretedQuery = runInterpretedQuery
+        conn._installHelperQuery = installHelperQuery
+        self.assertEqual(edges, conn.getEdgesByType("edge1"))
+        self.assertTrue(queries[0][0].lstrip().startswith("INTERPRET QUERY"))
+        self.assertEqual({"sourceVertexTypes": ["vertex4", "vertex5"], "edgeType": "edge1",
+            "partitions": 1, "partition": 0}, queries[0][1])
 
 
 if __name__ == '__main__':
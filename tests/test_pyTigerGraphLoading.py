@@ -0,0 +1,243 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+import numpy
+import pandas
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraphUnitTest import pyTigerGraphUnitTest
+
+
+class test_pyTigerGraphLoading(pyTigerGraphUnitTest):
+    conn = None
+
+    def test_01_readFileChunks(self):
+        data = b"1,a\n2,b\n3,c\n4,d\n"
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data), 6))
+        self.assertEqual(b"".join(c[1] for c in chunks), data)
+        for info, chunk in chunks:
+            self.assertTrue(chunk.endswith(b"\n"))
+            self.assertEqual(data[info["offset"]:info["offset"] + info["size"]], chunk)
+
+        # No line ending at the end of the file
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data[:-1]), 6))
+        self.assertEqual(b"".join(c[1] for c in chunks), data[:-1])
+
+        # Lines longer than the chunk size
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data), 2))
+        self.assertEqual([c[1] for c in chunks], [b"1,a\n", b"2,b\n", b"3,c\n", b"4,d\n"])
+
+        data = b"1,a\r\n2,b\r\n3,c\r\n"
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data), 7, "\r\n"))
+        self.assertEqual(b"".join(c[1] for c in chunks), data)
+        for info, chunk in chunks:
+            self.assertTrue(chunk.endswith(b"\r\n"))
+
+    def test_02_readFileChunksQuoted(self):
+        data = b'1,"a\nb"\n2,"c ""d""\ne"\n3,f\n'
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data), 5, quote='"'))
+        self.assertEqual([c[1] for c in chunks], [b'1,"a\nb"\n', b'2,"c ""d""\ne"\n', b"3,f\n"])
+        self.assertEqual([c[0]["offset"] for c in chunks], [0, 8, 22])
+
+        # Without quote, chunks can end inside quoted values
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data), 5))
+        self.assertEqual(b'1,"a\n', chunks[0][1])
+
+    def test_03_mergeLoadingStats(self):
+        stats1 = [{
+            "sourceFileName": "Online_POST",
+            "statistics": {
+                "validLine": 3,
+                "rejectLine": 1,
+                "vertex": [{"typeName": "vertex1", "validObject": 3, "invalidAttribute": 0}],
+                "edge": [{"typeName": "edge1", "validObject": 2}]
+            }
+        }]
+        stats2 = [{
+            "sourceFileName": "Online_POST",
+            "statistics": {
+                "validLine": 2,
+                "rejectLine": 0,
+                "vertex": [
+                    {"typeName": "vertex1", "validObject": 1, "invalidAttribute": 1},
+                    {"typeName": "vertex2", "validObject": 2}
+                ],
+                "edge": []
+            }
+        }]
+        res = self.conn._mergeLoadingStats([], stats1)
+        self.assertEqual(stats1, res)
+
+        res = self.conn._mergeLoadingStats(stats1, stats2)
+        self.assertEqual(1, len(res))
+        stats = res[0]["statistics"]
+        self.assertEqual(5, stats["validLine"])
+        self.assertEqual(1, stats["rejectLine"])
+        self.assertEqual([
+            {"typeName": "vertex1", "validObject": 4, "invalidAttribute": 1},
+            {"typeName": "vertex2", "validObject": 2}
+        ], stats["vertex"])
+        self.assertEqual([{"typeName": "edge1", "validObject": 2}], stats["edge"])
+        # The inputs are not modified
+        self.assertEqual(3, stats1[0]["statistics"]["validLine"])
+
+        res = self.conn._mergeLoadingStats([{"sourceFileName": "a", "ok": True, "n": 1}],
+            [{"sourceFileName": "b", "ok": False, "n": 1}])
+        self.assertEqual(["a", "b"], [s["sourceFileName"] for s in res])
+        res = self.conn._mergeLoadingStats([{"sourceFileName": "a", "ok": True}],
+            [{"sourceFileName": "a", "ok": False}])
+        self.assertEqual([{"sourceFileName": "a", "ok": False}], res)
+
+    def test_04_csvChunks(self):
+        df = pandas.DataFrame({
+            "id": ["a", "b", "c", "d", "e"],
+            "name": ["x", "y, z", 'q"r', "s\nt", None],
+            "score": [1.5, numpy.nan, 3.0, 4.25, 5.0]
+        })
+        chunks = list(self.conn._csvChunks(df, None, ",", "\n", 2))
+        self.assertEqual([{"offset": 0, "rows": 2}, {"offset": 2, "rows": 2},
+            {"offset": 4, "rows": 1}], [c[0] for c in chunks])
+
+        # No header; the values survive a round-trip; missing values are empty
+        rows = list(csv.reader(io.StringIO(b"".join(c[1] for c in chunks).decode())))
+        self.assertEqual([
+            ["a", "x", "1.5"],
+            ["b", "y, z", ""],
+            ["c", 'q"r', "3.0"],
+            ["d", "s\nt", "4.25"],
+            ["e", "", "5.0"]
+        ], rows)
+
+        # Selected columns, in the specified order, with another separator
+        chunks = list(self.conn._csvChunks(df, ["score", "id"], "|", "\n", 10))
+        self.assertEqual(1, len(chunks))
+        self.assertEqual(b"1.5|a\n|b\n3.0|c\n4.25|d\n5.0|e\n", chunks[0][1])
+
+        # Iterables of rows are written the same way as DataFrames
+        chunks = list(self.conn._csvChunks(iter(df.itertuples(index=False)), None, ",", "\n", 2))
+        self.assertEqual([{"offset": 0, "rows": 2}, {"offset": 2, "rows": 2},
+            {"offset": 4, "rows": 1}], [c[0] for c in chunks])
+        self.assertEqual(rows,
+            list(csv.reader(io.StringIO(b"".join(c[1] for c in chunks).decode()))))
+
+    def test_05_runLoadingJobWithDataFrame(self):
+        uploads = []
+
+        def post(url, params=None, data=None, headers=None, **kwargs):
+            uploads.append((params, data))
+            return [{"sourceFileName": "Online_POST",
+                "statistics": {"validLine": data.count(b"\n")}}]
+
+        self.conn._post = post
+        self.conn.gzipThreshold = 0
+        df = pandas.DataFrame({"id": range(5), "value": [0.5, None, 1.5, 2.5, 3.5]})
+        res = self.conn.runLoadingJobWithDataFrame(df, "file1", "job1", batchSize=2)
+        self.assertEqual([], res["failed_chunks"])
+        self.assertEqual(5, res["results"][0]["statistics"]["validLine"])
+        self.assertEqual(3, len(uploads))
+        self.assertEqual({"tag": "job1", "filename": "file1"}, uploads[0][0])
+        self.assertEqual(b"0,0.5\n1,\n2,1.5\n3,2.5\n4,3.5\n", b"".join(u[1] for u in uploads))
+
+    def test_06_runLoadingJobWithFiles(self):
+        def post(url, params=None, data=None, headers=None, **kwargs):
+            return [{"sourceFileName": "Online_POST",
+                "statistics": {"validLine": data.count(b"\n")}}]
+
+        self.conn._post = post
+        self.conn.gzipThreshold = 0
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(3):
+                path = os.path.join(tmp, "data{}.csv".format(i))
+                with open(path, "wb") as f:
+                    f.write(b"1,a\n" * (i + 1))
+                paths.append(path)
+
+            res = self.conn.runLoadingJobWithFiles(os.path.join(tmp, "*.csv"), "job1", "file1")
+            self.assertEqual([], res["failed_files"])
+            self.assertEqual(paths, [r["file"] for r in res["files"]])
+            self.assertEqual(paths, [r["results"][0]["sourceFileName"] for r in res["files"]])
+            self.assertEqual(paths, [r["sourceFileName"] for r in res["results"]])
+            self.assertEqual([1, 2, 3], [r["statistics"]["validLine"] for r in res["results"]])
+            self.assertEqual(6, res["rows"])
+            self.assertEqual(24, res["bytes"])
+
+            res = self.conn.runLoadingJobWithFiles({paths[0]: "file1",
+                os.path.join(tmp, "missing.csv"): "file1"}, "job1", chunkSize=4)
+            self.assertEqual([paths[0]], [r["sourceFileName"] for r in res["results"]])
+            self.assertEqual(1, len(res["failed_files"]))
+            self.assertIn("error", res["failed_files"][0])
+
+    def test_07_readFileChunksHeader(self):
+        data = b"id,name\n1,a\n2,b\n3,c\n"
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data), 6, header=True))
+        self.assertEqual([b"id,name\n1,a\n2,b\n", b"id,name\n3,c\n"], [c[1] for c in chunks])
+        self.assertEqual([{"offset": 8, "size": 8}, {"offset": 16, "size": 4}],
+            [c[0] for c in chunks])
+
+        # A header line longer than the chunk size
+        chunks = list(self.conn._readFileChunks(io.BytesIO(data), 2, header=True))
+        self.assertEqual([b"id,name\n1,a\n", b"id,name\n2,b\n", b"id,name\n3,c\n"],
+            [c[1] for c in chunks])
+
+        self.assertEqual([], list(self.conn._readFileChunks(io.BytesIO(b"id,name\n"), 4,
+            header=True)))
+
+    def test_08_runLoadingJobWithFileHeader(self):
+        uploads = []
+
+        def post(url, params=None, data=None, headers=None, **kwargs):
+            uploads.append(data)
+            # The server skips the first line of each upload of a HEADER="true" job
+            return [{"sourceFileName": "Online_POST",
+                "statistics": {"validLine": data.count(b"\n") - 1}}]
+
+        self.conn._post = post
+        self.conn.gzipThreshold = 0
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.csv")
+            with open(path, "wb") as f:
+                f.write(b"id,name\n" + b"".join(b"%d,a\n" % i for i in range(10)))
+            res = self.conn.runLoadingJobWithFile(path, "file1", "job1", chunkSize=10,
+                header=True)
+        self.assertEqual([], res["failed_chunks"])
+        self.assertEqual(10, res["results"][0]["statistics"]["validLine"])
+        self.assertTrue(all(u.startswith(b"id,name\n") for u in uploads))
+
+    def test_09_chunkRetries(self):
+        attempts = []
+
+        def post(url, params=None, data=None, headers=None, **kwargs):
+            attempts.append(data)
+            raise errors.pop(0)
+
+        self.conn._post = post
+        self.conn.gzipThreshold = 0
+        refused = requests.exceptions.ConnectionError(MaxRetryError(None, "/ddl",
+            NewConnectionError(None, "Connection refused")))
+        reset = requests.exceptions.ConnectionError("Connection reset by peer")
+
+        # Connection failures are retried, as the chunk was not sent
+        errors = [refused, TigerGraphException("Loading failed", None)]
+        res = self.conn._runLoadingJobWithChunks([({"offset": 0}, b"1,a\n")], "file1", "job1",
+            retries=2)
+        self.assertEqual(2, len(attempts))
+        self.assertIsInstance(res["failed_chunks"][0]["error"], TigerGraphException)
+
+        # Other failures are not, as the chunk may have been loaded
+        for e in (reset, TigerGraphException("Loading failed", None)):
+            attempts.clear()
+            errors = [e]
+            res = self.conn._runLoadingJobWithChunks([({"offset": 0}, b"1,a\n")], "file1",
+                "job1", retries=2)
+            self.assertEqual(1, len(attempts))
+            self.assertIs(e, res["failed_chunks"][0]["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
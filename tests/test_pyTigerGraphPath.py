@@ -67,7 +67,7 @@ class test_pyTigerGraphPath(pyTigerGraphUnitTest):
         srcs = res["sources"]
         self.assertIsInstance(srcs, list)
         self.assertEqual(3, len(srcs))
-        self.assertEqual('{"type": "srctype1", "id": 1}', json.dumps(srcs[0]))
+        self.assertEqual({"type": "srctype1", "id": 1}, srcs[0])
         self.assertIn("targets", res)
         self.assertIn("vertexFilters", res)
         self.assertIn("edgeFilters", res)
@@ -76,9 +76,10 @@ class test_pyTigerGraphPath(pyTigerGraphUnitTest):
         self.assertTrue(res["allShortestPaths"])
 
         res = self.conn._preparePathParams([("srct", 1)], [("trgt", 1)])
+        self.assertIsInstance(res, str)
         self.assertEqual(
-            '{"sources": [{"type": "srct", "id": 1}], "targets": [{"type": "trgt", "id": 1}]}',
-            res
+            {"sources": [{"type": "srct", "id": 1}], "targets": [{"type": "trgt", "id": 1}]},
+            json.loads(res)
         )
 
     def test_02_shortestPath(self):
@@ -1,6 +1,9 @@
+import json
 import unittest
 from datetime import datetime
 
+from pyTigerGraph import TigerGraphConnection
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from pyTigerGraphUnitTest import pyTigerGraphUnitTest
 
 
@@ -22,6 +25,13 @@ class test_pyTigerGraphQuery(pyTigerGraphUnitTest):
         self.assertIn("ret", res[0])
         self.assertEqual(15, res[0]["ret"])
 
+        res = self.conn.runInstalledQuery("query1", fmt="raw")
+        self.assertIsInstance(res, bytes)
+        self.assertEqual(15, json.loads(res)["results"][0]["ret"])
+
+        res = list(self.conn.runInstalledQuery("query1", fmt="stream"))
+        self.assertEqual(15, res[0]["ret"])
+
         params = {
             "p01_int": 1,
             "p02_uint": 1,
@@ -79,6 +89,69 @@ class test_pyTigerGraphQuery(pyTigerGraphUnitTest):
         self.assertIn("ret", res[0])
         self.assertEqual(15, res[0]["ret"])
 
+        res = self.conn.runInterpretedQuery(queryText, fmt="raw")
+        self.assertIsInstance(res, bytes)
+        self.assertEqual(15, json.loads(res)["results"][0]["ret"])
+
+    def test_05_installHelperQuery(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        endpoint = "GET /query/tests/pyTG_test"
+        installed = {}
+        statements = []
+
+        def gsql(query, *args, **kwargs):
+            statements.append(query)
+            if "SUCCEED" in query:
+                installed[endpoint] = {}
+            return "Query installation finished."
+
+        conn.gsql = gsql
+        conn.getInstalledQueries = lambda *args, **kwargs: installed
+        with self.assertRaises(TigerGraphException):
+            conn._installHelperQuery("pyTG_test",
+                "CREATE QUERY pyTG_test() FOR GRAPH $graphname {}")
+        self.assertIn("FOR GRAPH tests", statements[0])
+
+        self.assertEqual("pyTG_test", conn._installHelperQuery("pyTG_test", "SUCCEED"))
+        # Not installed again
+        self.assertEqual("pyTG_test", conn._installHelperQuery("pyTG_test", "SUCCEED"))
+        self.assertEqual(2, len(statements))
+
+    def test_06_dropHelperQueries(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        installed = {"GET /query/tests/query1": {}, "GET /query/tests/pyTG_iterVertices_vertex4": {},
+            "GET /query/tests/pyTG_getVerticesById": {}, "GET /query/other/pyTG_test": {}}
+        statements = []
+
+        def gsql(query, *args, **kwargs):
+            statements.append(query)
+            for name in query.split("DROP QUERY ")[1].split(", "):
+                del installed["GET /query/tests/" + name]
+            return "Query dropped."
+
+        conn.gsql = gsql
+        conn.getInstalledQueries = lambda *args, **kwargs: installed
+        conn._helperQueries.add("pyTG_getVerticesById")
+        self.assertEqual(["pyTG_iterVertices_vertex4", "pyTG_getVerticesById"],
+            conn.dropHelperQueries())
+        self.assertEqual(["GET /query/tests/query1", "GET /query/other/pyTG_test"], list(installed))
+        self.assertEqual(set(), conn._helperQueries)
+        self.assertEqual([], conn.dropHelperQueries())
+        self.assertEqual(1, len(statements))
+
+    def test_07_filterToPredicate(self):
+        predicate = self.conn._filterToPredicate('a01>1,a01<=5.5,name="Alice, B",ok=true')
+        self.assertTrue(predicate({"a01": 2, "name": "Alice, B", "ok": True}))
+        self.assertFalse(predicate({"a01": 1, "name": "Alice, B", "ok": True}))
+        self.assertFalse(predicate({"a01": 6, "name": "Alice, B", "ok": True}))
+        self.assertFalse(predicate({"a01": 2, "name": "Alice", "ok": True}))
+        self.assertFalse(predicate({"a01": "2", "name": "Alice, B", "ok": True}))
+        self.assertFalse(predicate({"a01": 2}))
+        self.assertTrue(self.conn._filterToPredicate('t>="2023-01-01 00:00:00"')(
+            {"t": "2023-01-02 00:00:00"}))
+        with self.assertRaises(TigerGraphException):
+            self.conn._filterToPredicate("a01")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,14 @@
 import json
+import os
+import tempfile
+import threading
+import time
 import unittest
 
+import requests
+
+from pyTigerGraph import TigerGraphConnection
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from .pyTigerGraphUnitTest import pyTigerGraphUnitTest
 
 
@@ -138,6 +146,21 @@ class test_pyTigerGraphSchema(pyTigerGraphUnitTest):
         res = self.conn.delVerticesById("vertex5", [5000, 5001])
         self.assertEqual(2, res)
 
+        res = self.conn.upsertData(data, batchSize=2, concurrency=2)
+        self.assertEqual({"accepted_vertices": 4, "accepted_edges": 3, "failed_batches": []},
+            res)
+
+        res = self.conn.upsertData(json.dumps(data), batchBytes=100)
+        self.assertEqual(4, res["accepted_vertices"])
+        self.assertEqual(3, res["accepted_edges"])
+        self.assertEqual([], res["failed_batches"])
+
+        res = self.conn.delVertices("vertex4", where="a01>1000")
+        self.assertEqual(2, res)
+
+        res = self.conn.delVerticesById("vertex5", [5000, 5001])
+        self.assertEqual(2, res)
+
         """
                v4     v5       
         7000   🔵️———🔵️
@@ -364,6 +387,167 @@ class test_pyTigerGraphSchema(pyTigerGraphUnitTest):
         res = self.conn.getEndpoints(dynamic=True)
         self.assertEqual(4, len(res))
 
+    def test_06_writer(self):
+        with self.conn.writer(maxRecords=3, flushInterval=0.1) as w:
+            for i in range(4000, 4010):
+                w.upsertVertex("vertex4", i, {"a01": i})
+            w.upsertEdge("vertex4", 4000, "edge2_directed", "vertex5", 5000)
+        res = w.getStats()
+        self.assertEqual(0, res["queued"])
+        self.assertEqual(11, res["flushed_records"])
+        self.assertEqual(10, res["accepted_vertices"])
+        self.assertEqual(1, res["accepted_edges"])
+        self.assertEqual([], res["failed_batches"])
+
+        with self.assertRaises(TigerGraphException):
+            w.upsertVertex("vertex4", 4010)
+
+        res = self.conn.delVertices("vertex4", where="a01>=4000,a01<4010")
+        self.assertEqual(10, res)
+
+        res = self.conn.delVerticesById("vertex5", 5000)
+        self.assertEqual(1, res)
+
+        with self.conn.writer(maxRecords=10, flushInterval=0, maxPending=3) as w:
+            self.assertEqual(10, w.maxPending)
+
+    def test_07_batchUpsertData(self):
+        records = [
+            (("vertices", "vertex4", 1), self.conn._upsertAttrs({"a01": (1, "+")})),
+            (("vertices", "vertex4", "1"), self.conn._upsertAttrs({"a01": (2, "+")})),
+            (("vertices", "vertex4", 2), self.conn._upsertAttrs({"a01": 5})),
+            (("vertices", "vertex4", 2), self.conn._upsertAttrs({"a01": (7, "max")})),
+            (("edges", "vertex4", 1, "edge1_undirected", "vertex4", 2),
+                self.conn._upsertAttrs({"a01": (3, "min")})),
+            (("edges", "vertex4", 1, "edge1_undirected", "vertex4", 2),
+                self.conn._upsertAttrs({"a01": (4, "min")})),
+            (("vertices", "vertex4", 1), self.conn._upsertAttrs({"a01": (1, "max")}))
+        ]
+        res = list(self.conn._batchUpsertData(records))
+        exp = [
+            {
+                "vertices": {"vertex4": {
+                    "1": {"a01": {"value": 3, "op": "+"}},
+                    "2": {"a01": {"value": 7}}
+                }},
+                "edges": {"vertex4": {"1": {"edge1_undirected": {"vertex4": {
+                    "2": {"a01": {"value": 3, "op": "min"}}
+                }}}}}
+            },
+            {"vertices": {"vertex4": {"1": {"a01": {"value": 1, "op": "max"}}}}}
+        ]
+        self.assertEqual(exp, res)
+
+    def test_08_getSchemaIndex(self):
+        schema = self.conn.getSchema()
+        index = self.conn._getSchemaIndex()
+        self.assertIs(index, self.conn._getSchemaIndex())
+        self.assertEqual([vt["Name"] for vt in schema["VertexTypes"]], list(index["VertexTypes"]))
+        self.assertEqual({"a01": "INT"}, index["AttributeTypes"]["VertexTypes"]["vertex4"])
+        self.assertEqual("vertex4", index["SourceVertexTypes"]["edge1_undirected"])
+        self.assertEqual({"vertex5", "vertex6", "vertex7"},
+            index["TargetVertexTypes"]["edge4_many_to_many"])
+        self.assertEqual("edge3_directed_with_reverse_reverse_edge",
+            index["ReverseEdges"]["edge3_directed_with_reverse"])
+
+        self.assertIsNot(index, self.conn._getSchemaIndex(force=True))
+
+    def test_09_metadataCache(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.conn.metadataCache = d
+            schema = self.conn.getSchema(force=True)
+            queries = self.conn.getInstalledQueries(force=True)
+            self.assertEqual(1, len(os.listdir(d)))
+
+            # A new connection to the same graph
+            self.conn.schema = None
+            self.conn._metadataCacheEntry = None
+            self.assertEqual(schema, self.conn.getSchema())
+            self.assertEqual(queries, self.conn.getInstalledQueries())
+
+            self.conn.metadataCacheTTL = 0
+            self.conn.schema = None
+            self.conn._metadataCacheEntry = None
+            self.assertNotIn("schema", self.conn._getMetadataCache())
+            self.conn.metadataCache = None
+
+    def test_10_metadataCacheConcurrentWrites(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.conn.metadataCache = d
+            self.conn._metadataCacheEntry = {"version": "test", "time": time.time()}
+            errors = []
+
+            def update():
+                try:
+                    for _ in range(20):
+                        self.conn._updateMetadataCache("schema", {"VertexTypes": []})
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=update) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual([], errors)
+            # Only the cache file remains, and it is complete
+            self.assertEqual([os.path.basename(self.conn._metadataCachePath())], os.listdir(d))
+            with open(self.conn._metadataCachePath()) as f:
+                self.assertEqual({"VertexTypes": []}, json.load(f)["schema"])
+            self.conn.metadataCache = None
+            self.conn._metadataCacheEntry = None
+
+    def test_11_metadataCacheFailedVersionProbe(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        schemas = []
+
+        def get(url, *args, **kwargs):
+            schemas.append({"VertexTypes": [], "EdgeTypes": [], "n": len(schemas)})
+            return schemas[-1]
+
+        class Session:
+            def request(self, method, url, **kwargs):
+                raise requests.exceptions.ConnectionError("version probe failed")
+
+        conn._get = get
+        conn._getSession = lambda url: Session()
+        with tempfile.TemporaryDirectory() as d:
+            conn.metadataCache = d
+            conn._updateMetadataCache("schema", {"VertexTypes": [], "EdgeTypes": [], "n": -1})
+
+            # The cached schema is not used, the schema is retrieved as usual
+            conn._metadataCacheEntry = None
+            self.assertEqual(0, conn.getSchema(udts=False)["n"])
+            conn.schema = None
+            conn._metadataCacheEntry = None
+            self.assertEqual(1, conn.getSchema(udts=False)["n"])
+
+    def test_12_writerErrors(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        conn._upsertDataInBatches = lambda records, *args: {"accepted_vertices": 0,
+            "accepted_edges": 0, "failed_batches": [{"data": {}, "error": ValueError("x")}]}
+
+        # A failed background flush is raised by the upserts, which do not block
+        w = conn.writer(maxRecords=2, flushInterval=0, maxPending=2)
+        with self.assertRaises(TigerGraphException):
+            for i in range(10):
+                w.upsertVertex("vertex4", i)
+        with self.assertRaises(TigerGraphException):
+            w.flush()
+        with self.assertRaises(TigerGraphException):
+            w.close()
+        self.assertEqual(1, len(w.getStats()["failed_batches"]))
+
+        # Exceptions raised while sending are raised, too
+        def upsert(records, *args):
+            raise RuntimeError("Encoding failed")
+
+        conn._upsertDataInBatches = upsert
+        with self.assertRaises(RuntimeError):
+            with conn.writer(maxRecords=2, flushInterval=0) as w:
+                w.upsertVertex("vertex4", 1)
+        self.assertFalse(w._thread.is_alive())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@ import unittest
 
 import pandas
 
+from pyTigerGraph import TigerGraphConnection
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from pyTigerGraphUnitTest import pyTigerGraphUnitTest
 
@@ -117,9 +118,45 @@ class test_pyTigerGraphVertex(pyTigerGraphUnitTest):
         self.assertIsInstance(res, list)
         self.assertEqual(res, [])
 
+        res = self.conn.upsertVertices("vertex4", vs[1:], batchSize=2, concurrency=2, ackAll=True)
+        self.assertIsInstance(res, int)
+        self.assertEqual(3, res)
+
+        res = self.conn.delVertices("vertex4", "a01>100")
+        self.assertEqual(3, res)
+
+        res = self.conn.upsertVertices("vertex4", ((i, {"a01": i}) for i in range(300, 310)))
+        self.assertIsInstance(res, int)
+        self.assertEqual(10, res)
+
+        res = self.conn.delVertices("vertex4", "a01>100")
+        self.assertEqual(10, res)
+
+        res = self.conn.upsertVerticesInBatches("vertex4",
+            ((i, {"a01": i}) for i in range(300, 310)), batchSize=4)
+        self.assertEqual(10, res["accepted_vertices"])
+        self.assertEqual([], res["failed_batches"])
+
+        res = self.conn.delVertices("vertex4", "a01>100")
+        self.assertEqual(10, res)
+
     def test_06_upsertVertexDataFrame(self):
-        # TODO Implement
-        pass
+        df = pandas.DataFrame({"id": [300, 301, 302], "value": [300, 301, 302]})
+        res = self.conn.upsertVertexDataFrame(df, "vertex4", v_id="id",
+            attributes={"a01": "value"})
+        self.assertIsInstance(res, int)
+        self.assertEqual(3, res)
+
+        df = pandas.DataFrame({"a01": [10, None]}, index=[300, 301])
+        res = self.conn.upsertVertexDataFrame(df, "vertex4", ops={"a01": "+"}, skipNA=True)
+        self.assertEqual(2, res)
+
+        res = self.conn.getVerticesById("vertex4", [300, 301])
+        self.assertEqual(310, res[0]["attributes"]["a01"])
+        self.assertEqual(301, res[1]["attributes"]["a01"])
+
+        res = self.conn.delVerticesById("vertex4", [300, 301, 302])
+        self.assertEqual(3, res)
 
     def test_07_getVertices(self):
         res = self.conn.getVertices("vertex4", select="a01", where="a01>1,a01<5", sort="-a01",
@@ -143,6 +180,26 @@ class test_pyTigerGraphVertex(pyTigerGraphUnitTest):
         self.assertIsInstance(res, pandas.DataFrame)
         self.assertEqual(2, len(res.index))
 
+        res = self.conn.getVertices("vertex4", select="a01", where="a01>1,a01<5", sort="-a01",
+            limit=2, fmt="raw")
+        self.assertIsInstance(res, bytes)
+        res = json.loads(res)
+        self.assertFalse(res["error"])
+        self.assertEqual(2, len(res["results"]))
+
+        with self.assertRaises(TigerGraphException):
+            self.conn.getVertices("non_existing_vertex_type", fmt="raw")
+
+        res = self.conn.getVertices("vertex4", select="a01", where="a01>1,a01<5", sort="-a01",
+            limit=2, fmt="stream")
+        self.assertNotIsInstance(res, list)
+        res = list(res)
+        self.assertEqual(2, len(res))
+        self.assertEqual("vertex4", res[0]["v_type"])
+
+        with self.assertRaises(TigerGraphException):
+            list(self.conn.getVertices("non_existing_vertex_type", fmt="stream"))
+
     def test_08_getVertexDataFrame(self):
         res = self.conn.getVertexDataFrame("vertex4", select="a01", where="a01>1,a01<5",
             sort="-a01",
@@ -150,6 +207,31 @@ class test_pyTigerGraphVertex(pyTigerGraphUnitTest):
         self.assertIsInstance(res, pandas.DataFrame)
         self.assertEqual(2, len(res.index))
 
+        expected = self.conn.getVertexCount("vertex4", where="a01>1")
+        cursor = {}
+        chunks = list(self.conn.iterVertices("vertex4", select="a01", where="a01>1",
+            chunkSize=2, fmt="df", cursor=cursor))
+        self.assertEqual(expected, sum(len(c.index) for c in chunks))
+        self.assertEqual(cursor["partitions"], len(cursor["done"]))
+        self.assertEqual([], list(self.conn.iterVertices("vertex4", select="a01", where="a01>1",
+            cursor=cursor)))
+
+        cursor = {}
+        it = self.conn.iterVertices("vertex4", chunkSize=2, cursor=cursor)
+        res = next(it)
+        res += [v for c in self.conn.iterVertices("vertex4", cursor=dict(cursor),
+            concurrency=2) for v in c]
+        self.assertEqual(self.conn.getVertexCount("vertex4"), len(res))
+
+        with self.assertRaises(TigerGraphException):
+            next(self.conn.iterVertices("vertex5", cursor=cursor))
+
+        cursor = {}
+        chunks = list(self.conn.iterVertices("vertex4", chunkSize=1, maxPartitions=2,
+            cursor=cursor))
+        self.assertEqual(2, cursor["partitions"])
+        self.assertEqual(self.conn.getVertexCount("vertex4"), sum(len(c) for c in chunks))
+
     def test_09_getVerticesById(self):
         res = self.conn.getVerticesById("vertex4", [1, 3, 5], select="a01")  # select is ignored
         self.assertIsInstance(res, list)
@@ -164,11 +246,23 @@ class test_pyTigerGraphVertex(pyTigerGraphUnitTest):
         res = self.conn.getVerticesById("vertex4", [1, 3, 5], fmt="df")
         self.assertIsInstance(res, pandas.DataFrame)
 
+        res = self.conn.getVerticesById("vertex4", [5, 1, 3], concurrency=3)
+        self.assertEqual(["5", "1", "3"], [v["v_id"] for v in res])
+
+        res = self.conn.getVerticesById("vertex4", [5, 1, 3, 2], select="a01", batchSize=2,
+            concurrency=2)
+        self.assertEqual(["5", "1", "3", "2"], [v["v_id"] for v in res])
+        self.assertEqual({"a01": 5}, res[0]["attributes"])
+
     def test_10_getVertexDataFrameById(self):
         res = self.conn.getVertexDataFrameById("vertex4", [1, 3, 5])
         self.assertIsInstance(res, pandas.DataFrame)
         self.assertEqual(3, len(res.index))
 
+        res = self.conn.getVertexDataFrameById("vertex4", [1, 3, 5], batchSize=2)
+        self.assertIsInstance(res, pandas.DataFrame)
+        self.assertEqual(["1", "3", "5"], list(res["v_id"]))
+
     def test_11_getVertexStats(self):
         res = self.conn.getVertexStats("*", skipNA=True)
         self.assertIsInstance(res, dict)
@@ -215,6 +309,19 @@ class test_pyTigerGraphVertex(pyTigerGraphUnitTest):
         self.assertIsInstance(res, int)
         self.assertEqual(2, res)
 
+        vs = [(i, {"a01": i}) for i in range(400, 410)]
+        self.conn.upsertVertices("vertex4", vs)
+        res = self.conn.delVerticesById("vertex4", [v[0] for v in vs], batchSize=3,
+            concurrency=2)
+        self.assertIsInstance(res, int)
+        self.assertEqual(10, res)
+
+        self.conn.upsertVertices("vertex4", vs)
+        res = self.conn.delVerticesByIdInBatches("vertex4", [v[0] for v in vs], batchSize=3,
+            concurrency=2)
+        self.assertEqual(10, res["deleted_vertices"])
+        self.assertEqual([], res["failed_batches"])
+
     def test_14_delVerticesByType(self):
         pass
         # TODO Implement pyTigergraphVertices.delVerticesByType() first
@@ -228,6 +335,164 @@ class test_pyTigerGraphVertex(pyTigerGraphUnitTest):
         self.assertIsInstance(res, pandas.DataFrame)
         self.assertEqual(5, len(res.index))
         self.assertEqual(["v_id","a01"], list(res.columns))
+        self.assertEqual("int64", str(res["a01"].dtype))
+
+        res = self.conn.vertexSetToDataFrame(self.conn.getVertices("vertex4"), withType=True)
+        self.assertEqual(["v_id", "v_type", "a01"], list(res.columns))
+        self.assertEqual("category", str(res["v_type"].dtype))
+
+        res = self.conn.vertexSetToDataFrame([])
+        self.assertEqual(0, len(res.index))
+
+        res = self.conn.getVertices("vertex4", fmt="numpy", withType=True)
+        self.assertEqual(["v_id", "v_type", "a01"], list(res))
+        self.assertEqual(5, len(res["v_id"]))
+        self.assertEqual("int64", str(res["a01"].dtype))
+
+        res = self.conn.getVerticesById("vertex4", [1, 3, 5], fmt="arrow")
+        self.assertEqual(3, res.num_rows)
+        self.assertEqual(["v_id", "a01"], res.column_names)
+
+        # Columns not in the schema keep mixed values as they are
+        res = self.conn.vertexSetToNumpy([
+            {"v_id": "1", "v_type": "vertex4", "attributes": {"@acc": 1}},
+            {"v_id": "2", "v_type": "vertex4", "attributes": {"@acc": "a"}}])
+        self.assertEqual("object", str(res["@acc"].dtype))
+        self.assertEqual([1, "a"], list(res["@acc"]))
+
+    def test_16_failedBatches(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname=self.conn.graphname)
+        calls = []
+
+        def post(url, headers=None, data=None, params=None, **kwargs):
+            calls.append(data)
+            if len(calls) == 2:
+                raise TigerGraphException("Batch failed", None)
+            return [{"accepted_vertices": 2, "accepted_edges": 0}]
+
+        conn._post = post
+        vs = [(i, {"a01": i}) for i in range(6)]
+        res = conn.upsertVerticesInBatches("vertex4", vs, batchSize=2)
+        self.assertEqual(4, res["accepted_vertices"])
+        self.assertEqual(1, len(res["failed_batches"]))
+        self.assertEqual({"vertices": {"vertex4": {"2": {"a01": {"value": 2}},
+            "3": {"a01": {"value": 3}}}}}, res["failed_batches"][0]["data"])
+
+        calls.clear()
+        with self.assertRaises(TigerGraphException) as ctx:
+            conn.upsertVertices("vertex4", vs, batchSize=2)
+        self.assertIn("upsertVerticesInBatches()", str(ctx.exception))
+        self.assertEqual(3, len(calls))
+
+    def test_17_getVerticesByIdBatches(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        installed = []
+        requests = []
+
+        def post(url, data=None, **kwargs):
+            requests.append((url, json.loads(data)))
+            return [{"result": [{"v_id": v["id"] if isinstance(v, dict) else v,
+                "v_type": "vertex4", "attributes": {"a01": 1}}
+                for v in json.loads(data)["vertices"]]}]
+
+        conn._installHelperQuery = lambda name, text: installed.append((name, text)) or name
+        conn._post = post
+        res = conn.getVerticesById("vertex4", [3, 1, 2, 1], batchSize=2)
+        self.assertEqual(["3", "1", "2", "1"], [v["v_id"] for v in res])
+        self.assertEqual("pyTG_getVerticesById", installed[0][0])
+        self.assertTrue(requests[0][0].endswith("/query/tests/pyTG_getVerticesById"))
+        self.assertEqual({"vertices": [{"id": "3", "type": "vertex4"},
+            {"id": "1", "type": "vertex4"}]}, requests[0][1])
+        self.assertEqual({"vertices": [{"id": "2", "type": "vertex4"}]}, requests[1][1])
+
+        requests.clear()
+        conn.getVerticesById("vertex4", [1, 2], select="a01, a02", batchSize=5)
+        name, text = installed[1]
+        self.assertTrue(name.startswith("pyTG_getVerticesById_"))
+        self.assertIn("SET<VERTEX<vertex4>> vertices", text)
+        self.assertIn("PRINT result[result.a01 AS a01, result.a02 AS a02];", text)
+        self.assertEqual({"vertices": ["1", "2"]}, requests[0][1])
+
+    def test_18_delVerticesByIdRequests(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        requests = []
+
+        def post(url, data=None, **kwargs):
+            requests.append(("POST", json.loads(data)))
+            return [{"deleted_vertices": len(json.loads(data)["vertices"])}]
+
+        def delete(url, *args, **kwargs):
+            requests.append(("DELETE", url.split("/vertices/")[1]))
+            return {"deleted_vertices": 1}
+
+        conn._installHelperQuery = lambda name, text: name
+        conn._post = post
+        conn._delete = delete
+        self.assertEqual(5, conn.delVerticesById("vertex4", [1, 2, 3, 4, 5], batchSize=2))
+        self.assertEqual(["POST"] * 3, [r[0] for r in requests])
+        self.assertEqual({"vertices": [{"id": "1", "type": "vertex4"},
+            {"id": "2", "type": "vertex4"}]}, requests[0][1])
+
+        requests.clear()
+        self.assertEqual(1, conn.delVerticesById("vertex4", 1))
+        self.assertEqual(2, conn.delVerticesById("vertex4", [1, 2], permanent=True))
+        self.assertEqual(2, conn.delVerticesById("vertex4", [1, 2], batchSize=0))
+        self.assertEqual([("DELETE", "vertex4/1"), ("DELETE", "vertex4/1?permanent=true"),
+            ("DELETE", "vertex4/2?permanent=true"), ("DELETE", "vertex4/1"),
+            ("DELETE", "vertex4/2")], requests)
+
+    def test_19_vertexSetToDataFrameOffline(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+
+        def get(url, *args, **kwargs):
+            raise AssertionError("Unexpected request: " + url)
+
+        conn._get = get
+        vertexSet = [
+            {"v_id": "1", "v_type": "vertex4", "attributes": {"a01": 1, "a02": "2023-01-02 03:04:05"}},
+            {"v_id": "2", "v_type": "vertex4", "attributes": {"a01": 2, "a02": None}}
+        ]
+        # Without the schema, the data types are inferred
+        res = conn.vertexSetToDataFrame(vertexSet)
+        self.assertEqual("int64", str(res["a01"].dtype))
+        self.assertNotEqual("datetime64[s]", str(res["a02"].dtype))
+
+        res = conn.vertexSetToDataFrame(vertexSet, types={"a01": "DOUBLE", "a02": "DATETIME"})
+        self.assertEqual("float64", str(res["a01"].dtype))
+        self.assertEqual("datetime64[s]", str(res["a02"].dtype))
+        self.assertTrue(pandas.isnull(res["a02"][1]))
+
+        # The schema is used once it is fetched
+        conn.schema = {"VertexTypes": [{"Name": "vertex4", "Attributes": [
+            {"AttributeName": "a01", "AttributeType": {"Name": "UINT"}}]}], "EdgeTypes": []}
+        res = conn.vertexSetToNumpy(vertexSet)
+        self.assertEqual("uint64", str(res["a01"].dtype))
+
+    def test_20_iterVerticesOffline(self):
+        conn = TigerGraphConnection(host=self.conn.host, graphname="tests")
+        vertices = [{"v_id": str(i), "v_type": "vertex4", "attributes": {"a01": i, "a02": "x"}}
+            for i in range(10)]
+        queries = {}
+        requests = []
+
+        def runInstalledQuery(name, params=None, **kwargs):
+            requests.append((name, params))
+            return [{"result": [dict(v) for v in vertices
+                if int(v["v_id"]) % params["partitions"] == params["partition"]]}]
+
+        conn._installHelperQuery = lambda name, text: queries.setdefault(name, text) and name
+        conn.getVertexCount = lambda vertexType, where="": len(vertices)
+        conn.runInstalledQuery = runInstalledQuery
+        res = [v for c in conn.iterVertices("vertex4", select="a01", where="a01>=5",
+            chunkSize=4) for v in c]
+        self.assertEqual(["5", "6", "7", "8", "9"], sorted(v["v_id"] for v in res))
+        self.assertEqual([{"a01": 5}], [v["attributes"] for v in res if v["v_id"] == "5"])
+        self.assertEqual(3, len(requests))
+
+        # The same query is used for all selections and filters of the vertex type
+        self.assertEqual(10, sum(len(c) for c in conn.iterVertices("vertex4")))
+        self.assertEqual(["pyTG_iterVertices_vertex4"], list(queries))
+        self.assertIn("{vertex4.*}", queries["pyTG_iterVertices_vertex4"])
 
 
 if __name__ == '__main__':